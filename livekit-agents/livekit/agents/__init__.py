@@ -18,81 +18,172 @@ See [https://docs.livekit.io/agents/](https://docs.livekit.io/agents/) for quick
 documentation, and examples.
 """
 
+import importlib
 import typing
 
-from . import cli, ipc, llm, metrics, stt, tokenize, tts, utils, vad, voice  # noqa: F401
-from ._exceptions import (
-    APIConnectionError,
-    APIError,
-    APIStatusError,
-    APITimeoutError,
-    AssignmentTimeoutError,
-)
-from .job import (
-    AutoSubscribe,
-    JobContext,
-    JobExecutorType,
-    JobProcess,
-    JobRequest,
-    get_job_context,
-)
-from .llm.chat_context import (
-    ChatContent,
-    ChatContext,
-    ChatItem,
-    ChatMessage,
-    ChatRole,
-    FunctionCall,
-    FunctionCallOutput,
-)
-from .llm.tool_context import FunctionTool, StopResponse, ToolError, function_tool
-from .plugin import Plugin
-from .types import (
-    DEFAULT_API_CONNECT_OPTIONS,
-    NOT_GIVEN,
-    APIConnectOptions,
-    NotGiven,
-    NotGivenOr,
-)
-from .version import __version__
-from .voice import (
-    Agent,
-    AgentEvent,
-    AgentSession,
-    AgentStateChangedEvent,
-    CloseEvent,
-    ConversationItemAddedEvent,
-    ErrorEvent,
-    MetricsCollectedEvent,
-    ModelSettings,
-    RunContext,
-    SpeechCreatedEvent,
-    UserInputTranscribedEvent,
-    UserStateChangedEvent,
-    avatar,
-    io,
-)
-from .voice.background_audio import AudioConfig, BackgroundAudioPlayer, BuiltinAudioClip
-from .voice.room_io import RoomInputOptions, RoomIO, RoomOutputOptions
-from .worker import (
-    SimulateJobInfo,
-    Worker,
-    WorkerOptions,
-    WorkerPermissions,
-    WorkerType,
-)
-
 if typing.TYPE_CHECKING:
+    from . import cli, ipc, llm, metrics, stt, tokenize, tts, utils, vad, voice
+    from ._exceptions import (
+        APIConnectionError,
+        APIError,
+        APIStatusError,
+        APITimeoutError,
+        AssignmentTimeoutError,
+    )
+    from .job import (
+        AutoSubscribe,
+        JobContext,
+        JobExecutorType,
+        JobProcess,
+        JobRequest,
+        get_job_context,
+    )
     from .llm import mcp  # noqa: F401
+    from .llm.chat_context import (
+        ChatContent,
+        ChatContext,
+        ChatItem,
+        ChatMessage,
+        ChatRole,
+        FunctionCall,
+        FunctionCallOutput,
+    )
+    from .llm.tool_context import FunctionTool, StopResponse, ToolError, function_tool
+    from .plugin import Plugin
+    from .types import (
+        DEFAULT_API_CONNECT_OPTIONS,
+        NOT_GIVEN,
+        APIConnectOptions,
+        InputQueueOptions,
+        NotGiven,
+        NotGivenOr,
+    )
+    from .utils.http_context import HTTPSessionOptions
+    from .version import __version__
+    from .voice import (
+        Agent,
+        AgentEvent,
+        AgentSession,
+        AgentStateChangedEvent,
+        CloseEvent,
+        ConversationItemAddedEvent,
+        ErrorEvent,
+        MetricsCollectedEvent,
+        ModelSettings,
+        RunContext,
+        SpeechCreatedEvent,
+        UserInputTranscribedEvent,
+        UserStateChangedEvent,
+        avatar,
+        io,
+    )
+    from .voice.background_audio import AudioConfig, BackgroundAudioPlayer, BuiltinAudioClip
+    from .voice.room_io import RoomInputOptions, RoomIO, RoomOutputOptions
+    from .worker import (
+        SimulateJobInfo,
+        Worker,
+        WorkerOptions,
+        WorkerPermissions,
+        WorkerType,
+    )
+
+# submodules and attributes are imported on first access (PEP 562), importing livekit.agents
+# alone must stay cheap: it is done by every job process and by tooling only needing types
+_LAZY_SUBMODULES = {
+    "cli",
+    "ipc",
+    "llm",
+    "metrics",
+    "stt",
+    "tokenize",
+    "tts",
+    "utils",
+    "vad",
+    "voice",
+}
+
+_LAZY_ATTRS = {
+    "APIConnectionError": "._exceptions",
+    "APIError": "._exceptions",
+    "APIStatusError": "._exceptions",
+    "APITimeoutError": "._exceptions",
+    "AssignmentTimeoutError": "._exceptions",
+    "AutoSubscribe": ".job",
+    "JobContext": ".job",
+    "JobExecutorType": ".job",
+    "JobProcess": ".job",
+    "JobRequest": ".job",
+    "get_job_context": ".job",
+    "mcp": ".llm",
+    "ChatContent": ".llm.chat_context",
+    "ChatContext": ".llm.chat_context",
+    "ChatItem": ".llm.chat_context",
+    "ChatMessage": ".llm.chat_context",
+    "ChatRole": ".llm.chat_context",
+    "FunctionCall": ".llm.chat_context",
+    "FunctionCallOutput": ".llm.chat_context",
+    "FunctionTool": ".llm.tool_context",
+    "StopResponse": ".llm.tool_context",
+    "ToolError": ".llm.tool_context",
+    "function_tool": ".llm.tool_context",
+    "Plugin": ".plugin",
+    "DEFAULT_API_CONNECT_OPTIONS": ".types",
+    "NOT_GIVEN": ".types",
+    "APIConnectOptions": ".types",
+    "InputQueueOptions": ".types",
+    "NotGiven": ".types",
+    "NotGivenOr": ".types",
+    "HTTPSessionOptions": ".utils.http_context",
+    "__version__": ".version",
+    "Agent": ".voice",
+    "AgentEvent": ".voice",
+    "AgentSession": ".voice",
+    "AgentStateChangedEvent": ".voice",
+    "CloseEvent": ".voice",
+    "ConversationItemAddedEvent": ".voice",
+    "ErrorEvent": ".voice",
+    "MetricsCollectedEvent": ".voice",
+    "ModelSettings": ".voice",
+    "RunContext": ".voice",
+    "SpeechCreatedEvent": ".voice",
+    "UserInputTranscribedEvent": ".voice",
+    "UserStateChangedEvent": ".voice",
+    "avatar": ".voice",
+    "io": ".voice",
+    "AudioConfig": ".voice.background_audio",
+    "BackgroundAudioPlayer": ".voice.background_audio",
+    "BuiltinAudioClip": ".voice.background_audio",
+    "RoomInputOptions": ".voice.room_io",
+    "RoomIO": ".voice.room_io",
+    "RoomOutputOptions": ".voice.room_io",
+    "SimulateJobInfo": ".worker",
+    "Worker": ".worker",
+    "WorkerOptions": ".worker",
+    "WorkerPermissions": ".worker",
+    "WorkerType": ".worker",
+}
 
 
 def __getattr__(name: str) -> typing.Any:
-    if name == "mcp":
-        from .llm import mcp
+    value: typing.Any
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        try:
+            value = getattr(module, name)
+        except AttributeError:
+            # same as `from module import name` when name is a submodule (e.g. avatar, mcp)
+            value = importlib.import_module(f"{module.__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
 
-        return mcp
 
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_ATTRS))
 
 
 __all__ = [
@@ -101,6 +192,7 @@ __all__ = [
     "WorkerOptions",
     "WorkerType",
     "WorkerPermissions",
+    "HTTPSessionOptions",
     "JobProcess",
     "JobContext",
     "JobRequest",
@@ -141,6 +233,7 @@ __all__ = [
     "APIStatusError",
     "APITimeoutError",
     "APIConnectOptions",
+    "InputQueueOptions",
     "NotGiven",
     "NOT_GIVEN",
     "NotGivenOr",
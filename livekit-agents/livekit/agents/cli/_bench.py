@@ -0,0 +1,498 @@
+"""Load test of the voice pipeline, without a LiveKit server or any provider.
+
+Each simulated session runs a full AgentSession (audio recognition, turn detection, LLM,
+TTS, transcript synchronization and audio forwarding) fed with recorded audio. The STT, LLM
+and TTS are replaced by fakes with configurable latencies, so the results only reflect the
+cost of the framework and of the host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import dataclasses
+import json
+import multiprocessing as mp
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import numpy as np
+import psutil
+
+from livekit import rtc
+
+from .. import llm, stt, tts, utils
+from ..log import logger
+from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
+from ..voice import Agent, AgentSession, io
+
+_INPUT_SAMPLE_RATE = 48000
+_INPUT_FRAME_SIZE = _INPUT_SAMPLE_RATE // 100  # 10ms, like the frames received from a room
+_OUTPUT_SAMPLE_RATE = 24000
+_SPEECH_RMS_THRESHOLD = 500.0
+_LOOP_LAG_INTERVAL = 0.05
+_EVENTS_PER_SESSION_MINUTE = 600  # realtime APIs stream the audio in ~100ms events
+
+_BENCH_RESPONSE = (
+    "Sure, I can help with that. Let me take a quick look at your account. "
+    "Everything seems to be in order, is there anything else you need?"
+)
+
+
+@dataclass
+class BenchOptions:
+    sessions: int = 10
+    """total number of simulated sessions"""
+    processes: int = 1
+    """number of processes the sessions are spread across"""
+    duration: float = 60.0
+    """duration of the benchmark in seconds"""
+    audio_file: str | None = None
+    """recorded user utterance, a synthetic utterance is used when None"""
+    turn_interval: float = 8.0
+    """time between the start of two consecutive user utterances"""
+    stt_latency: float = 0.2
+    llm_ttft: float = 0.3
+    llm_tokens_per_second: float = 80.0
+    tts_ttfb: float = 0.2
+    tts_chars_per_second: float = 15.0
+
+
+@dataclass
+class _ProcessResult:
+    sessions: int
+    latencies: list[float] = field(default_factory=list)
+    loop_lags: list[float] = field(default_factory=list)
+    cpu_time: float = 0.0
+    wall_time: float = 0.0
+    rss_base: int = 0
+    rss_peak: int = 0
+
+
+class _BenchSTT(stt.STT):
+    def __init__(self, *, latency: float) -> None:
+        super().__init__(capabilities=stt.STTCapabilities(streaming=True, interim_results=False))
+        self._latency = latency
+
+    async def _recognize_impl(
+        self,
+        buffer: utils.AudioBuffer,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions,
+    ) -> stt.SpeechEvent:
+        await asyncio.sleep(self._latency)
+        return _final_transcript()
+
+    def stream(
+        self,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> stt.RecognizeStream:
+        return _BenchRecognizeStream(stt=self, conn_options=conn_options)
+
+
+class _BenchRecognizeStream(stt.RecognizeStream):
+    """Energy based endpointing, the transcript is emitted `latency` after the speech ends"""
+
+    async def _run(self) -> None:
+        assert isinstance(self._stt, _BenchSTT)
+        speaking = False
+        silence = 0.0
+        async for frame in self._input_ch:
+            if isinstance(frame, self._FlushSentinel):
+                continue
+
+            data = np.frombuffer(frame.data, dtype=np.int16).astype(np.float32)
+            voiced = bool(np.sqrt(np.mean(data**2)) > _SPEECH_RMS_THRESHOLD) if len(data) else False
+            if voiced:
+                silence = 0.0
+                if not speaking:
+                    speaking = True
+                    self._event_ch.send_nowait(stt.SpeechEvent(stt.SpeechEventType.START_OF_SPEECH))
+                continue
+
+            silence += frame.duration
+            if speaking and silence >= 0.1:
+                speaking = False
+                await asyncio.sleep(self._stt._latency)
+                self._event_ch.send_nowait(_final_transcript())
+                self._event_ch.send_nowait(stt.SpeechEvent(stt.SpeechEventType.END_OF_SPEECH))
+
+
+def _final_transcript() -> stt.SpeechEvent:
+    return stt.SpeechEvent(
+        type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+        alternatives=[stt.SpeechData(language="en", text="Can you check my account please?")],
+    )
+
+
+class _BenchLLM(llm.LLM):
+    def __init__(self, *, ttft: float, tokens_per_second: float) -> None:
+        super().__init__()
+        self._ttft = ttft
+        self._tokens_per_second = tokens_per_second
+
+    def chat(
+        self,
+        *,
+        chat_ctx: llm.ChatContext,
+        tools: list[llm.FunctionTool | llm.RawFunctionTool] | None = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        parallel_tool_calls: NotGivenOr[bool] = NOT_GIVEN,
+        tool_choice: NotGivenOr[llm.ToolChoice] = NOT_GIVEN,
+        extra_kwargs: NotGivenOr[dict[str, Any]] = NOT_GIVEN,
+    ) -> llm.LLMStream:
+        return _BenchLLMStream(
+            self, chat_ctx=chat_ctx, tools=tools or [], conn_options=conn_options
+        )
+
+
+class _BenchLLMStream(llm.LLMStream):
+    async def _run(self) -> None:
+        assert isinstance(self._llm, _BenchLLM)
+        request_id = utils.shortuuid("bench_llm_")
+        await asyncio.sleep(self._llm._ttft)
+        for i, word in enumerate(_BENCH_RESPONSE.split(" ")):
+            if i > 0:
+                await asyncio.sleep(1.0 / self._llm._tokens_per_second)
+
+            self._event_ch.send_nowait(
+                llm.ChatChunk(
+                    id=request_id,
+                    delta=llm.ChoiceDelta(role="assistant", content=word + " "),
+                )
+            )
+
+
+class _BenchTTS(tts.TTS):
+    def __init__(self, *, ttfb: float, chars_per_second: float) -> None:
+        super().__init__(
+            capabilities=tts.TTSCapabilities(streaming=False),
+            sample_rate=_OUTPUT_SAMPLE_RATE,
+            num_channels=1,
+        )
+        self._ttfb = ttfb
+        self._chars_per_second = chars_per_second
+
+    def synthesize(
+        self, text: str, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> tts.ChunkedStream:
+        return _BenchChunkedStream(tts=self, input_text=text, conn_options=conn_options)
+
+
+class _BenchChunkedStream(tts.ChunkedStream):
+    async def _run(self, output_emitter: tts.AudioEmitter) -> None:
+        assert isinstance(self._tts, _BenchTTS)
+        output_emitter.initialize(
+            request_id=utils.shortuuid("bench_tts_"),
+            sample_rate=_OUTPUT_SAMPLE_RATE,
+            num_channels=1,
+            mime_type="audio/pcm",
+        )
+        await asyncio.sleep(self._tts._ttfb)
+
+        duration = len(self._input_text) / self._tts._chars_per_second
+        samples = int(duration * _OUTPUT_SAMPLE_RATE)
+        t = np.arange(samples, dtype=np.float32) / _OUTPUT_SAMPLE_RATE
+        output_emitter.push((np.sin(2 * np.pi * 220 * t) * 3000).astype(np.int16).tobytes())
+        output_emitter.flush()
+
+
+class _BenchAudioInput(io.AudioInput):
+    """Plays the utterance in real time every `turn_interval`, silence in between"""
+
+    def __init__(self, utterance: np.ndarray, *, turn_interval: float, stats: _SessionStats):
+        self._utterance = utterance
+        self._turn_samples = max(int(turn_interval * _INPUT_SAMPLE_RATE), len(utterance))
+        self._silence = np.zeros(_INPUT_FRAME_SIZE, dtype=np.int16)
+        self._stats = stats
+        self._pos = 0
+        self._next_time: float | None = None
+
+    async def __anext__(self) -> rtc.AudioFrame:
+        now = time.perf_counter()
+        if self._next_time is None:
+            self._next_time = now
+
+        self._next_time += _INPUT_FRAME_SIZE / _INPUT_SAMPLE_RATE
+        if self._next_time > now:
+            await asyncio.sleep(self._next_time - now)
+
+        offset = self._pos % self._turn_samples
+        data = self._utterance[offset : offset + _INPUT_FRAME_SIZE]
+        if len(data) < _INPUT_FRAME_SIZE:
+            data = self._silence
+
+        self._pos += _INPUT_FRAME_SIZE
+        if offset < len(self._utterance) <= offset + _INPUT_FRAME_SIZE:
+            self._stats.on_user_speech_end(self._next_time)
+
+        return rtc.AudioFrame(
+            data=data.tobytes(),
+            sample_rate=_INPUT_SAMPLE_RATE,
+            num_channels=1,
+            samples_per_channel=_INPUT_FRAME_SIZE,
+        )
+
+
+class _BenchAudioOutput(io.AudioOutput):
+    """Simulates the real-time playout of the agent audio"""
+
+    def __init__(self, stats: _SessionStats) -> None:
+        super().__init__(next_in_chain=None, sample_rate=_OUTPUT_SAMPLE_RATE)
+        self._stats = stats
+        self._pushed_duration = 0.0
+        self._capture_start = 0.0
+        self._playout_handle: asyncio.TimerHandle | None = None
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await super().capture_frame(frame)
+        if not self._pushed_duration:
+            self._capture_start = time.perf_counter()
+            self._stats.on_agent_audio(self._capture_start)
+            self.on_playback_started(created_at=time.time())
+
+        self._pushed_duration += frame.duration
+
+    def flush(self) -> None:
+        super().flush()
+        if not self._pushed_duration:
+            return
+
+        delay = max(0.0, self._pushed_duration - (time.perf_counter() - self._capture_start))
+        self._playout_handle = asyncio.get_running_loop().call_later(
+            delay, self._finish_playout, False
+        )
+
+    def clear_buffer(self) -> None:
+        if self._playout_handle:
+            self._playout_handle.cancel()
+
+        if self._pushed_duration:
+            self._finish_playout(True)
+
+    def _finish_playout(self, interrupted: bool) -> None:
+        played = min(time.perf_counter() - self._capture_start, self._pushed_duration)
+        self._pushed_duration = 0.0
+        self._playout_handle = None
+        self.on_playback_finished(playback_position=played, interrupted=interrupted)
+
+
+class _SessionStats:
+    def __init__(self, latencies: list[float]) -> None:
+        self._latencies = latencies
+        self._user_speech_end: float | None = None
+
+    def on_user_speech_end(self, t: float) -> None:
+        self._user_speech_end = t
+
+    def on_agent_audio(self, t: float) -> None:
+        if self._user_speech_end is not None:
+            self._latencies.append(t - self._user_speech_end)
+            self._user_speech_end = None
+
+
+def _load_utterance(audio_file: str | None) -> np.ndarray:
+    if audio_file is None:
+        # 2s of amplitude modulated noise, loud enough to be detected as speech
+        samples = 2 * _INPUT_SAMPLE_RATE
+        rng = np.random.default_rng(0)
+        envelope = 0.6 + 0.4 * np.sin(np.arange(samples) / _INPUT_SAMPLE_RATE * 2 * np.pi * 3)
+        return (rng.standard_normal(samples) * 4000 * envelope).astype(np.int16)
+
+    async def _decode() -> np.ndarray:
+        frames = [
+            np.frombuffer(frame.data, dtype=np.int16)
+            async for frame in utils.audio.audio_frames_from_file(
+                audio_file, sample_rate=_INPUT_SAMPLE_RATE, num_channels=1
+            )
+        ]
+        return np.concatenate(frames) if frames else np.empty(0, dtype=np.int16)
+
+    return asyncio.run(_decode())
+
+
+async def _monitor_loop_lag(lags: list[float]) -> None:
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(_LOOP_LAG_INTERVAL)
+        lags.append(time.perf_counter() - start - _LOOP_LAG_INTERVAL)
+
+
+async def _run_session(opts: BenchOptions, utterance: np.ndarray, stats: _SessionStats) -> None:
+    session: AgentSession = AgentSession(
+        turn_detection="stt",
+        stt=_BenchSTT(latency=opts.stt_latency),
+        llm=_BenchLLM(ttft=opts.llm_ttft, tokens_per_second=opts.llm_tokens_per_second),
+        tts=_BenchTTS(ttfb=opts.tts_ttfb, chars_per_second=opts.tts_chars_per_second),
+    )
+    session.input.audio = _BenchAudioInput(utterance, turn_interval=opts.turn_interval, stats=stats)
+    session.output.audio = _BenchAudioOutput(stats)
+    await session.start(Agent(instructions="You are a helpful assistant."))
+    try:
+        await asyncio.sleep(opts.duration)
+    finally:
+        await session.aclose()
+
+
+async def _run_sessions(opts: BenchOptions, num_sessions: int) -> _ProcessResult:
+    proc = psutil.Process()
+    res = _ProcessResult(sessions=num_sessions, rss_base=proc.memory_info().rss)
+    utterance = await asyncio.to_thread(_load_utterance, opts.audio_file)
+
+    lag_task = asyncio.create_task(_monitor_loop_lag(res.loop_lags))
+    cpu_start, wall_start = proc.cpu_times(), time.perf_counter()
+
+    async def _sample_rss() -> None:
+        while True:
+            res.rss_peak = max(res.rss_peak, proc.memory_info().rss)
+            await asyncio.sleep(1.0)
+
+    rss_task = asyncio.create_task(_sample_rss())
+    try:
+        # stagger the session starts so the turns aren't all aligned
+        async def _start_staggered(i: int) -> None:
+            await asyncio.sleep(opts.turn_interval * i / max(num_sessions, 1))
+            await _run_session(opts, utterance, _SessionStats(res.latencies))
+
+        await asyncio.gather(*(_start_staggered(i) for i in range(num_sessions)))
+    finally:
+        await utils.aio.cancel_and_wait(lag_task, rss_task)
+
+    cpu_end = proc.cpu_times()
+    res.cpu_time = (cpu_end.user + cpu_end.system) - (cpu_start.user + cpu_start.system)
+    res.wall_time = time.perf_counter() - wall_start
+    return res
+
+
+def _process_main(opts: BenchOptions, num_sessions: int) -> _ProcessResult:
+    return asyncio.run(_run_sessions(opts, num_sessions))
+
+
+def _percentiles(values: list[float]) -> str:
+    if not values:
+        return "n/a"
+
+    p50, p90, p99 = np.percentile(np.asarray(values) * 1000, [50, 90, 99])
+    return f"p50={p50:.1f}ms p90={p90:.1f}ms p99={p99:.1f}ms max={max(values) * 1000:.1f}ms"
+
+
+def run_bench(opts: BenchOptions) -> list[_ProcessResult]:
+    processes = max(1, min(opts.processes, opts.sessions))
+    split = [
+        opts.sessions // processes + (1 if i < opts.sessions % processes else 0)
+        for i in range(processes)
+    ]
+    logger.info(
+        "starting benchmark",
+        extra={**dataclasses.asdict(opts), "sessions_per_process": split},
+    )
+
+    if processes == 1:
+        results = [_process_main(opts, split[0])]
+    else:
+        ctx = mp.get_context("forkserver" if os.name == "posix" else "spawn")
+        with ctx.Pool(processes) as pool:
+            results = pool.starmap(_process_main, [(opts, n) for n in split])
+
+    latencies = [lat for res in results for lat in res.latencies]
+    loop_lags = [lag for res in results for lag in res.loop_lags]
+    total_cpu = sum(res.cpu_time for res in results)
+    wall_time = max(res.wall_time for res in results)
+    rss_per_session = [
+        (res.rss_peak - res.rss_base) / res.sessions for res in results if res.sessions
+    ]
+
+    print(f"sessions: {opts.sessions} across {processes} process(es), {wall_time:.1f}s")
+    print(f"turns measured: {len(latencies)}")
+    print(f"end of user speech -> first agent audio: {_percentiles(latencies)}")
+    print(f"event loop lag: {_percentiles(loop_lags)}")
+    print(
+        f"cpu: {total_cpu / wall_time * 100:.1f}% total, "
+        f"{total_cpu / wall_time * 100 / max(opts.sessions, 1):.2f}% per session"
+    )
+    if rss_per_session:
+        print(f"rss: {np.mean(rss_per_session) / 1e6:.2f}MB per session")
+
+    return results
+
+
+def _cpu_per_call(fnc: Callable[[], Any], duration: float) -> float:
+    calls = 0
+    started_cpu = time.process_time()
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fnc()
+        calls += 100
+
+    return (time.process_time() - started_cpu) / calls
+
+
+def run_serialization_bench(duration: float = 2.0) -> dict[str, tuple[float, float]]:
+    """Measure the cost of the audio events exchanged with a realtime API.
+
+    Each case encodes an ``input_audio_buffer.append`` event and decodes a
+    ``response.audio.delta`` event, both carrying 100ms of 24kHz audio. Returns
+    case -> (encode, decode) CPU seconds per event.
+    """
+    from ..utils import serialization
+
+    audio = np.random.randint(-3000, 3000, _OUTPUT_SAMPLE_RATE // 10, dtype=np.int16).tobytes()
+    delta_event = json.dumps(
+        {
+            "type": "response.audio.delta",
+            "event_id": "event_" + utils.shortuuid(),
+            "response_id": "resp_" + utils.shortuuid(),
+            "item_id": "item_" + utils.shortuuid(),
+            "output_index": 0,
+            "content_index": 0,
+            "delta": base64.b64encode(audio).decode(),
+        }
+    )
+    template = serialization.Base64JSONTemplate({"type": "input_audio_buffer.append", "audio": ...})
+
+    def _stdlib_encode() -> str:
+        return json.dumps(
+            {"type": "input_audio_buffer.append", "audio": base64.b64encode(audio).decode()}
+        )
+
+    def _stdlib_decode() -> bytes:
+        return base64.b64decode(json.loads(delta_event)["delta"])
+
+    def _encode() -> str:
+        return serialization.json_dumps(
+            {"type": "input_audio_buffer.append", "audio": serialization.b64encode(audio)}
+        )
+
+    def _decode() -> bytes:
+        return serialization.b64decode(serialization.json_loads(delta_event)["delta"])
+
+    default_backend = serialization.json_backend()
+    results: dict[str, tuple[float, float]] = {
+        "stdlib": (_cpu_per_call(_stdlib_encode, duration), _cpu_per_call(_stdlib_decode, duration))
+    }
+    try:
+        for backend in serialization.available_json_backends():
+            serialization.set_json_backend(backend)
+            results[backend] = (_cpu_per_call(_encode, duration), _cpu_per_call(_decode, duration))
+            results[f"{backend}+template"] = (
+                _cpu_per_call(lambda: template.render(audio), duration),
+                results[backend][1],
+            )
+    finally:
+        serialization.set_json_backend(default_backend)
+
+    print(f"realtime audio events (100ms of {_OUTPUT_SAMPLE_RATE}Hz audio each):")
+    for case, (encode, decode) in results.items():
+        cpu_per_minute = (encode + decode) * _EVENTS_PER_SESSION_MINUTE
+        print(
+            f"  {case}: encode {1 / encode:,.0f} events/s, decode {1 / decode:,.0f} events/s, "
+            f"{cpu_per_minute * 1000:.2f}ms cpu per session-minute"
+        )
+
+    return results
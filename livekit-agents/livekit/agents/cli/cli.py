@@ -230,6 +230,60 @@ def run_app(
         CLI_ARGUMENTS = args
         _run.run_dev(args)
 
+    @cli.command(help="Benchmark the voice pipeline with simulated sessions and fake models")
+    @click.option(
+        "--log-level",
+        default="WARNING",
+        type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False),
+        help="Set the logging level",
+    )
+    @click.option("--sessions", type=int, default=10, help="Number of simulated sessions")
+    @click.option("--processes", type=int, default=1, help="Number of processes to spread them")
+    @click.option("--duration", type=float, default=60.0, help="Duration in seconds")
+    @click.option(
+        "--audio-file",
+        type=click.Path(exists=True, dir_okay=False),
+        default=None,
+        help="Recorded user utterance played in a loop (synthetic audio by default)",
+    )
+    @click.option("--turn-interval", type=float, default=8.0, help="Seconds between user turns")
+    @click.option("--stt-latency", type=float, default=0.2, help="Simulated STT latency")
+    @click.option("--llm-ttft", type=float, default=0.3, help="Simulated LLM time to first token")
+    @click.option("--tts-ttfb", type=float, default=0.2, help="Simulated TTS time to first byte")
+    def bench(
+        log_level: str,
+        sessions: int,
+        processes: int,
+        duration: float,
+        audio_file: str | None,
+        turn_interval: float,
+        stt_latency: float,
+        llm_ttft: float,
+        tts_ttfb: float,
+    ) -> None:
+        from ._bench import BenchOptions, run_bench
+
+        setup_logging(log_level, False, False)
+        run_bench(
+            BenchOptions(
+                sessions=sessions,
+                processes=processes,
+                duration=duration,
+                audio_file=audio_file,
+                turn_interval=turn_interval,
+                stt_latency=stt_latency,
+                llm_ttft=llm_ttft,
+                tts_ttfb=tts_ttfb,
+            )
+        )
+
+    @cli.command(help="Benchmark the JSON and base64 handling of the realtime audio events")
+    @click.option("--duration", type=float, default=2.0, help="Duration of each case in seconds")
+    def bench_serialization(duration: float) -> None:
+        from ._bench import run_serialization_bench
+
+        run_serialization_bench(duration)
+
     @cli.command(help="Download plugin dependency files")
     @click.option(
         "--log-level",
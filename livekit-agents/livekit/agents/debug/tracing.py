@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import os
 import time
+from collections import deque
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -21,6 +25,7 @@ class TracingGraph:
         y_range: tuple[float, float] | None,
         x_type: Literal["time", "value"],
         max_data_points: int,
+        retention: float | None = None,
     ) -> None:
         self._title = title
         self._y_label = y_label
@@ -28,25 +33,70 @@ class TracingGraph:
         self._y_range = y_range
         self._max_data_points = max_data_points
         self._x_type = x_type
-        self._data: list[tuple[float | int, float]] = []
+        self._retention = retention
+        self._data: deque[tuple[float | int, float]] = deque(maxlen=max_data_points)
 
     def plot(self, x: float | int, y: float) -> None:
         self._data.append((x, y))
-        if len(self._data) > self._max_data_points:
-            self._data.pop(0)
+
+        if self._retention is not None and self._x_type == "time":
+            while self._data and self._data[0][0] < x - self._retention:
+                self._data.popleft()
+
+    def _export(self, max_points: int = 0) -> dict[str, Any]:
+        return {
+            "title": self._title,
+            "x_label": self._x_label,
+            "y_label": self._y_label,
+            "y_range": self._y_range,
+            "x_type": self._x_type,
+            "data": _downsample(self._data, max_points),
+        }
+
+
+def _downsample(
+    data: deque[tuple[float | int, float]], max_points: int
+) -> list[tuple[float | int, float]]:
+    """keep the max of each bucket so spikes stay visible once downsampled"""
+    if max_points <= 0 or len(data) <= max_points:
+        return list(data)
+
+    points = list(data)
+    step = len(points) / max_points
+    out = []
+    for i in range(max_points):
+        bucket = points[int(i * step) : int((i + 1) * step)]
+        if bucket:
+            out.append((bucket[0][0], max(p[1] for p in bucket)))
+
+    return out
 
 
 class TracingHandle:
-    def __init__(self) -> None:
+    def __init__(self, *, max_events: int = 1000, event_retention: float | None = 3600.0) -> None:
+        """Key/values, events and graphs of a tracing scope.
+
+        Events are kept in a ring buffer of ``max_events`` entries and are evicted once they
+        are older than ``event_retention`` seconds, so long-lived workers keep a bounded
+        amount of history.
+        """
         self._kv: dict[str, str | dict[str, Any]] = {}
-        self._events: list[dict[str, Any]] = []
+        self._events: deque[tuple[int, dict[str, Any]]] = deque(maxlen=max_events)
+        self._event_retention = event_retention
+        self._event_seq = 0
         self._graphs: list[TracingGraph] = []
 
     def store_kv(self, key: str, value: str | dict[str, Any]) -> None:
         self._kv[key] = value
 
     def log_event(self, name: str, data: dict[str, Any] | None) -> None:
-        self._events.append({"name": name, "data": data, "timestamp": time.time()})
+        now = time.time()
+        self._event_seq += 1
+        self._events.append((self._event_seq, {"name": name, "data": data, "timestamp": now}))
+
+        if self._event_retention is not None:
+            while self._events and self._events[0][1]["timestamp"] < now - self._event_retention:
+                self._events.popleft()
 
     def add_graph(
         self,
@@ -57,42 +107,51 @@ class TracingHandle:
         y_range: tuple[float, float] | None = None,
         x_type: Literal["time", "value"] = "value",
         max_data_points: int = 512,
+        retention: float | None = None,
     ) -> TracingGraph:
-        graph = TracingGraph(title, y_label, x_label, y_range, x_type, max_data_points)
+        graph = TracingGraph(title, y_label, x_label, y_range, x_type, max_data_points, retention)
         self._graphs.append(graph)
         return graph
 
-    def _export(self) -> dict[str, Any]:
+    def _export(self, *, cursor: int = 0, max_points: int = 0) -> dict[str, Any]:
+        """Export the tracing data.
+
+        Args:
+            cursor: Only export the events logged after this cursor (returned by a previous
+                export), 0 exports all the retained events.
+            max_points: Downsample the graphs to at most this many points, 0 disables it.
+        """
         return {
             "kv": self._kv,
-            "events": self._events,
-            "graph": [
-                {
-                    "title": chart._title,
-                    "x_label": chart._x_label,
-                    "y_label": chart._y_label,
-                    "y_range": chart._y_range,
-                    "x_type": chart._x_type,
-                    "data": chart._data,
-                }
-                for chart in self._graphs
-            ],
+            "events": [event for seq, event in self._events if seq > cursor],
+            "cursor": self._event_seq,
+            "graph": [chart._export(max_points) for chart in self._graphs],
         }
 
 
 class Tracing:
     _instance = None
+    _max_events = 1000
+    _event_retention: float | None = 3600.0
 
     def __init__(self) -> None:
         self._handles: dict[str, TracingHandle] = {}
 
+    @classmethod
+    def configure(cls, *, max_events: int = 1000, event_retention: float | None = 3600.0) -> None:
+        """Set the retention of the events of the handles created afterwards"""
+        cls._max_events = max_events
+        cls._event_retention = event_retention
+
     @classmethod
     def with_handle(cls, handle: str) -> TracingHandle:
         if cls._instance is None:
             cls._instance = cls()
 
         if handle not in cls._instance._handles:
-            cls._instance._handles[handle] = TracingHandle()
+            cls._instance._handles[handle] = TracingHandle(
+                max_events=cls._max_events, event_retention=cls._event_retention
+            )
 
         return cls._instance._handles[handle]
 
@@ -127,6 +186,7 @@ class Tracing:
         y_range: tuple[float, float] | None = None,
         x_type: Literal["time", "value"] = "value",
         max_data_points: int = 512,
+        retention: float | None = None,
     ) -> TracingGraph:
         return Tracing._get_current_handle().add_graph(
             title=title,
@@ -135,9 +195,83 @@ class Tracing:
             y_range=y_range,
             x_type=x_type,
             max_data_points=max_data_points,
+            retention=retention,
         )
 
 
+def _iter_json(value: Any, chunk_size: int = 256) -> Iterator[str]:
+    """encode to JSON incrementally, large lists are encoded ``chunk_size`` items at a time"""
+    if isinstance(value, dict):
+        yield "{"
+        for i, (key, item) in enumerate(value.items()):
+            yield ("," if i else "") + json.dumps(str(key)) + ":"
+            yield from _iter_json(item, chunk_size)
+        yield "}"
+    elif isinstance(value, (list, tuple)) and len(value) > chunk_size:
+        yield "["
+        for i in range(0, len(value), chunk_size):
+            yield ("," if i else "") + json.dumps(value[i : i + chunk_size])[1:-1]
+        yield "]"
+    else:
+        yield json.dumps(value)
+
+
+async def _json_stream_response(
+    request: web.Request, data: dict[str, Any], *, write_size: int = 64 * 1024
+) -> web.StreamResponse:
+    resp = web.StreamResponse(headers={"Content-Type": "application/json"})
+    await resp.prepare(request)
+
+    buf: list[str] = []
+    size = 0
+    for chunk in _iter_json(data):
+        buf.append(chunk)
+        size += len(chunk)
+        if size >= write_size:
+            await resp.write("".join(buf).encode())
+            buf.clear()
+            size = 0
+
+    await resp.write("".join(buf).encode())
+    await resp.write_eof()
+    return resp
+
+
+def _export_params(request: web.Request) -> dict[str, int]:
+    try:
+        return {
+            "cursor": max(int(request.query.get("cursor", 0)), 0),
+            "max_points": max(int(request.query.get("max_points", 0)), 0),
+        }
+    except ValueError:
+        raise web.HTTPBadRequest() from None
+
+
+def _memory_info(procs: list[tuple[str, int]]) -> list[dict[str, Any]]:
+    """unique (USS), proportional (PSS) and shared memory of each process, in MB"""
+    import psutil
+
+    info = []
+    for name, pid in procs:
+        try:
+            mem = psutil.Process(pid).memory_full_info()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+        info.append(
+            {
+                "id": name,
+                "pid": pid,
+                "rss_mb": mem.rss / (1024 * 1024),
+                "uss_mb": mem.uss / (1024 * 1024),
+                "pss_mb": getattr(mem, "pss", 0) / (1024 * 1024),
+                "shared_mb": getattr(mem, "shared", 0) / (1024 * 1024),
+            }
+        )
+
+    return info
+
+
 def _create_tracing_app(w: Worker) -> web.Application:
     async def tracing_index(request: web.Request) -> web.Response:
         import importlib.resources
@@ -166,7 +300,7 @@ def _create_tracing_app(w: Worker) -> web.Application:
 
         return web.json_response(data)
 
-    async def runner(request: web.Request) -> web.Response:
+    async def runner(request: web.Request) -> web.StreamResponse:
         runner_id = request.query.get("id")
         if not runner_id:
             return web.Response(status=400)
@@ -176,21 +310,48 @@ def _create_tracing_app(w: Worker) -> web.Application:
         if not runner:
             return web.Response(status=404)
 
-        info = await asyncio.wait_for(runner.tracing_info(), timeout=5.0)  # proc could be stuck
-        return web.json_response({"tracing": info})
+        info = await asyncio.wait_for(  # proc could be stuck
+            runner.tracing_info(**_export_params(request)), timeout=5.0
+        )
+        return await _json_stream_response(request, {"tracing": info})
 
-    async def worker(request: web.Request) -> web.Response:
-        return web.json_response(
+    async def worker(request: web.Request) -> web.StreamResponse:
+        return await _json_stream_response(
+            request,
             {
                 "id": w.id,
-                "tracing": Tracing.with_handle("global")._export(),
-            }
+                "tracing": Tracing.with_handle("global")._export(**_export_params(request)),
+            },
         )
 
+    async def memory(request: web.Request) -> web.Response:
+        procs: list[tuple[str, int]] = [("worker", os.getpid())]
+        for runner in w._proc_pool.processes:
+            pid = getattr(runner, "pid", None)  # threaded executors share the worker process
+            if pid is not None:
+                procs.append((runner.id, pid))
+
+        if w._inference_executor is not None and w._inference_executor.pid is not None:
+            procs.append(("inference", w._inference_executor.pid))
+
+        loop = asyncio.get_running_loop()
+        # reading /proc/<pid>/smaps can be slow for large processes
+        info = await loop.run_in_executor(None, _memory_info, procs)
+        return web.json_response({"processes": info})
+
+    async def inference(request: web.Request) -> web.Response:
+        if w._inference_executor is None or not w._inference_executor.started:
+            return web.Response(status=404)
+
+        info = await asyncio.wait_for(w._inference_executor.tracing_info(), timeout=5.0)
+        return web.json_response({"tracing": info})
+
     app = web.Application()
     app.add_routes([web.get("", tracing_index)])
     app.add_routes([web.get("/", tracing_index)])
     app.add_routes([web.get("/runners/", runners)])
     app.add_routes([web.get("/runner/", runner)])
     app.add_routes([web.get("/worker/", worker)])
+    app.add_routes([web.get("/inference/", inference)])
+    app.add_routes([web.get("/memory/", memory)])
     return app
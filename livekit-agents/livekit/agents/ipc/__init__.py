@@ -4,6 +4,7 @@ from . import (
     job_executor,
     job_proc_executor,
     job_thread_executor,
+    prewarm,
     proc_pool,
     proto,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "job_executor",
     "job_proc_executor",
     "job_thread_executor",
+    "prewarm",
     "proc_pool",
     "proto",
 ]
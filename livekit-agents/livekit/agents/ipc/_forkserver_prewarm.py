@@ -0,0 +1,4 @@
+# imported last by the forkserver (see Worker.run), once all the plugin packages are imported
+from .prewarm import load_model_files
+
+load_model_files()
@@ -1,7 +1,24 @@
 from __future__ import annotations
 
-from typing import Protocol
+import contextvars
+from dataclasses import dataclass
+from typing import Optional, Protocol
 
 
 class InferenceExecutor(Protocol):
     async def do_inference(self, method: str, data: bytes) -> bytes | None: ...
+
+
+@dataclass
+class _InferenceTimings:
+    round_trip: float = 0.0
+    """time between sending the requests and receiving their responses"""
+    duration: float = 0.0
+    """time spent running the inferences inside the inference process"""
+
+
+# set by a caller to collect the timings of the inferences made within its context,
+# the executors accumulate into it (the context is copied by the child tasks)
+_inference_timings = contextvars.ContextVar[Optional[_InferenceTimings]](
+    "agents_inference_timings", default=None
+)
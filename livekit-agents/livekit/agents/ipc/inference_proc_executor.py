@@ -4,6 +4,8 @@ import asyncio
 import contextlib
 import multiprocessing as mp
 import socket
+import time
+from collections import deque
 from multiprocessing.context import BaseContext
 from typing import Any
 
@@ -11,6 +13,7 @@ from ..inference_runner import _RunnersDict
 from ..log import logger
 from ..utils import aio, log_exceptions, shortuuid
 from . import channel, proto
+from .inference_executor import _inference_timings
 from .inference_proc_lazy_main import ProcStartArgs, proc_main
 from .supervised_proc import SupervisedProc
 
@@ -46,6 +49,20 @@ class InferenceProcExecutor(SupervisedProc):
 
         self._runners = runners
         self._active_requests: dict[str, asyncio.Future[proto.InferenceResponse]] = {}
+        self._latencies: deque[float] = deque(maxlen=100)
+        self._tracing_requests = dict[str, asyncio.Future[proto.TracingResponse]]()
+
+    async def tracing_info(self) -> dict[str, Any]:
+        if not self.started:
+            raise RuntimeError("process not started")
+
+        tracing_req = proto.TracingRequest()
+        tracing_req.request_id = shortuuid("trace_req_")
+        fut = asyncio.Future[proto.TracingResponse]()
+        self._tracing_requests[tracing_req.request_id] = fut
+        await channel.asend_message(self._pch, tracing_req)
+        resp = await fut
+        return resp.info
 
     def _create_process(self, cch: socket.socket, log_cch: socket.socket) -> mp.Process:
         proc_args = ProcStartArgs(
@@ -74,11 +91,29 @@ class InferenceProcExecutor(SupervisedProc):
 
                 with contextlib.suppress(asyncio.InvalidStateError):
                     fut.set_result(msg)
+            elif isinstance(msg, proto.TracingResponse):
+                tracing_fut = self._tracing_requests.pop(msg.request_id)
+                with contextlib.suppress(asyncio.InvalidStateError):
+                    tracing_fut.set_result(msg)
+
+    @property
+    def pending_requests(self) -> int:
+        return len(self._active_requests)
+
+    @property
+    def latency_p95(self) -> float:
+        """p95 latency of the last 100 inference requests, in seconds"""
+        if not self._latencies:
+            return 0.0
+
+        latencies = sorted(self._latencies)
+        return latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]
 
     async def do_inference(self, method: str, data: bytes) -> bytes | None:
         if not self.started:
             raise RuntimeError("process not started")
 
+        start_time = time.perf_counter()
         request_id = shortuuid("inference_req_")
         fut = asyncio.Future[proto.InferenceResponse]()
 
@@ -90,6 +125,12 @@ class InferenceProcExecutor(SupervisedProc):
         self._active_requests[request_id] = fut
 
         inf_resp = await fut
+        round_trip = time.perf_counter() - start_time
+        self._latencies.append(round_trip)
+        if (timings := _inference_timings.get()) is not None:
+            timings.round_trip += round_trip
+            timings.duration += inf_resp.duration
+
         if inf_resp.error:
             raise RuntimeError(f"inference of {method} failed: {inf_resp.error}")
 
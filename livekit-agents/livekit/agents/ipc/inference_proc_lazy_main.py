@@ -96,6 +96,14 @@ class _InferenceProc:
             if isinstance(msg, proto.InferenceRequest):
                 await self._handle_inference_request(msg)
 
+            if isinstance(msg, proto.TracingRequest):
+                await self._client.send(
+                    proto.TracingResponse(
+                        request_id=msg.request_id,
+                        info={"event_loop": self._client.loop_monitor.export()},
+                    )
+                )
+
             if isinstance(msg, proto.ShutdownRequest):
                 await self._client.send(proto.Exiting(reason=msg.reason))
                 break
@@ -107,11 +115,13 @@ class _InferenceProc:
             logger.warning("unknown inference method", extra={"method": msg.method})
 
         try:
+            start_time = time.perf_counter()
             data = await loop.run_in_executor(None, self._runners[msg.method].run, msg.data)
             await self._client.send(
                 proto.InferenceResponse(
                     request_id=msg.request_id,
                     data=data,
+                    duration=time.perf_counter() - start_time,
                 )
             )
 
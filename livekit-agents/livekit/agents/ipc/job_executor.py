@@ -35,7 +35,7 @@ class JobExecutor(Protocol):
 
     async def launch_job(self, info: RunningJobInfo) -> None: ...
 
-    async def tracing_info(self) -> dict[str, Any]: ...
+    async def tracing_info(self, *, cursor: int = 0, max_points: int = 0) -> dict[str, Any]: ...
 
     def logging_extra(self) -> dict[str, Any]: ...
 
@@ -10,9 +10,11 @@ from typing import Any, Callable
 
 from ..job import JobContext, JobProcess, RunningJobInfo
 from ..log import logger
+from ..metrics.registry import MetricsRegistry
 from ..utils import aio, log_exceptions, shortuuid
+from ..utils.http_context import HTTPSessionOptions
 from . import channel, proto
-from .inference_executor import InferenceExecutor
+from .inference_executor import InferenceExecutor, _inference_timings, _InferenceTimings
 from .job_executor import JobStatus
 from .job_proc_lazy_main import ProcStartArgs, proc_main
 from .supervised_proc import SupervisedProc
@@ -35,6 +37,8 @@ class ProcJobExecutor(SupervisedProc):
         http_proxy: str | None,
         mp_ctx: BaseContext,
         loop: asyncio.AbstractEventLoop,
+        http_options: HTTPSessionOptions | None = None,
+        metrics_registry: MetricsRegistry | None = None,
     ) -> None:
         super().__init__(
             initialize_timeout=initialize_timeout,
@@ -47,6 +51,7 @@ class ProcJobExecutor(SupervisedProc):
             mp_ctx=mp_ctx,
             loop=loop,
             http_proxy=http_proxy,
+            http_options=http_options,
         )
 
         self._user_args: Any | None = None
@@ -55,6 +60,7 @@ class ProcJobExecutor(SupervisedProc):
         self._initialize_process_fnc = initialize_process_fnc
         self._job_entrypoint_fnc = job_entrypoint_fnc
         self._inference_executor = inference_executor
+        self._metrics_registry = metrics_registry
         self._inference_tasks: list[asyncio.Task[None]] = []
         self._id = shortuuid("PCEXEC_")
         self._tracing_requests = dict[str, asyncio.Future[proto.TracingResponse]]()
@@ -63,11 +69,11 @@ class ProcJobExecutor(SupervisedProc):
     def id(self) -> str:
         return self._id
 
-    async def tracing_info(self) -> dict[str, Any]:
+    async def tracing_info(self, *, cursor: int = 0, max_points: int = 0) -> dict[str, Any]:
         if not self.started:
             raise RuntimeError("process not started")
 
-        tracing_req = proto.TracingRequest()
+        tracing_req = proto.TracingRequest(cursor=cursor, max_points=max_points)
         tracing_req.request_id = shortuuid("trace_req_")
         fut = asyncio.Future[proto.TracingResponse]()
         self._tracing_requests[tracing_req.request_id] = fut
@@ -117,6 +123,9 @@ class ProcJobExecutor(SupervisedProc):
                     fut = self._tracing_requests.pop(msg.request_id)
                     with contextlib.suppress(asyncio.InvalidStateError):
                         fut.set_result(msg)
+                elif isinstance(msg, proto.MetricsReport):
+                    if self._metrics_registry is not None:
+                        self._metrics_registry.merge(msg.snapshot)
         finally:
             await aio.cancel_and_wait(*self._inference_tasks)
 
@@ -139,10 +148,14 @@ class ProcJobExecutor(SupervisedProc):
             return
 
         try:
+            timings = _InferenceTimings()
+            _inference_timings.set(timings)  # scoped to this task
             inf_res = await self._inference_executor.do_inference(inf_req.method, inf_req.data)
             await channel.asend_message(
                 self._pch,
-                proto.InferenceResponse(request_id=inf_req.request_id, data=inf_res),
+                proto.InferenceResponse(
+                    request_id=inf_req.request_id, data=inf_res, duration=timings.duration
+                ),
             )
         except Exception as e:
             await channel.asend_message(
@@ -24,30 +24,34 @@ if current_process().name == "job_proc":
 import asyncio
 import contextlib
 import socket
+import time
 from dataclasses import dataclass
 from typing import Any, Callable, cast
 
 from livekit import rtc
 
-from ..cli import cli
 from ..debug import tracing
 from ..job import JobContext, JobExecutorType, JobProcess, _JobContextVar
 from ..log import logger
+from ..metrics.registry import get_process_registry
 from ..utils import aio, http_context, log_exceptions, shortuuid
 from .channel import Message
-from .inference_executor import InferenceExecutor
+from .inference_executor import InferenceExecutor, _inference_timings
 from .proc_client import _ProcClient
 from .proto import (
     Exiting,
     InferenceRequest,
     InferenceResponse,
     InitializeRequest,
+    MetricsReport,
     ShutdownRequest,
     StartJobRequest,
     TracingRequest,
     TracingResponse,
 )
 
+METRICS_REPORT_INTERVAL = 5.0
+
 
 @dataclass
 class ProcStartArgs:
@@ -98,7 +102,12 @@ class _InfClient(InferenceExecutor):
 
         self._active_requests[request_id] = fut
 
+        start_time = time.perf_counter()
         inf_resp = await fut
+        if (timings := _inference_timings.get()) is not None:
+            timings.round_trip += time.perf_counter() - start_time
+            timings.duration += inf_resp.duration
+
         if inf_resp.error:
             raise RuntimeError(f"inference of {method} failed: {inf_resp.error}")
 
@@ -149,6 +158,7 @@ class _JobProc:
             executor_type=self._executor_type,
             user_arguments=self._user_arguments,
             http_proxy=init_req.http_proxy or None,
+            http_options=init_req.http_options,
         )
         self._initialize_process_fnc(self._job_proc)
 
@@ -181,8 +191,13 @@ class _JobProc:
 
                 if isinstance(msg, TracingRequest):
                     if not self.has_running_job:
-                        logger.warning("tracing request received without running job")
-                        return
+                        await self._client.send(
+                            TracingResponse(
+                                request_id=msg.request_id,
+                                info={"event_loop": self._client.loop_monitor.export()},
+                            )
+                        )
+                        continue
 
                     try:
                         job_ctx_token = _JobContextVar.set(self._job_ctx)
@@ -197,19 +212,31 @@ class _JobProc:
                     except Exception:
                         logger.exception("error while exeuting tracing tasks")
 
-                    await self._client.send(
-                        TracingResponse(
-                            request_id=msg.request_id,
-                            info=tracing.Tracing._get_job_handle(self._job_ctx.job.id)._export(),
-                        )
+                    info = tracing.Tracing._get_job_handle(self._job_ctx.job.id)._export(
+                        cursor=msg.cursor, max_points=msg.max_points
                     )
+                    info["event_loop"] = self._client.loop_monitor.export()
+                    await self._client.send(TracingResponse(request_id=msg.request_id, info=info))
+
+        # the session is created before the job starts so the warmed up connections are reused
+        http_context._new_session_ctx(
+            self._job_proc.http_options, http_proxy=self._job_proc.http_proxy
+        )
+        warmup_task: asyncio.Task[None] | None = None
+        if warmup_urls := self._job_proc.http_options.warmup_urls:
+            warmup_task = asyncio.create_task(http_context._warmup(warmup_urls), name="http_warmup")
 
         read_task = asyncio.create_task(_read_ipc_task(), name="job_ipc_read")
 
         await self._exit_proc_flag.wait()
         await aio.cancel_and_wait(read_task)
+        if warmup_task is not None:
+            await aio.cancel_and_wait(warmup_task)
+            await http_context._close_http_ctx()  # the process may exit without running a job
 
     def _start_job(self, msg: StartJobRequest) -> None:
+        from ..cli import cli
+
         if cli.CLI_ARGUMENTS is not None and cli.CLI_ARGUMENTS.console:
             from .mock_room import MockRoom
 
@@ -252,8 +279,13 @@ class _JobProc:
         self._job_task.add_done_callback(_exit_proc_cb)
 
     async def _run_job_task(self) -> None:
+        from ..cli import cli
+
         job_ctx_token = _JobContextVar.set(self._job_ctx)
-        http_context._new_session_ctx()
+        if not http_context._has_http_ctx():
+            http_context._new_session_ctx(
+                self._job_proc.http_options, http_proxy=self._job_proc.http_proxy
+            )
 
         job_entry_task = asyncio.create_task(
             self._job_entrypoint_fnc(self._job_ctx), name="job_user_entrypoint"
@@ -290,6 +322,8 @@ class _JobProc:
 
         job_entry_task.add_done_callback(log_exception)
 
+        metrics_task = asyncio.create_task(self._report_metrics_task(), name="job_metrics_report")
+
         shutdown_info = await self._shutdown_fut
         logger.debug(
             "shutting down job task",
@@ -315,9 +349,27 @@ class _JobProc:
         except Exception:
             logger.exception("error while shutting down the job")
 
+        await aio.cancel_and_wait(metrics_task)
+        await self._send_metrics_report()
+
         await http_context._close_http_ctx()
         _JobContextVar.reset(job_ctx_token)
 
+    @log_exceptions(logger=logger)
+    async def _report_metrics_task(self) -> None:
+        interval = aio.interval(METRICS_REPORT_INTERVAL)
+        while True:
+            await interval.tick()
+            await self._send_metrics_report()
+
+    async def _send_metrics_report(self) -> None:
+        snapshot = get_process_registry().take_snapshot()
+        if not snapshot["histograms"] and not snapshot["counters"]:
+            return
+
+        with contextlib.suppress(aio.duplex_unix.DuplexClosed):
+            await self._client.send(MetricsReport(snapshot=snapshot))
+
 
 @dataclass
 class ThreadStartArgs:
@@ -12,9 +12,11 @@ from typing import Any, Callable
 from .. import utils
 from ..job import JobContext, JobProcess, RunningJobInfo
 from ..log import logger
+from ..metrics.registry import MetricsRegistry
 from ..utils.aio import duplex_unix
+from ..utils.http_context import HTTPSessionOptions
 from . import channel, job_proc_lazy_main, proto
-from .inference_executor import InferenceExecutor
+from .inference_executor import InferenceExecutor, _inference_timings, _InferenceTimings
 from .job_executor import JobStatus
 
 
@@ -27,6 +29,7 @@ class _ProcOpts:
     ping_interval: float
     high_ping_threshold: float
     http_proxy: str | None
+    http_options: HTTPSessionOptions | None = None
 
 
 class ThreadJobExecutor:
@@ -42,6 +45,8 @@ class ThreadJobExecutor:
         high_ping_threshold: float,
         http_proxy: str | None,
         loop: asyncio.AbstractEventLoop,
+        metrics_registry: MetricsRegistry | None = None,
+        http_options: HTTPSessionOptions | None = None,
     ) -> None:
         self._loop = loop
         self._opts = _ProcOpts(
@@ -52,6 +57,7 @@ class ThreadJobExecutor:
             ping_interval=ping_interval,
             high_ping_threshold=high_ping_threshold,
             http_proxy=http_proxy,
+            http_options=http_options,
         )
 
         self._user_args: Any | None = None
@@ -64,6 +70,7 @@ class ThreadJobExecutor:
         self._lock = asyncio.Lock()
 
         self._inference_executor = inference_executor
+        self._metrics_registry = metrics_registry
         self._inference_tasks: list[asyncio.Task[None]] = []
         self._id = utils.shortuuid("THEXEC_")
         self._tracing_requests = dict[str, asyncio.Future[proto.TracingResponse]]()
@@ -72,11 +79,11 @@ class ThreadJobExecutor:
     def id(self) -> str:
         return self._id
 
-    async def tracing_info(self) -> dict[str, Any]:
+    async def tracing_info(self, *, cursor: int = 0, max_points: int = 0) -> dict[str, Any]:
         if not self.started:
             raise RuntimeError("thread not started")
 
-        tracing_req = proto.TracingRequest()
+        tracing_req = proto.TracingRequest(cursor=cursor, max_points=max_points)
         tracing_req.request_id = utils.shortuuid("trace_req_")
         fut = asyncio.Future[proto.TracingResponse]()
         self._tracing_requests[tracing_req.request_id] = fut
@@ -157,7 +164,10 @@ class ThreadJobExecutor:
 
     async def initialize(self) -> None:
         await channel.asend_message(
-            self._pch, proto.InitializeRequest(http_proxy=self._opts.http_proxy or "")
+            self._pch,
+            proto.InitializeRequest(
+                http_proxy=self._opts.http_proxy or "", http_options=self._opts.http_options
+            ),
         )
 
         try:
@@ -224,10 +234,14 @@ class ThreadJobExecutor:
             return
 
         try:
+            timings = _InferenceTimings()
+            _inference_timings.set(timings)  # scoped to this task
             inf_res = await self._inference_executor.do_inference(inf_req.method, inf_req.data)
             await channel.asend_message(
                 self._pch,
-                proto.InferenceResponse(request_id=inf_req.request_id, data=inf_res),
+                proto.InferenceResponse(
+                    request_id=inf_req.request_id, data=inf_res, duration=timings.duration
+                ),
             )
         except Exception as e:
             await channel.asend_message(
@@ -298,6 +312,9 @@ class ThreadJobExecutor:
                 with contextlib.suppress(asyncio.InvalidStateError):
                     fut.set_result(msg)
 
+            if isinstance(msg, proto.MetricsReport) and self._metrics_registry is not None:
+                self._metrics_registry.merge(msg.snapshot)
+
     @utils.log_exceptions(logger=logger)
     async def _ping_task(self) -> None:
         ping_interval = utils.aio.interval(self._opts.ping_interval)
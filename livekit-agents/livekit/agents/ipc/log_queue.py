@@ -1,16 +1,91 @@
 from __future__ import annotations
 
-import copy
+import functools
 import logging
+import multiprocessing
+import os
 import pickle
 import queue
 import sys
 import threading
-from typing import Callable, Optional
+import time
+from typing import Any, Callable, Optional
 
 from .. import utils
 from ..utils.aio import duplex_unix
 
+# attributes of a LogRecord that are not user provided extras
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+_DROPPED_REPORT_INTERVAL = 1.0
+
+# a record is shipped as a flat tuple containing only the fields the parent needs:
+# (name, levelno, msg, created, pathname, lineno, funcName, threadName, extra)
+_EncodedRecord = tuple[str, int, str, float, str, int, str, Optional[str], Optional[dict[str, Any]]]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, _PRIMITIVES):
+        return value
+
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(v) for v in value]
+
+    if isinstance(value, dict):
+        return {str(k): _encode_value(v) for k, v in value.items()}
+
+    # same fallback as the JsonFormatter, avoid sending objects the parent may not unpickle
+    try:
+        return str(value)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_pathname(pathname: str) -> tuple[str, str]:
+    filename = os.path.basename(pathname)
+    return filename, os.path.splitext(filename)[0]
+
+
+def _decode_record(
+    encoded: _EncodedRecord, process: int, process_name: str, start_time: float
+) -> logging.LogRecord:
+    name, levelno, msg, created, pathname, lineno, func_name, thread_name, extra = encoded
+    filename, module = _split_pathname(pathname)
+
+    # avoid LogRecord.__init__, most of its work is already done by the child process
+    record = logging.LogRecord.__new__(logging.LogRecord)
+    record.__dict__.update(
+        name=name,
+        msg=msg,
+        args=None,
+        levelname=logging.getLevelName(levelno),
+        levelno=levelno,
+        pathname=pathname,
+        filename=filename,
+        module=module,
+        exc_info=None,
+        exc_text=None,
+        stack_info=None,
+        lineno=lineno,
+        funcName=func_name,
+        created=created,
+        msecs=(created - int(created)) * 1000,
+        relativeCreated=(created - start_time) * 1000,
+        thread=None,
+        threadName=thread_name,
+        processName=process_name,
+        process=process,
+        taskName=None,
+        message=msg,
+    )
+    if extra:
+        record.__dict__.update(extra)
+
+    return record
+
 
 class LogQueueListener:
     def __init__(
@@ -21,6 +96,7 @@ class LogQueueListener:
         self._thread: threading.Thread | None = None
         self._duplex = duplex
         self._prepare_fnc = prepare_fnc
+        self._start_time = time.time()
 
     def start(self) -> None:
         self._thread = threading.Thread(target=self._monitor, name="ipc_log_listener")
@@ -50,55 +126,173 @@ class LogQueueListener:
             except utils.aio.duplex_unix.DuplexClosed:
                 break
 
-            record = pickle.loads(data)
-            self.handle(record)
+            process, process_name, batch = pickle.loads(data)
+            for encoded in batch:
+                self.handle(_decode_record(encoded, process, process_name, self._start_time))
 
 
 class LogQueueHandler(logging.Handler):
     _sentinal = None
 
-    def __init__(self, duplex: utils.aio.duplex_unix._Duplex) -> None:
+    def __init__(
+        self,
+        duplex: utils.aio.duplex_unix._Duplex,
+        *,
+        flush_interval: float = 0.05,
+        max_batch_size: int = 512,
+        rate_limit: float = 1000.0,
+    ) -> None:
+        """Forward the log records of a job process to its parent.
+
+        Records are reduced to the fields needed by the parent, coalesced for up to
+        ``flush_interval`` seconds and sent as a single message. Records below WARNING are
+        rate limited per logger to ``rate_limit`` records per second (0 disables it), the
+        number of dropped records is reported to the parent every second and on close.
+        """
         super().__init__()
         self._duplex = duplex
-        self._send_q = queue.SimpleQueue[Optional[bytes]]()
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._rate_limit = rate_limit
+        self._buckets: dict[str, tuple[float, float]] = {}  # name -> (tokens, last_refill)
+        # name -> (count, pathname, lineno, funcName, threadName) of the last dropped record
+        self._dropped: dict[str, tuple[int, str, int, str, str | None]] = {}
+        self._pid = os.getpid()
+        self._process_name = multiprocessing.current_process().name
+        self._send_q = queue.SimpleQueue[Optional[_EncodedRecord]]()
         self._send_thread = threading.Thread(target=self._forward_logs, name="ipc_log_forwarder")
         self._send_thread.start()
 
     def _forward_logs(self) -> None:
-        while True:
-            serialized_record = self._send_q.get()
-            if serialized_record is None:
-                break
+        closing = False
+        next_report = time.monotonic() + _DROPPED_REPORT_INTERVAL
+        while not closing:
+            batch: list[_EncodedRecord] = []
+            try:
+                first = self._send_q.get(timeout=max(next_report - time.monotonic(), 0.0))
+            except queue.Empty:
+                pass
+            else:
+                if first is None:
+                    closing = True
+                else:
+                    batch.append(first)
+                    closing = self._fill_batch(batch)
+
+            if closing or time.monotonic() >= next_report:
+                batch.extend(self._take_dropped())
+                next_report = time.monotonic() + _DROPPED_REPORT_INTERVAL
+
+            if not batch:
+                continue
 
             try:
-                self._duplex.send_bytes(serialized_record)
+                self._duplex.send_bytes(
+                    pickle.dumps(
+                        (self._pid, self._process_name, batch),
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                )
             except duplex_unix.DuplexClosed:
                 break
 
         self._duplex.close()
 
+    def _fill_batch(self, batch: list[_EncodedRecord]) -> bool:
+        """Coalesce the records queued within the flush interval, return True when closing"""
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+
+            try:
+                encoded = self._send_q.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if encoded is None:
+                return True
+
+            batch.append(encoded)
+
+        return False
+
+    def _take_dropped(self) -> list[_EncodedRecord]:
+        # emit() runs under the handler lock
+        with self.lock:  # type: ignore[union-attr]
+            dropped, self._dropped = self._dropped, {}
+
+        return [
+            (
+                name,
+                logging.WARNING,
+                f"dropped {count} log records (rate limited)",
+                time.time(),
+                pathname,
+                lineno,
+                func_name,
+                thread_name,
+                {"dropped": count},
+            )
+            for name, (count, pathname, lineno, func_name, thread_name) in dropped.items()
+        ]
+
+    def _rate_limited(self, record: logging.LogRecord) -> bool:
+        if self._rate_limit <= 0 or record.levelno >= logging.WARNING:
+            return False
+
+        now = time.monotonic()
+        tokens, last = self._buckets.get(record.name, (self._rate_limit, now))
+        tokens = min(self._rate_limit, tokens + (now - last) * self._rate_limit)
+        if tokens < 1.0:
+            self._buckets[record.name] = (tokens, now)
+            count = self._dropped[record.name][0] if record.name in self._dropped else 0
+            self._dropped[record.name] = (
+                count + 1,
+                record.pathname,
+                record.lineno,
+                record.funcName,
+                record.threadName,
+            )
+            return True
+
+        self._buckets[record.name] = (tokens - 1.0, now)
+        return False
+
     def emit(self, record: logging.LogRecord) -> None:
         try:
             # Check if Python is shutting down
             if sys.is_finalizing():
                 return
 
-            # from https://github.com/python/cpython/blob/91b7f2e7f6593acefda4fa860250dd87d6f849bf/Lib/logging/handlers.py#L1453
+            if self._rate_limited(record):
+                return
+
+            # includes the formatted exception & stack, like logging.handlers.QueueHandler
             msg = self.format(record)
-            record = copy.copy(record)
-            record.message = msg
-            record.msg = msg
-            record.args = None
-            record.exc_info = None
-            record.exc_text = None
-            record.stack_info = None
-
-            # https://websockets.readthedocs.io/en/stable/topics/logging.html#logging-to-json
-            # webosckets library add "websocket" attribute to log records, which is not pickleable
-            if hasattr(record, "websocket"):
-                record.websocket = None
-
-            self._send_q.put_nowait(pickle.dumps(record))
+
+            # websockets adds a "websocket" attribute to its log records, which shouldn't
+            # be forwarded, see https://websockets.readthedocs.io/en/stable/topics/logging.html#logging-to-json
+            extra = {
+                key: _encode_value(value)
+                for key, value in record.__dict__.items()
+                if key not in _RECORD_ATTRS and key != "websocket" and not key.startswith("_")
+            }
+
+            self._send_q.put_nowait(
+                (
+                    record.name,
+                    record.levelno,
+                    msg,
+                    record.created,
+                    record.pathname,
+                    record.lineno,
+                    record.funcName,
+                    record.threadName,
+                    extra or None,
+                )
+            )
 
         except Exception:
             self.handleError(record)
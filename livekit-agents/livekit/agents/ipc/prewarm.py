@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+
+from ..log import logger
+
+_model_files: dict[str, bytes] = {}
+
+
+def load_model_files() -> None:
+    """Load the model files of the registered plugins into memory.
+
+    This runs in the forkserver after the plugin packages are preloaded, the job processes
+    forked from it inherit the loaded files copy-on-write instead of reading their own copy.
+    """
+    from ..plugin import Plugin
+
+    for plugin in Plugin.registered_plugins:
+        try:
+            paths = plugin.model_files()
+        except Exception:
+            logger.exception("failed to get model files", extra={"plugin": plugin.package})
+            continue
+
+        for path in paths:
+            if path in _model_files:
+                continue
+
+            try:
+                start_time = time.perf_counter()
+                with open(path, "rb") as f:
+                    _model_files[path] = f.read()
+
+                logger.debug(
+                    "prewarmed model file",
+                    extra={
+                        "path": path,
+                        "size_mb": len(_model_files[path]) / (1024 * 1024),
+                        "elapsed_time": time.perf_counter() - start_time,
+                    },
+                )
+            except OSError:
+                logger.exception("failed to prewarm model file", extra={"path": path})
+
+
+def get_model_file(path: str) -> bytes | None:
+    """Return the content of a model file if it was prewarmed in the forkserver"""
+    return _model_files.get(path)
@@ -35,6 +35,11 @@ class _ProcClient:
         self._main_task_fnc = main_task_fnc
         self._initialized = False
         self._log_handler: LogQueueHandler | None = None
+        self._loop_monitor = aio.debug.LoopMonitor()
+
+    @property
+    def loop_monitor(self) -> aio.debug.LoopMonitor:
+        return self._loop_monitor
 
     def initialize_logger(self) -> None:
         if self._log_cch is None:
@@ -101,6 +106,7 @@ class _ProcClient:
 
     async def _monitor_task(self) -> None:
         self._acch = await aio.duplex_unix._AsyncDuplex.open(self._mp_cch)
+        self._loop_monitor.start()
         try:
             exit_flag = asyncio.Event()
             ping_timeout = aio.sleep(self._init_req.ping_timeout)
@@ -159,4 +165,5 @@ class _ProcClient:
             if health_check_task is not None:
                 await aio.cancel_and_wait(health_check_task)
         finally:
+            self._loop_monitor.stop()
             await self._acch.aclose()
@@ -9,7 +9,9 @@ from typing import Any, Callable, Literal
 from .. import utils
 from ..job import JobContext, JobExecutorType, JobProcess, RunningJobInfo
 from ..log import logger
+from ..metrics.registry import MetricsRegistry
 from ..utils import aio
+from ..utils.http_context import HTTPSessionOptions
 from ..utils.hw.cpu import get_cpu_monitor
 from . import inference_executor, job_proc_executor, job_thread_executor
 from .job_executor import JobExecutor
@@ -22,8 +24,6 @@ EventTypes = Literal[
     "process_job_launched",
 ]
 
-MAX_CONCURRENT_INITIALIZATIONS = math.ceil(get_cpu_monitor().cpu_count())
-
 
 class ProcPool(utils.EventEmitter[EventTypes]):
     def __init__(
@@ -41,6 +41,8 @@ class ProcPool(utils.EventEmitter[EventTypes]):
         memory_limit_mb: float,
         http_proxy: str | None,
         loop: asyncio.AbstractEventLoop,
+        metrics_registry: MetricsRegistry | None = None,
+        http_options: HTTPSessionOptions | None = None,
     ) -> None:
         super().__init__()
         self._job_executor_type = job_executor_type
@@ -49,15 +51,17 @@ class ProcPool(utils.EventEmitter[EventTypes]):
         self._job_entrypoint_fnc = job_entrypoint_fnc
         self._close_timeout = close_timeout
         self._inf_executor = inference_executor
+        self._metrics_registry = metrics_registry
         self._initialize_timeout = initialize_timeout
         self._loop = loop
         self._memory_limit_mb = memory_limit_mb
         self._memory_warn_mb = memory_warn_mb
         self._default_num_idle_processes = num_idle_processes
         self._http_proxy = http_proxy
+        self._http_options = http_options
         self._target_idle_processes = num_idle_processes
 
-        self._init_sem = asyncio.Semaphore(MAX_CONCURRENT_INITIALIZATIONS)
+        self._init_sem = asyncio.Semaphore(math.ceil(get_cpu_monitor().cpu_count()))
         self._warmed_proc_queue = asyncio.Queue[JobExecutor]()
         self._executors: list[JobExecutor] = []
         self._spawn_tasks: set[asyncio.Task[None]] = set()
@@ -72,6 +76,11 @@ class ProcPool(utils.EventEmitter[EventTypes]):
     def processes(self) -> list[JobExecutor]:
         return self._executors
 
+    @property
+    def num_idle_processes(self) -> int:
+        """Number of warmed processes waiting for a job"""
+        return self._warmed_proc_queue.qsize()
+
     def get_by_job_id(self, job_id: str) -> JobExecutor | None:
         return next(
             (x for x in self._executors if x.running_job and x.running_job.job.id == job_id),
@@ -120,6 +129,11 @@ class ProcPool(utils.EventEmitter[EventTypes]):
     def target_idle_processes(self) -> int:
         return self._target_idle_processes
 
+    @property
+    def num_warming_processes(self) -> int:
+        """Number of processes being started or initialized"""
+        return len(self._spawn_tasks)
+
     @utils.log_exceptions(logger=logger)
     async def _proc_spawn_task(self) -> None:
         proc: JobExecutor
@@ -133,7 +147,9 @@ class ProcPool(utils.EventEmitter[EventTypes]):
                 ping_interval=2.5,
                 high_ping_threshold=0.5,
                 http_proxy=self._http_proxy,
+                http_options=self._http_options,
                 loop=self._loop,
+                metrics_registry=self._metrics_registry,
             )
         elif self._job_executor_type == JobExecutorType.PROCESS:
             proc = job_proc_executor.ProcJobExecutor(
@@ -150,6 +166,8 @@ class ProcPool(utils.EventEmitter[EventTypes]):
                 memory_warn_mb=self._memory_warn_mb,
                 memory_limit_mb=self._memory_limit_mb,
                 http_proxy=self._http_proxy,
+                http_options=self._http_options,
+                metrics_registry=self._metrics_registry,
             )
         else:
             raise ValueError(f"unsupported job executor: {self._job_executor_type}")
@@ -8,6 +8,7 @@ from typing import Any, ClassVar
 from livekit.protocol import agent
 
 from ..job import JobAcceptArguments, RunningJobInfo
+from ..utils.http_context import HTTPSessionOptions
 from . import channel
 
 
@@ -23,6 +24,7 @@ class InitializeRequest:
     # if ping is higher than this, process is considered unresponsive
     high_ping_threshold: float = 0
     http_proxy: str = ""  # empty = None
+    http_options: HTTPSessionOptions | None = None
 
     def write(self, b: io.BytesIO) -> None:
         channel.write_bool(b, self.asyncio_debug)
@@ -30,6 +32,7 @@ class InitializeRequest:
         channel.write_float(b, self.ping_timeout)
         channel.write_float(b, self.high_ping_threshold)
         channel.write_string(b, self.http_proxy)
+        channel.write_bytes(b, pickle.dumps(self.http_options))
 
     def read(self, b: io.BytesIO) -> None:
         self.asyncio_debug = channel.read_bool(b)
@@ -37,6 +40,7 @@ class InitializeRequest:
         self.ping_timeout = channel.read_float(b)
         self.high_ping_threshold = channel.read_float(b)
         self.http_proxy = channel.read_string(b)
+        self.http_options = pickle.loads(channel.read_bytes(b))
 
 
 @dataclass
@@ -175,6 +179,8 @@ class InferenceResponse:
     request_id: str = ""
     data: bytes | None = None
     error: str = ""
+    duration: float = 0.0
+    """time spent running the inference inside the inference process"""
 
     def write(self, b: io.BytesIO) -> None:
         channel.write_string(b, self.request_id)
@@ -182,6 +188,7 @@ class InferenceResponse:
         if self.data is not None:
             channel.write_bytes(b, self.data)
         channel.write_string(b, self.error)
+        channel.write_double(b, self.duration)
 
     def read(self, b: io.BytesIO) -> None:
         self.request_id = channel.read_string(b)
@@ -189,18 +196,27 @@ class InferenceResponse:
         if has_data:
             self.data = channel.read_bytes(b)
         self.error = channel.read_string(b)
+        self.duration = channel.read_double(b)
 
 
 @dataclass
 class TracingRequest:
     MSG_ID: ClassVar[int] = 9
     request_id: str = ""
+    cursor: int = 0
+    """only export the events logged after this cursor"""
+    max_points: int = 0
+    """downsample the graphs to at most this many points, 0 disables it"""
 
     def write(self, b: io.BytesIO) -> None:
         channel.write_string(b, self.request_id)
+        channel.write_long(b, self.cursor)
+        channel.write_int(b, self.max_points)
 
     def read(self, b: io.BytesIO) -> None:
         self.request_id = channel.read_string(b)
+        self.cursor = channel.read_long(b)
+        self.max_points = channel.read_int(b)
 
 
 @dataclass
@@ -218,6 +234,20 @@ class TracingResponse:
         self.info = pickle.loads(channel.read_bytes(b))
 
 
+@dataclass
+class MetricsReport:
+    """sent periodically by a job process, metrics accumulated since the previous report"""
+
+    MSG_ID: ClassVar[int] = 11
+    snapshot: dict[str, Any] = field(default_factory=dict)
+
+    def write(self, b: io.BytesIO) -> None:
+        channel.write_bytes(b, pickle.dumps(self.snapshot))
+
+    def read(self, b: io.BytesIO) -> None:
+        self.snapshot = pickle.loads(channel.read_bytes(b))
+
+
 IPC_MESSAGES = {
     InitializeRequest.MSG_ID: InitializeRequest,
     InitializeResponse.MSG_ID: InitializeResponse,
@@ -230,4 +260,5 @@ IPC_MESSAGES = {
     InferenceResponse.MSG_ID: InferenceResponse,
     TracingRequest.MSG_ID: TracingRequest,
     TracingResponse.MSG_ID: TracingResponse,
+    MetricsReport.MSG_ID: MetricsReport,
 }
@@ -18,6 +18,7 @@ import psutil
 from ..log import logger
 from ..utils import aio, log_exceptions, time_ms
 from ..utils.aio import duplex_unix
+from ..utils.http_context import HTTPSessionOptions
 from . import channel, proto
 from .log_queue import LogQueueListener
 
@@ -32,6 +33,7 @@ class _ProcOpts:
     ping_timeout: float
     high_ping_threshold: float
     http_proxy: str | None
+    http_options: HTTPSessionOptions | None = None
 
 
 class SupervisedProc(ABC):
@@ -48,6 +50,7 @@ class SupervisedProc(ABC):
         http_proxy: str | None,
         mp_ctx: BaseContext,
         loop: asyncio.AbstractEventLoop,
+        http_options: HTTPSessionOptions | None = None,
     ) -> None:
         self._loop = loop
         self._mp_ctx = mp_ctx
@@ -60,6 +63,7 @@ class SupervisedProc(ABC):
             ping_timeout=ping_timeout,
             high_ping_threshold=high_ping_threshold,
             http_proxy=http_proxy,
+            http_options=http_options,
         )
 
         self._exitcode: int | None = None
@@ -158,6 +162,7 @@ class SupervisedProc(ABC):
                 ping_timeout=self._opts.ping_timeout,
                 high_ping_threshold=self._opts.high_ping_threshold,
                 http_proxy=self._opts.http_proxy or "",
+                http_options=self._opts.http_options,
             ),
         )
 
@@ -23,16 +23,18 @@ import multiprocessing as mp
 from collections.abc import Coroutine
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from livekit import api, rtc
 from livekit.protocol import agent, models
 
-from .ipc.inference_executor import InferenceExecutor
 from .log import logger
 from .types import NotGivenOr
 from .utils import http_context, is_given, wait_for_participant
 
+if TYPE_CHECKING:
+    from .ipc.inference_executor import InferenceExecutor
+
 _JobContextVar = contextvars.ContextVar["JobContext"]("agents_job_context")
 
 
@@ -433,12 +435,14 @@ class JobProcess:
         executor_type: JobExecutorType,
         user_arguments: Any | None,
         http_proxy: str | None,
+        http_options: http_context.HTTPSessionOptions | None = None,
     ) -> None:
         self._executor_type = executor_type
         self._mp_proc = mp.current_process()
         self._userdata: dict[str, Any] = {}
         self._user_arguments = user_arguments
         self._http_proxy: str | None = http_proxy
+        self._http_options = http_options or http_context.HTTPSessionOptions()
 
     @property
     def executor_type(self) -> JobExecutorType:
@@ -460,6 +464,22 @@ class JobProcess:
     def http_proxy(self) -> str | None:
         return self._http_proxy
 
+    @property
+    def http_options(self) -> http_context.HTTPSessionOptions:
+        return self._http_options
+
+    def prewarm_http(self, *urls: str) -> None:
+        """Open connections to the given endpoints (e.g the STT/LLM/TTS providers) once the process
+        is initialized, so the first requests of the job skip the DNS resolution and the TLS
+        handshake. Meant to be called from the ``prewarm_fnc``:
+
+        ```python
+        def prewarm(proc: JobProcess):
+            proc.prewarm_http("https://api.openai.com", "wss://api.deepgram.com")
+        ```
+        """
+        self._http_options.warmup_urls.extend(urls)
+
 
 class JobRequest:
     def __init__(
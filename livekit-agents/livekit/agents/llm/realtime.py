@@ -108,6 +108,11 @@ class RealtimeSession(ABC, rtc.EventEmitter[Union[EventTypes, TEvent]], Generic[
     def realtime_model(self) -> RealtimeModel:
         return self._realtime_model
 
+    @property
+    def input_sample_rate(self) -> int | None:
+        """The sample rate of the audio sent to the model, None if any rate is accepted"""
+        return None
+
     @property
     @abstractmethod
     def chat_ctx(self) -> ChatContext: ...
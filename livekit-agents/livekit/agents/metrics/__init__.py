@@ -4,9 +4,13 @@ from .base import (
     LLMMetrics,
     RealtimeModelMetrics,
     STTMetrics,
+    STTReconnectionMetrics,
     TTSMetrics,
+    TurnLatencyMetrics,
     VADMetrics,
 )
+from .otel import export_turn_latency
+from .registry import MetricsRegistry
 from .usage_collector import UsageCollector, UsageSummary
 from .utils import log_metrics
 
@@ -16,8 +20,12 @@ __all__ = [
     "VADMetrics",
     "EOUMetrics",
     "STTMetrics",
+    "STTReconnectionMetrics",
     "TTSMetrics",
     "RealtimeModelMetrics",
+    "TurnLatencyMetrics",
+    "export_turn_latency",
+    "MetricsRegistry",
     "UsageSummary",
     "UsageCollector",
     "log_metrics",
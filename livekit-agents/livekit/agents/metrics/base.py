@@ -34,6 +34,20 @@ class STTMetrics(BaseModel):
     """Whether the STT is streaming (e.g using websocket)."""
 
 
+class STTReconnectionMetrics(BaseModel):
+    type: Literal["stt_reconnection_metrics"] = "stt_reconnection_metrics"
+    label: str
+    timestamp: float
+    gap_duration: float
+    """Time between the last audio consumed by the previous connection and the first audio
+    consumed by the new one, 0 when the connections overlapped."""
+    replayed_audio_duration: float
+    """Duration of the buffered audio replayed to the new connection."""
+    make_before_break: bool
+    """Whether the new connection was opened before retiring the previous one (handoff), False
+    when reconnecting after an error."""
+
+
 class TTSMetrics(BaseModel):
     type: Literal["tts_metrics"] = "tts_metrics"
     label: str
@@ -56,6 +70,9 @@ class VADMetrics(BaseModel):
     idle_time: float
     inference_duration_total: float
     inference_count: int
+    backlog_duration: float = 0.0
+    """Largest delay of the audio waiting for inference during the interval, in seconds. The VAD
+    can't keep up with realtime when this grows."""
 
 
 class EOUMetrics(BaseModel):
@@ -116,11 +133,80 @@ class RealtimeModelMetrics(BaseModel):
     """Details about the output tokens used in the Response."""
 
 
+class TurnLatencyMetrics(BaseModel):
+    """Latency breakdown of a single speech, from the end of the user speech to the playout.
+
+    All the values ending with `_at` are unix timestamps, they are None when the stage didn't
+    happen for this speech (e.g. speeches that aren't replying to a user turn).
+    """
+
+    type: Literal["turn_latency_metrics"] = "turn_latency_metrics"
+    timestamp: float = 0.0
+    speech_id: str
+    interrupted: bool = False
+
+    end_of_speech_at: float | None = None
+    """When the user stopped speaking (VAD END_OF_SPEECH minus the silence duration)."""
+    final_transcript_at: float | None = None
+    """When the last final transcript of the user turn was received."""
+    eou_inference_started_at: float | None = None
+    eou_inference_ended_at: float | None = None
+    eou_inference_duration: float | None = None
+    """Time spent running the end of turn model inside the inference process."""
+    eou_ipc_delay: float | None = None
+    """IPC and queueing overhead of the end of turn inference (round trip minus the inference)."""
+    end_of_turn_at: float | None = None
+    """When the end of the user turn was decided."""
+    user_turn_completed_started_at: float | None = None
+    user_turn_completed_ended_at: float | None = None
+    """Execution of `Agent.on_user_turn_completed`."""
+    llm_started_at: float | None = None
+    llm_first_token_at: float | None = None
+    tts_started_at: float | None = None
+    """When the first sentence was sent to the TTS."""
+    tts_first_byte_at: float | None = None
+    first_frame_captured_at: float | None = None
+    """When the first audio frame was captured by the `AudioOutput`."""
+    playout_started_at: float | None = None
+    """When the `AudioOutput` started playing the speech."""
+
+    e2e_latency: float | None = None
+    """Time between the end of the user speech and the start of the playout (or the first
+    captured frame when the audio output doesn't report the playout start)."""
+    e2e_latency_from_first_frame: bool = False
+    """Whether `e2e_latency` ends at the first captured frame because the playout start
+    wasn't reported, the playout delay isn't included in that case."""
+
+    def spans(self) -> list[tuple[str, float, float]]:
+        """The measured stages of the turn as (name, start, end), ordered by start time"""
+        stages = [
+            ("transcription", self.end_of_speech_at, self.final_transcript_at),
+            ("end_of_turn_detection", self.end_of_speech_at, self.end_of_turn_at),
+            ("eou_inference", self.eou_inference_started_at, self.eou_inference_ended_at),
+            (
+                "on_user_turn_completed",
+                self.user_turn_completed_started_at,
+                self.user_turn_completed_ended_at,
+            ),
+            ("llm_ttft", self.llm_started_at, self.llm_first_token_at),
+            ("tts_ttfb", self.tts_started_at, self.tts_first_byte_at),
+            ("playout_delay", self.first_frame_captured_at, self.playout_started_at),
+        ]
+        spans = [
+            (name, start, end)
+            for name, start, end in stages
+            if start is not None and end is not None and end >= start
+        ]
+        return sorted(spans, key=lambda s: s[1])
+
+
 AgentMetrics = Union[
     STTMetrics,
+    STTReconnectionMetrics,
     LLMMetrics,
     TTSMetrics,
     VADMetrics,
     EOUMetrics,
     RealtimeModelMetrics,
+    TurnLatencyMetrics,
 ]
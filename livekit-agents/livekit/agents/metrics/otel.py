@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .base import TurnLatencyMetrics
+
+
+def _ns(timestamp: float) -> int:
+    return int(timestamp * 1e9)
+
+
+def export_turn_latency(metrics: TurnLatencyMetrics, *, tracer: Any | None = None) -> None:
+    """Record a turn as an OpenTelemetry trace.
+
+    An ``agent_turn`` span covers the whole turn and each measured stage is recorded as a
+    child span using the timestamps of the metrics, e.g:
+
+    ```python
+    @session.on("metrics_collected")
+    def _on_metrics_collected(ev: MetricsCollectedEvent):
+        if isinstance(ev.metrics, TurnLatencyMetrics):
+            export_turn_latency(ev.metrics)
+    ```
+
+    Args:
+        metrics: The latency breakdown of the turn.
+        tracer: The tracer used to create the spans, defaults to the tracer of the global
+            tracer provider.
+    """
+    try:
+        import opentelemetry.trace as trace
+    except ImportError:
+        raise ImportError(
+            "The 'opentelemetry-api' package is required to export traces. "
+            "Please install the 'otel' extra by running `pip install livekit-agents[otel]`"
+        ) from None
+
+    spans = metrics.spans()
+    if not spans:
+        return
+
+    if tracer is None:
+        tracer = trace.get_tracer("livekit.agents")
+
+    start = min(s[1] for s in spans)
+    end = max(s[2] for s in spans)
+    attributes: dict[str, Any] = {
+        "lk.speech_id": metrics.speech_id,
+        "lk.interrupted": metrics.interrupted,
+    }
+    if metrics.e2e_latency is not None:
+        attributes["lk.e2e_latency"] = metrics.e2e_latency
+        attributes["lk.e2e_latency_from_first_frame"] = metrics.e2e_latency_from_first_frame
+
+    root = tracer.start_span("agent_turn", start_time=_ns(start), attributes=attributes)
+    ctx = trace.set_span_in_context(root)
+    for name, span_start, span_end in spans:
+        span_attributes: dict[str, Any] = {}
+        if name == "eou_inference":
+            if metrics.eou_inference_duration is not None:
+                span_attributes["lk.inference_duration"] = metrics.eou_inference_duration
+            if metrics.eou_ipc_delay is not None:
+                span_attributes["lk.ipc_delay"] = metrics.eou_ipc_delay
+
+        span = tracer.start_span(
+            name, context=ctx, start_time=_ns(span_start), attributes=span_attributes
+        )
+        span.end(end_time=_ns(span_end))
+
+    root.end(end_time=_ns(end))
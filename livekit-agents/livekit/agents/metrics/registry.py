@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from .base import (
+    AgentMetrics,
+    EOUMetrics,
+    LLMMetrics,
+    RealtimeModelMetrics,
+    STTMetrics,
+    STTReconnectionMetrics,
+    TTSMetrics,
+    TurnLatencyMetrics,
+    VADMetrics,
+)
+
+if TYPE_CHECKING:
+    from ..utils.aio import BoundedChan
+
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+_INFERENCE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+_QUEUE_DEPTH_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# name -> (help, buckets)
+HISTOGRAMS: dict[str, tuple[str, tuple[float, ...]]] = {
+    "lk_agents_llm_ttft_seconds": ("LLM time to first token", _LATENCY_BUCKETS),
+    "lk_agents_llm_duration_seconds": ("LLM request duration", _LATENCY_BUCKETS),
+    "lk_agents_stt_duration_seconds": ("STT request duration (non-streamed)", _LATENCY_BUCKETS),
+    "lk_agents_stt_reconnection_gap_seconds": (
+        "Time without audio reaching the STT while reconnecting",
+        _LATENCY_BUCKETS,
+    ),
+    "lk_agents_tts_ttfb_seconds": ("TTS time to first byte", _LATENCY_BUCKETS),
+    "lk_agents_eou_delay_seconds": ("End of utterance delay", _LATENCY_BUCKETS),
+    "lk_agents_eou_transcription_delay_seconds": ("Transcription delay", _LATENCY_BUCKETS),
+    "lk_agents_vad_inference_seconds": ("VAD inference duration", _INFERENCE_BUCKETS),
+    "lk_agents_input_queue_depth": (
+        "Pending inputs of the STT/VAD/TTS streams, sampled periodically",
+        _QUEUE_DEPTH_BUCKETS,
+    ),
+    "lk_agents_input_queue_age_seconds": (
+        "Age of the oldest pending input of the STT/VAD/TTS streams, sampled periodically",
+        _LATENCY_BUCKETS,
+    ),
+    "lk_agents_connection_pool_wait_seconds": (
+        "Time spent getting a connection from a pool, including connecting on a miss",
+        _LATENCY_BUCKETS,
+    ),
+    "lk_agents_e2e_latency_seconds": (
+        "Time from the end of the user speech to the agent playout",
+        _LATENCY_BUCKETS,
+    ),
+}
+
+# name -> help
+COUNTERS: dict[str, str] = {
+    "lk_agents_llm_prompt_tokens_total": "LLM prompt tokens",
+    "lk_agents_llm_completion_tokens_total": "LLM completion tokens",
+    "lk_agents_stt_audio_seconds_total": "Audio duration sent to the STT",
+    "lk_agents_tts_characters_total": "Characters synthesized by the TTS",
+    "lk_agents_tts_audio_seconds_total": "Audio duration generated by the TTS",
+    "lk_agents_input_dropped_total": "Inputs dropped by an overloaded stream",
+    "lk_agents_input_coalesced_total": "Inputs merged by an overloaded stream",
+    "lk_agents_connection_pool_gets_total": "Connections handed out by a pool",
+    "lk_agents_connection_pool_hits_total": "Connections handed out by a pool without connecting",
+}
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        """Aggregates the agent metrics into latency histograms and counters labeled by provider.
+
+        Job processes collect into their own registry and periodically send the accumulated
+        values to the worker (`take_snapshot`), which merges them into the registry served by
+        the `/metrics` endpoint.
+
+        The registry is thread-safe, metrics can be collected from any thread.
+        """
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], _Histogram] = {}
+        self._counters: dict[tuple[str, str], float] = {}
+        # input channel -> (provider, dropped, coalesced) already counted
+        self._queues: weakref.WeakKeyDictionary[BoundedChan[Any], tuple[str, int, int]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def observe(self, name: str, provider: str, value: float) -> None:
+        with self._lock:
+            self._observe(name, provider, value)
+
+    def inc(self, name: str, provider: str, value: float = 1.0) -> None:
+        with self._lock:
+            self._inc(name, provider, value)
+
+    def collect(self, metrics: AgentMetrics) -> None:
+        with self._lock:
+            self._collect(metrics)
+
+    def watch_queue(self, chan: BoundedChan[Any], provider: str) -> None:
+        """Sample the depth and age of an input channel on every snapshot, until it's closed"""
+        with self._lock:
+            self._queues[chan] = (provider, 0, 0)
+
+    def take_snapshot(self) -> dict[str, Any]:
+        """Return the values accumulated since the last snapshot and reset them"""
+        with self._lock:
+            self._sample_queues()
+            histograms, self._histograms = self._histograms, {}
+            counters, self._counters = self._counters, {}
+
+        return {
+            "histograms": [
+                (name, provider, h.counts, h.sum) for (name, provider), h in histograms.items()
+            ],
+            "counters": [(name, provider, v) for (name, provider), v in counters.items()],
+        }
+
+    def merge(self, snapshot: dict[str, Any]) -> None:
+        with self._lock:
+            self._merge(snapshot)
+
+    def render(self, gauges: dict[str, tuple[str, float]] | None = None) -> str:
+        """Render the registry using the Prometheus text exposition format.
+
+        Args:
+            gauges: Additional gauges to render, name -> (help, value).
+        """
+        with self._lock:
+            return self._render(gauges)
+
+    def _observe(self, name: str, provider: str, value: float) -> None:
+        key = (name, provider)
+        if (histogram := self._histograms.get(key)) is None:
+            histogram = self._histograms[key] = _Histogram(HISTOGRAMS[name][1])
+
+        histogram.observe(value)
+
+    def _inc(self, name: str, provider: str, value: float = 1.0) -> None:
+        key = (name, provider)
+        self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def _collect(self, metrics: AgentMetrics) -> None:
+        if isinstance(metrics, LLMMetrics):
+            if not metrics.cancelled and metrics.ttft >= 0:
+                self._observe("lk_agents_llm_ttft_seconds", metrics.label, metrics.ttft)
+            self._observe("lk_agents_llm_duration_seconds", metrics.label, metrics.duration)
+            self._inc("lk_agents_llm_prompt_tokens_total", metrics.label, metrics.prompt_tokens)
+            self._inc(
+                "lk_agents_llm_completion_tokens_total", metrics.label, metrics.completion_tokens
+            )
+
+        elif isinstance(metrics, RealtimeModelMetrics):
+            if not metrics.cancelled and metrics.ttft >= 0:
+                self._observe("lk_agents_llm_ttft_seconds", metrics.label, metrics.ttft)
+            self._observe("lk_agents_llm_duration_seconds", metrics.label, metrics.duration)
+            self._inc("lk_agents_llm_prompt_tokens_total", metrics.label, metrics.input_tokens)
+            self._inc("lk_agents_llm_completion_tokens_total", metrics.label, metrics.output_tokens)
+
+        elif isinstance(metrics, STTMetrics):
+            if not metrics.streamed:
+                self._observe("lk_agents_stt_duration_seconds", metrics.label, metrics.duration)
+            self._inc("lk_agents_stt_audio_seconds_total", metrics.label, metrics.audio_duration)
+
+        elif isinstance(metrics, STTReconnectionMetrics):
+            self._observe(
+                "lk_agents_stt_reconnection_gap_seconds", metrics.label, metrics.gap_duration
+            )
+
+        elif isinstance(metrics, TTSMetrics):
+            if not metrics.cancelled and metrics.ttfb >= 0:
+                self._observe("lk_agents_tts_ttfb_seconds", metrics.label, metrics.ttfb)
+            self._inc("lk_agents_tts_characters_total", metrics.label, metrics.characters_count)
+            self._inc("lk_agents_tts_audio_seconds_total", metrics.label, metrics.audio_duration)
+
+        elif isinstance(metrics, EOUMetrics):
+            self._observe("lk_agents_eou_delay_seconds", "", metrics.end_of_utterance_delay)
+            self._observe(
+                "lk_agents_eou_transcription_delay_seconds", "", metrics.transcription_delay
+            )
+
+        elif isinstance(metrics, TurnLatencyMetrics):
+            if metrics.e2e_latency is not None:
+                self._observe("lk_agents_e2e_latency_seconds", "", metrics.e2e_latency)
+
+        elif isinstance(metrics, VADMetrics):
+            if metrics.inference_count > 0:
+                self._observe(
+                    "lk_agents_vad_inference_seconds",
+                    metrics.label,
+                    metrics.inference_duration_total / metrics.inference_count,
+                )
+
+    def _sample_queues(self) -> None:
+        for chan, (provider, dropped, coalesced) in list(self._queues.items()):
+            if chan.dropped > dropped:
+                self._inc("lk_agents_input_dropped_total", provider, chan.dropped - dropped)
+            if chan.coalesced > coalesced:
+                self._inc("lk_agents_input_coalesced_total", provider, chan.coalesced - coalesced)
+
+            if chan.closed:
+                del self._queues[chan]
+                continue
+
+            self._queues[chan] = (provider, chan.dropped, chan.coalesced)
+            self._observe("lk_agents_input_queue_depth", provider, chan.qsize())
+            self._observe("lk_agents_input_queue_age_seconds", provider, chan.oldest_age)
+
+    def _merge(self, snapshot: dict[str, Any]) -> None:
+        for name, provider, counts, total in snapshot["histograms"]:
+            if name not in HISTOGRAMS:
+                continue
+
+            key = (name, provider)
+            if (histogram := self._histograms.get(key)) is None:
+                histogram = self._histograms[key] = _Histogram(HISTOGRAMS[name][1])
+
+            if len(counts) != len(histogram.counts):
+                continue  # different buckets (e.g. version mismatch)
+
+            for i, count in enumerate(counts):
+                histogram.counts[i] += count
+            histogram.sum += total
+
+        for name, provider, value in snapshot["counters"]:
+            self._inc(name, provider, value)
+
+    def _render(self, gauges: dict[str, tuple[str, float]] | None) -> str:
+        lines: list[str] = []
+
+        for name, (help, _) in HISTOGRAMS.items():
+            series = [(p, h) for (n, p), h in self._histograms.items() if n == name]
+            if not series:
+                continue
+
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} histogram")
+            for provider, histogram in sorted(series, key=lambda s: s[0]):
+                label = f'provider="{_escape(provider)}"'
+                cumulative = 0
+                for le, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{label},le="{le}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{label}}} {histogram.sum}")
+                lines.append(f"{name}_count{{{label}}} {cumulative}")
+
+        for name, help in COUNTERS.items():
+            counters = [(p, v) for (n, p), v in self._counters.items() if n == name]
+            if not counters:
+                continue
+
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} counter")
+            for provider, value in sorted(counters):
+                lines.append(f'{name}{{provider="{_escape(provider)}"}} {value}')
+
+        for name, (help, value) in (gauges or {}).items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_process_registry = MetricsRegistry()
+
+
+def get_process_registry() -> MetricsRegistry:
+    """Registry collecting the metrics of the jobs running in the current process"""
+    return _process_registry
@@ -3,7 +3,16 @@ from __future__ import annotations
 import logging
 
 from ..log import logger as default_logger
-from .base import AgentMetrics, EOUMetrics, LLMMetrics, RealtimeModelMetrics, STTMetrics, TTSMetrics
+from .base import (
+    AgentMetrics,
+    EOUMetrics,
+    LLMMetrics,
+    RealtimeModelMetrics,
+    STTMetrics,
+    STTReconnectionMetrics,
+    TTSMetrics,
+    TurnLatencyMetrics,
+)
 
 
 def log_metrics(metrics: AgentMetrics, *, logger: logging.Logger | None = None) -> None:
@@ -28,3 +37,12 @@ def log_metrics(metrics: AgentMetrics, *, logger: logging.Logger | None = None)
         )
     elif isinstance(metrics, STTMetrics):
         logger.info(f"STT metrics: audio_duration={metrics.audio_duration:.2f}")
+    elif isinstance(metrics, STTReconnectionMetrics):
+        logger.info(
+            f"STT reconnection: gap_duration={metrics.gap_duration:.2f}, replayed_audio_duration={metrics.replayed_audio_duration:.2f}, make_before_break={metrics.make_before_break}"  # noqa: E501
+        )
+    elif isinstance(metrics, TurnLatencyMetrics) and metrics.e2e_latency is not None:
+        logger.info(
+            f"Turn latency: e2e_latency={metrics.e2e_latency:.2f}, "
+            + ", ".join(f"{name}={end - start:.2f}" for name, start, end in metrics.spans())
+        )
@@ -39,6 +39,12 @@ class Plugin(ABC):  # noqa: B024
     def download_files(self) -> None:  # noqa: B027
         pass
 
+    # plugin can implement an optional model_files method, the returned files are loaded once
+    # in the forkserver and the job processes inherit their content copy-on-write instead of
+    # reading their own copy (see ipc.prewarm)
+    def model_files(self) -> list[str]:
+        return []
+
     @property
     def package(self) -> str:
         return self._package
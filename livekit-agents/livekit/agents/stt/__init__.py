@@ -1,3 +1,4 @@
+from .audio_gate import AudioGateOptions
 from .fallback_adapter import AvailabilityChangedEvent, FallbackAdapter
 from .stream_adapter import StreamAdapter, StreamAdapterWrapper
 from .stt import (
@@ -26,6 +27,7 @@ __all__ = [
     "FallbackAdapter",
     "AvailabilityChangedEvent",
     "STTError",
+    "AudioGateOptions",
 ]
 
 # Cleanup docs of unexported modules
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from livekit import rtc
+
+# conservative threshold on the mean square of the normalized samples, a frame above it may
+# contain speech
+DEFAULT_RMS_THRESHOLD = 0.004**2
+
+
+@dataclass
+class AudioGateOptions:
+    pre_roll: float = 0.5
+    """Duration of the audio buffered while the gate is closed, sent when the speech starts so
+    the provider also receives the beginning of the utterance"""
+    hangover: float = 1.0
+    """How long the audio keeps being forwarded after the end of speech"""
+    rms_threshold: float = DEFAULT_RMS_THRESHOLD
+    """Energy threshold of the built-in detector, used when the gate isn't driven by a VAD"""
+    keepalive_interval: float = 5.0
+    """Interval of the keepalive while the gate is closed, see `RecognizeStream._gate_keepalive`"""
+
+
+class AudioGate:
+    def __init__(self, opts: AudioGateOptions) -> None:
+        """Only lets the speech (plus padding) through.
+
+        The speech is detected with the frame energy unless the speaking state is provided
+        with `update_speaking` (e.g from the session's VAD events). While closed, the last
+        ``pre_roll`` seconds of audio are kept in a ring buffer.
+        """
+        self._opts = opts
+        self._pre_roll: deque[rtc.AudioFrame] = deque()
+        self._pre_roll_duration = 0.0
+        self._speaking: bool | None = None  # None uses the energy detector
+        self._open = False
+        self._silence_duration = 0.0
+        self._closed_duration = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def update_speaking(self, speaking: bool) -> list[rtc.AudioFrame]:
+        """Drive the gate from an external speech detector, the energy detector is then unused.
+
+        Returns the buffered frames to forward when the gate opens.
+        """
+        self._speaking = speaking
+        if speaking and not self._open:
+            return self._open_gate()
+
+        return []
+
+    def push(self, frame: rtc.AudioFrame) -> list[rtc.AudioFrame]:
+        """Returns the frames to forward, the gate may close after this call (see `is_open`)"""
+        speaking = self._speaking
+        if speaking is None:
+            samples = np.frombuffer(frame.data, dtype=np.int16).astype(np.float32) / 32768.0
+            speaking = bool(np.mean(np.square(samples)) > self._opts.rms_threshold)
+
+        if self._open:
+            if speaking:
+                self._silence_duration = 0.0
+            else:
+                self._silence_duration += frame.duration
+                if self._silence_duration >= self._opts.hangover:
+                    self._open = False
+                    self._closed_duration = 0.0
+
+            return [frame]
+
+        self._pre_roll.append(frame)
+        self._pre_roll_duration += frame.duration
+        if speaking:
+            return self._open_gate()
+
+        while self._pre_roll and (
+            self._pre_roll_duration - self._pre_roll[0].duration >= self._opts.pre_roll
+        ):
+            self._pre_roll_duration -= self._pre_roll.popleft().duration
+
+        self._closed_duration += frame.duration
+        return []
+
+    def keepalive_due(self) -> bool:
+        """Whether the gate has been closed for ``keepalive_interval`` since the last keepalive"""
+        if self._open or self._closed_duration < self._opts.keepalive_interval:
+            return False
+
+        self._closed_duration = 0.0
+        return True
+
+    def _open_gate(self) -> list[rtc.AudioFrame]:
+        frames = list(self._pre_roll)
+        self._pre_roll.clear()
+        self._pre_roll_duration = 0.0
+        self._silence_duration = 0.0
+        self._open = True
+        return frames
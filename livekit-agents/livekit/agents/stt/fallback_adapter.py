@@ -78,6 +78,12 @@ class FallbackAdapter(
             for _ in self._stt_instances
         ]
 
+    @property
+    def input_sample_rate(self) -> int | None:
+        # only resample upfront when all the STTs agree on the rate
+        rates = {t.input_sample_rate for t in self._stt_instances}
+        return rates.pop() if len(rates) == 1 else None
+
     async def _try_recognize(
         self,
         *,
@@ -227,6 +233,10 @@ class FallbackAdapter(
     ) -> RecognizeStream:
         return FallbackRecognizeStream(stt=self, language=language, conn_options=conn_options)
 
+    def prewarm(self) -> None:
+        if self._stt_instances:
+            self._stt_instances[0].prewarm()
+
     async def aclose(self) -> None:
         for stt_status in self._status:
             if stt_status.recovering_synthesize_task is not None:
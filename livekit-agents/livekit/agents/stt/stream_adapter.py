@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import re
 from collections.abc import AsyncIterable
+from dataclasses import dataclass
 from typing import Any
 
+from livekit import rtc
+
 from .. import utils
+from ..log import logger
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
-from ..vad import VAD, VADEventType
-from .stt import STT, RecognizeStream, SpeechEvent, SpeechEventType, STTCapabilities
+from ..vad import VAD, VADEvent, VADEventType
+from .stt import STT, RecognizeStream, SpeechData, SpeechEvent, SpeechEventType, STTCapabilities
 
 # already a retry mechanism in STT.recognize, don't retry in stream adapter
 DEFAULT_STREAM_ADAPTER_API_CONNECT_OPTIONS = APIConnectOptions(
@@ -15,11 +20,55 @@ DEFAULT_STREAM_ADAPTER_API_CONNECT_OPTIONS = APIConnectOptions(
 )
 
 
+@dataclass
+class _ChunkingOptions:
+    min_pause_duration: float
+    max_chunk_duration: float
+    chunk_overlap: float
+
+
 class StreamAdapter(STT):
-    def __init__(self, *, stt: STT, vad: VAD) -> None:
-        super().__init__(capabilities=STTCapabilities(streaming=True, interim_results=False))
+    def __init__(
+        self,
+        *,
+        stt: STT,
+        vad: VAD,
+        chunked_recognition: bool = False,
+        min_pause_duration: float = 0.3,
+        max_chunk_duration: float = 6.0,
+        chunk_overlap: float = 0.3,
+    ) -> None:
+        """
+        Create a streaming STT on top of a non-streaming one, using a VAD to segment the speech.
+
+        Args:
+            stt (STT): The non-streaming STT used to recognize the speech.
+            vad (VAD): The VAD used to detect the user speech.
+            chunked_recognition (bool): When enabled, the utterance is split into chunks while
+                the user is still speaking (at short pauses or every `max_chunk_duration`).
+                Each chunk is recognized concurrently, interim transcripts are emitted as the
+                chunks complete, and the final transcript is stitched from the chunk results.
+                Defaults to False (the whole utterance is recognized at end of speech).
+            min_pause_duration (float): Silence duration within an utterance used to cut a chunk.
+            max_chunk_duration (float): Maximum duration of a chunk, a chunk is cut when reached
+                even if no pause was detected.
+            chunk_overlap (float): Duration of audio prepended from the previous chunk, used to
+                avoid cutting words at chunk boundaries.
+        """
+        super().__init__(
+            capabilities=STTCapabilities(streaming=True, interim_results=chunked_recognition)
+        )
         self._vad = vad
         self._stt = stt
+        self._chunking_opts = (
+            _ChunkingOptions(
+                min_pause_duration=min_pause_duration,
+                max_chunk_duration=max_chunk_duration,
+                chunk_overlap=chunk_overlap,
+            )
+            if chunked_recognition
+            else None
+        )
 
         @self._stt.on("metrics_collected")
         def _forward_metrics(*args: Any, **kwargs: Any) -> None:
@@ -52,8 +101,12 @@ class StreamAdapter(STT):
             wrapped_stt=self._stt,
             language=language,
             conn_options=conn_options,
+            chunking_opts=self._chunking_opts,
         )
 
+    def prewarm(self) -> None:
+        self._stt.prewarm()
+
 
 class StreamAdapterWrapper(RecognizeStream):
     def __init__(
@@ -64,6 +117,7 @@ class StreamAdapterWrapper(RecognizeStream):
         wrapped_stt: STT,
         language: NotGivenOr[str],
         conn_options: APIConnectOptions,
+        chunking_opts: _ChunkingOptions | None = None,
     ) -> None:
         super().__init__(stt=stt, conn_options=DEFAULT_STREAM_ADAPTER_API_CONNECT_OPTIONS)
         self._vad = vad
@@ -71,6 +125,7 @@ class StreamAdapterWrapper(RecognizeStream):
         self._wrapped_stt_conn_options = conn_options
         self._vad_stream = self._vad.stream()
         self._language = language
+        self._chunking_opts = chunking_opts
 
     async def _metrics_monitor_task(self, event_aiter: AsyncIterable[SpeechEvent]) -> None:
         pass  # do nothing
@@ -117,11 +172,188 @@ class StreamAdapterWrapper(RecognizeStream):
                         )
                     )
 
+        async def _recognize_chunked(opts: _ChunkingOptions) -> None:
+            """recognize speech in chunks while the user is speaking"""
+            utterance: _ChunkedUtterance | None = None
+            try:
+                async for event in self._vad_stream:
+                    if event.type == VADEventType.START_OF_SPEECH:
+                        self._event_ch.send_nowait(SpeechEvent(SpeechEventType.START_OF_SPEECH))
+                        utterance = _ChunkedUtterance(self, opts)
+                        utterance.push_frames(event.frames)
+                    elif event.type == VADEventType.INFERENCE_DONE:
+                        if utterance is not None and event.speaking:
+                            utterance.push_frames(event.frames)
+                            utterance.maybe_cut(event)
+                    elif event.type == VADEventType.END_OF_SPEECH:
+                        self._event_ch.send_nowait(SpeechEvent(type=SpeechEventType.END_OF_SPEECH))
+                        if utterance is None:
+                            continue
+
+                        final_alt = await utterance.finalize()
+                        utterance = None
+                        if final_alt is None or not final_alt.text:
+                            continue
+
+                        self._event_ch.send_nowait(
+                            SpeechEvent(
+                                type=SpeechEventType.FINAL_TRANSCRIPT,
+                                alternatives=[final_alt],
+                            )
+                        )
+            finally:
+                if utterance is not None:
+                    await utterance.aclose()
+
         tasks = [
             asyncio.create_task(_forward_input(), name="forward_input"),
-            asyncio.create_task(_recognize(), name="recognize"),
+            asyncio.create_task(
+                _recognize()
+                if self._chunking_opts is None
+                else _recognize_chunked(self._chunking_opts),
+                name="recognize",
+            ),
         ]
         try:
             await asyncio.gather(*tasks)
         finally:
             await utils.aio.cancel_and_wait(*tasks)
+
+
+class _ChunkedUtterance:
+    """Splits a single utterance into overlapping chunks recognized concurrently"""
+
+    def __init__(self, stream: StreamAdapterWrapper, opts: _ChunkingOptions) -> None:
+        self._stream = stream
+        self._opts = opts
+        self._frames: list[rtc.AudioFrame] = []
+        self._utterance_frames: list[rtc.AudioFrame] = []  # kept to recover from chunk failures
+        self._overlap_frames: list[rtc.AudioFrame] = []
+        self._chunk_duration = 0.0
+        self._chunk_tasks: list[asyncio.Task[SpeechData | None]] = []
+        self._interim_sent = 0
+        self._finalizing = False
+
+    def push_frames(self, frames: list[rtc.AudioFrame]) -> None:
+        for frame in frames:
+            self._frames.append(frame)
+            self._utterance_frames.append(frame)
+            self._chunk_duration += frame.duration
+
+    def maybe_cut(self, ev: VADEvent) -> None:
+        if self._chunk_duration >= self._opts.max_chunk_duration or (
+            ev.raw_accumulated_silence >= self._opts.min_pause_duration
+            and self._chunk_duration >= self._opts.min_pause_duration * 2
+        ):
+            self._cut()
+
+    async def finalize(self) -> SpeechData | None:
+        self._finalizing = True
+        if self._frames:
+            self._cut()
+
+        chunk_results = await asyncio.gather(*self._chunk_tasks, return_exceptions=True)
+        self._chunk_tasks = []
+        if any(isinstance(res, BaseException) for res in chunk_results):
+            # the stitched transcript would miss words, recognize the whole utterance instead
+            logger.warning(
+                "failed to recognize a chunk, recognizing the whole utterance",
+                exc_info=next(res for res in chunk_results if isinstance(res, BaseException)),
+            )
+            return await self._recognize_chunk(self._utterance_frames)
+
+        results = [alt for alt in chunk_results if isinstance(alt, SpeechData)]
+        if not results:
+            return None
+
+        return SpeechData(
+            language=results[0].language,
+            text=_stitch_transcripts([alt.text for alt in results]),
+            start_time=results[0].start_time,
+            end_time=results[-1].end_time,
+            confidence=min(alt.confidence for alt in results),
+        )
+
+    async def aclose(self) -> None:
+        await utils.aio.cancel_and_wait(*self._chunk_tasks)
+
+    def _cut(self) -> None:
+        chunk_frames = self._overlap_frames + self._frames
+        self._overlap_frames = _tail_frames(self._frames, self._opts.chunk_overlap)
+        self._frames = []
+        self._chunk_duration = 0.0
+
+        task = asyncio.create_task(self._recognize_chunk(chunk_frames))
+        task.add_done_callback(lambda _: self._emit_interim())
+        self._chunk_tasks.append(task)
+
+    async def _recognize_chunk(self, frames: list[rtc.AudioFrame]) -> SpeechData | None:
+        t_event = await self._stream._wrapped_stt.recognize(
+            buffer=utils.merge_frames(frames),
+            language=self._stream._language,
+            conn_options=self._stream._wrapped_stt_conn_options,
+        )
+        if not t_event.alternatives:
+            return None
+
+        return t_event.alternatives[0]
+
+    def _emit_interim(self) -> None:
+        # only emit the contiguous prefix of recognized chunks, the interim transcript
+        # must always extend the previous one
+        done = 0
+        for task in self._chunk_tasks:
+            if not task.done() or task.cancelled() or task.exception() is not None:
+                break
+            done += 1
+
+        if done <= self._interim_sent or (self._finalizing and done == len(self._chunk_tasks)):
+            return  # nothing new, or the final transcript is about to be emitted
+
+        self._interim_sent = done
+        alts = [alt for task in self._chunk_tasks[:done] if (alt := task.result()) is not None]
+        text = _stitch_transcripts([alt.text for alt in alts])
+        if not text:
+            return
+
+        self._stream._event_ch.send_nowait(
+            SpeechEvent(
+                type=SpeechEventType.INTERIM_TRANSCRIPT,
+                alternatives=[SpeechData(language=alts[0].language, text=text)],
+            )
+        )
+
+
+def _tail_frames(frames: list[rtc.AudioFrame], duration: float) -> list[rtc.AudioFrame]:
+    tail: list[rtc.AudioFrame] = []
+    acc = 0.0
+    for frame in reversed(frames):
+        if acc >= duration:
+            break
+        tail.insert(0, frame)
+        acc += frame.duration
+    return tail
+
+
+_MAX_OVERLAP_WORDS = 8
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+def _stitch_transcripts(texts: list[str]) -> str:
+    """Join chunk transcripts, removing the words duplicated by the audio overlap"""
+    words: list[str] = []
+    for text in texts:
+        new_words = text.split()
+        max_k = min(len(words), len(new_words), _MAX_OVERLAP_WORDS)
+        for k in range(max_k, 0, -1):
+            if [_normalize_word(w) for w in words[-k:]] == [
+                _normalize_word(w) for w in new_words[:k]
+            ]:
+                new_words = new_words[k:]
+                break
+        words.extend(new_words)
+
+    return " ".join(words)
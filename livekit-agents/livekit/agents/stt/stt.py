@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import dataclasses
 import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterable, AsyncIterator
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from dataclasses import dataclass, field
 from enum import Enum, unique
 from types import TracebackType
@@ -15,10 +18,19 @@ from livekit import rtc
 
 from .._exceptions import APIConnectionError, APIError
 from ..log import logger
-from ..metrics import STTMetrics
-from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
+from ..metrics import STTMetrics, STTReconnectionMetrics
+from ..metrics.registry import get_process_registry
+from ..types import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    DEFAULT_INPUT_QUEUE_OPTIONS,
+    NOT_GIVEN,
+    APIConnectOptions,
+    InputQueueOptions,
+    NotGivenOr,
+)
 from ..utils import AudioBuffer, aio, is_given
-from ..utils.audio import calculate_audio_duration
+from ..utils.audio import _can_coalesce_frames, _coalesce_frames, calculate_audio_duration
+from .audio_gate import AudioGate, AudioGateOptions
 
 
 @unique
@@ -86,6 +98,7 @@ class STT(
         super().__init__()
         self._capabilities = capabilities
         self._label = f"{type(self).__module__}.{type(self).__name__}"
+        self._input_queue_options = DEFAULT_INPUT_QUEUE_OPTIONS
 
     @property
     def label(self) -> str:
@@ -95,6 +108,24 @@ class STT(
     def capabilities(self) -> STTCapabilities:
         return self._capabilities
 
+    @property
+    def input_queue_options(self) -> InputQueueOptions:
+        """Bound and overload policy of the input queue of the streams created afterwards"""
+        return self._input_queue_options
+
+    @input_queue_options.setter
+    def input_queue_options(self, opts: InputQueueOptions) -> None:
+        self._input_queue_options = opts
+
+    @property
+    def input_sample_rate(self) -> int | None:
+        """The sample rate the audio is sent at, None if any rate is accepted.
+
+        When set, the session resamples the user audio to this rate before pushing it to the
+        streams, sharing the resampled audio with the other consumers needing the same rate.
+        """
+        return None
+
     @abstractmethod
     async def _recognize_impl(
         self,
@@ -180,6 +211,10 @@ class STT(
             "streaming is not supported by this STT, please use a different STT or use a StreamAdapter"  # noqa: E501
         )
 
+    def prewarm(self) -> None:
+        """Pre-warm connection to the STT service"""
+        pass
+
     async def aclose(self) -> None:
         """Close the STT, and every stream/requests associated with it"""
         ...
@@ -208,6 +243,7 @@ class RecognizeStream(ABC):
         stt: STT,
         conn_options: APIConnectOptions,
         sample_rate: NotGivenOr[int] = NOT_GIVEN,
+        max_replay_duration: float = 5.0,
     ):
         """
         Args:
@@ -216,11 +252,24 @@ class RecognizeStream(ABC):
             If specified, the audio input will be automatically resampled to match
             the given sample rate before being processed for Speech-to-Text.
             If not provided (None), the input will retain its original sample rate.
+        max_replay_duration : float, optional
+            Maximum duration of the audio replayed to a new connection (after an error or a
+            handoff), the audio pushed since the last final transcript is replayed.
         """
         self._stt = stt
         self._conn_options = conn_options
-        self._input_ch = aio.Chan[Union[rtc.AudioFrame, RecognizeStream._FlushSentinel]]()
-        self._event_ch = aio.Chan[SpeechEvent]()
+        self._input_ch = self._new_input_ch()
+        self._event_ch = _EventChan()
+
+        # make-before-break reconnection, see _handoff
+        self._max_replay_duration = max_replay_duration
+        self._replay_ring: deque[tuple[float, _InputItem]] = deque()
+        self._replay_ring_duration = 0.0
+        self._retiring_ch: _InputChan | None = None
+        self._handoff_ev = asyncio.Event()
+        self._last_final_at = 0.0
+        self._connection_id = 0
+        self._handoff_dedup: _HandoffDedup | None = None
 
         self._event_aiter, monitor_aiter = aio.itertools.tee(self._event_ch, 2)
         self._metrics_task = asyncio.create_task(
@@ -234,16 +283,128 @@ class RecognizeStream(ABC):
         self._needed_sr = sample_rate if is_given(sample_rate) else None
         self._pushed_sr = 0
         self._resampler: rtc.AudioResampler | None = None
+        self._audio_gate: AudioGate | None = None
 
     @abstractmethod
     async def _run(self) -> None: ...
 
+    def _handoff(self) -> None:
+        """Replace the current connection without interrupting the recognition.
+
+        A new `_run` is started on a new input channel, filled with the audio pushed since the
+        last final transcript. The current connection keeps receiving the audio until the new
+        one consumes its first frame, its input is then ended so it can flush its last results
+        before `_run` returns. The replayed audio is transcribed by both connections, the
+        duplicated words are removed (see `_HandoffDedup`).
+
+        Plugins call it when the provider session is about to expire (e.g max duration).
+        """
+        self._handoff_ev.set()
+
+    async def _run_with_handoffs(self) -> None:
+        retiring: set[asyncio.Task[None]] = set()
+
+        def _on_retired(task: asyncio.Task[None]) -> None:
+            retiring.discard(task)
+            if not task.cancelled() and (exc := task.exception()):
+                logger.warning(
+                    "retired STT connection failed", exc_info=exc, extra={"stt": self._stt._label}
+                )
+
+        run_task = self._start_run()
+        handoff_task: asyncio.Task[bool] | None = None
+        try:
+            while True:
+                handoff_task = asyncio.create_task(self._handoff_ev.wait())
+                await asyncio.wait([run_task, handoff_task], return_when=asyncio.FIRST_COMPLETED)
+                if run_task.done():
+                    if retiring:
+                        # let the retired connections flush their last transcripts
+                        self._end_retiring_input()
+                        await asyncio.wait(retiring, timeout=self._conn_options.timeout)
+
+                    return run_task.result()
+
+                self._handoff_ev.clear()
+                if self._input_ch.closed or self._retiring_ch is not None:
+                    continue  # nothing to hand off or a handoff is already in progress
+
+                self._retiring_ch = self._replace_input(make_before_break=True)
+                run_task.add_done_callback(_on_retired)
+                retiring.add(run_task)
+                retiring_id = self._connection_id
+                run_task = self._start_run()
+                self._handoff_dedup = _HandoffDedup(retiring_id, self._connection_id)
+        finally:
+            self._end_retiring_input()
+            if handoff_task is not None:
+                await aio.cancel_and_wait(handoff_task)
+
+            await aio.cancel_and_wait(run_task, *retiring)
+
+    def _start_run(self) -> asyncio.Task[None]:
+        """Start a new connection, the events it emits are tagged with its id"""
+        self._connection_id += 1
+        ctx = contextvars.copy_context()
+        ctx.run(_connection_id.set, self._connection_id)
+        return ctx.run(asyncio.create_task, self._run())
+
+    def _replace_input(self, *, make_before_break: bool) -> _InputChan:
+        """Swap the input channel with a new one filled with the replayed audio,
+        returns the previous channel"""
+        prev_ch = self._input_ch
+        self._input_ch = new_ch = self._new_input_ch()
+
+        replayed = 0.0
+        for pushed_at, item in self._replay_ring:
+            if pushed_at > self._last_final_at:
+                new_ch.send_nowait(item)
+                if isinstance(item, rtc.AudioFrame):
+                    replayed += item.duration
+
+        if prev_ch.closed:
+            new_ch.close()
+
+        def _on_first_recv() -> None:
+            now = time.time()
+            gap = 0.0
+            if make_before_break:
+                # the previous connection received the audio until now
+                if self._retiring_ch is prev_ch:
+                    self._end_retiring_input()
+            elif prev_ch.last_recv_at:
+                gap = now - prev_ch.last_recv_at
+
+            self._stt.emit(
+                "metrics_collected",
+                STTReconnectionMetrics(
+                    label=self._stt._label,
+                    timestamp=now,
+                    gap_duration=gap,
+                    replayed_audio_duration=replayed,
+                    make_before_break=make_before_break,
+                ),
+            )
+
+        new_ch.on_first_recv = _on_first_recv
+        return prev_ch
+
+    def _new_input_ch(self) -> _InputChan:
+        input_ch = _InputChan(self._stt.input_queue_options)
+        get_process_registry().watch_queue(input_ch, self._stt.label)
+        return input_ch
+
+    def _end_retiring_input(self) -> None:
+        if self._retiring_ch is not None:
+            self._retiring_ch.close()
+            self._retiring_ch = None
+
     async def _main_task(self) -> None:
         max_retries = self._conn_options.max_retry
 
         while self._num_retries <= max_retries:
             try:
-                return await self._run()
+                return await self._run_with_handoffs()
             except APIError as e:
                 if max_retries == 0:
                     self._emit_error(e, recoverable=False)
@@ -268,6 +429,10 @@ class RecognizeStream(ABC):
                     )
                     await asyncio.sleep(retry_interval)
 
+                    # the audio that piled up while reconnecting is dropped, only the audio
+                    # since the last final transcript (bounded) is replayed
+                    self._replace_input(make_before_break=False)
+
                 self._num_retries += 1
 
             except Exception as e:
@@ -307,6 +472,7 @@ class RecognizeStream(ABC):
             elif ev.type == SpeechEventType.FINAL_TRANSCRIPT:
                 # reset the retry count after a successful recognition
                 self._num_retries = 0
+                self._last_final_at = time.time()
 
     def push_frame(self, frame: rtc.AudioFrame) -> None:
         """Push audio to be recognized"""
@@ -329,9 +495,57 @@ class RecognizeStream(ABC):
         if self._resampler:
             frames = self._resampler.push(frame)
             for frame in frames:
-                self._input_ch.send_nowait(frame)
+                self._forward_frame(frame)
         else:
-            self._input_ch.send_nowait(frame)
+            self._forward_frame(frame)
+
+    def enable_audio_gate(self, opts: AudioGateOptions | None = None) -> None:
+        """Only forward the speech to the provider instead of the continuous audio.
+
+        The speech is detected with the frame energy, unless the speaking state is provided
+        with `update_speaking`. The audio preceding the speech (``pre_roll``) is buffered and
+        sent when the speech starts, and the stream is flushed when the gate closes.
+        """
+        self._audio_gate = AudioGate(opts or AudioGateOptions())
+
+    def update_speaking(self, speaking: bool) -> None:
+        """Drive the audio gate with the speaking state of a VAD, no-op if the gate isn't enabled"""
+        if self._audio_gate is None or self._input_ch.closed:
+            return
+
+        for frame in self._audio_gate.update_speaking(speaking):
+            self._send_input(frame)
+
+    def _forward_frame(self, frame: rtc.AudioFrame) -> None:
+        if self._audio_gate is None:
+            self._send_input(frame)
+            return
+
+        was_open = self._audio_gate.is_open
+        for f in self._audio_gate.push(frame):
+            self._send_input(f)
+
+        if was_open and not self._audio_gate.is_open:
+            # end of the speech segment
+            self._send_input(self._FlushSentinel())
+        elif self._audio_gate.keepalive_due():
+            self._gate_keepalive(frame)
+
+    def _gate_keepalive(self, frame: rtc.AudioFrame) -> None:
+        """Called every ``keepalive_interval`` while the audio gate is closed.
+
+        By default 100ms of silence is forwarded so the provider doesn't close the idle
+        connection, plugins with a dedicated keepalive message can override it.
+        """
+        samples = frame.sample_rate // 10
+        self._send_input(
+            rtc.AudioFrame(
+                b"\x00\x00" * samples * frame.num_channels,
+                sample_rate=frame.sample_rate,
+                num_channels=frame.num_channels,
+                samples_per_channel=samples,
+            )
+        )
 
     def flush(self) -> None:
         """Mark the end of the current segment"""
@@ -340,33 +554,73 @@ class RecognizeStream(ABC):
 
         if self._resampler:
             for frame in self._resampler.flush():
-                self._input_ch.send_nowait(frame)
+                self._send_input(frame)
 
-        self._input_ch.send_nowait(self._FlushSentinel())
+        self._send_input(self._FlushSentinel())
 
     def end_input(self) -> None:
         """Mark the end of input, no more audio will be pushed"""
         self.flush()
         self._input_ch.close()
+        self._end_retiring_input()
+
+    def _send_input(self, item: _InputItem) -> None:
+        self._input_ch.send_nowait(item)
+        if self._retiring_ch is not None:
+            self._retiring_ch.send_nowait(item)
+
+        self._replay_ring.append((time.time(), item))
+        if isinstance(item, rtc.AudioFrame):
+            self._replay_ring_duration += item.duration
+
+        while self._replay_ring_duration > self._max_replay_duration:
+            _, dropped = self._replay_ring.popleft()
+            if isinstance(dropped, rtc.AudioFrame):
+                self._replay_ring_duration -= dropped.duration
 
     async def aclose(self) -> None:
         """Close ths stream immediately"""
         self._input_ch.close()
+        self._end_retiring_input()
         await aio.cancel_and_wait(self._task)
 
         if self._metrics_task is not None:
             await self._metrics_task
 
     async def __anext__(self) -> SpeechEvent:
-        try:
-            val = await self._event_aiter.__anext__()
-        except StopAsyncIteration:
-            if not self._task.cancelled() and (exc := self._task.exception()):
-                raise exc  # noqa: B904
-
-            raise StopAsyncIteration from None
+        while True:
+            try:
+                val = await self._event_aiter.__anext__()
+            except StopAsyncIteration:
+                if not self._task.cancelled() and (exc := self._task.exception()):
+                    raise exc  # noqa: B904
+
+                raise StopAsyncIteration from None
+
+            if val.type != SpeechEventType.FINAL_TRANSCRIPT or not val.alternatives:
+                return val
+
+            connection_id = self._event_ch.pop_source(val)
+            dedup = self._handoff_dedup
+            if dedup is None or connection_id not in (dedup.retiring_id, dedup.new_id):
+                return val
+
+            # the replayed audio is transcribed by both connections
+            text = val.alternatives[0].text
+            deduped = dedup.strip(connection_id, text)
+            if not deduped:
+                continue
+
+            if deduped != text:
+                val = dataclasses.replace(
+                    val,
+                    alternatives=[
+                        dataclasses.replace(val.alternatives[0], text=deduped),
+                        *val.alternatives[1:],
+                    ],
+                )
 
-        return val
+            return val
 
     def __aiter__(self) -> AsyncIterator[SpeechEvent]:
         return self
@@ -394,3 +648,92 @@ class RecognizeStream(ABC):
 
 
 SpeechStream = RecognizeStream  # deprecated alias
+
+_InputItem = Union[rtc.AudioFrame, RecognizeStream._FlushSentinel]
+
+# id of the connection (`RecognizeStream._run`) running in the current context
+_connection_id = contextvars.ContextVar[int]("stt_connection_id", default=0)
+
+
+class _EventChan(aio.Chan[SpeechEvent]):
+    """Records which connection emitted each final transcript"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sources: dict[int, tuple[SpeechEvent, int]] = {}
+
+    def send_nowait(self, value: SpeechEvent) -> None:
+        super().send_nowait(value)
+        if value.type == SpeechEventType.FINAL_TRANSCRIPT:
+            # keep a reference, the id can't be reused before the event is consumed
+            self._sources[id(value)] = (value, _connection_id.get())
+
+    def pop_source(self, event: SpeechEvent) -> int:
+        source = self._sources.pop(id(event), None)
+        return source[1] if source is not None and source[0] is event else 0
+
+
+class _InputChan(aio.BoundedChan[_InputItem]):
+    """Input channel recording when its audio is consumed, used to measure reconnection gaps"""
+
+    def __init__(self, opts: InputQueueOptions) -> None:
+        super().__init__(
+            opts.max_size,
+            policy=opts.policy,
+            can_coalesce=_can_coalesce_frames,
+            coalesce=_coalesce_frames,
+            droppable=lambda item: isinstance(item, rtc.AudioFrame),
+        )
+        self.first_recv_at: float | None = None
+        self.last_recv_at = 0.0
+        self.on_first_recv: Callable[[], None] | None = None
+
+    def recv_nowait(self) -> _InputItem:
+        item = super().recv_nowait()
+        self.last_recv_at = time.time()
+        if self.first_recv_at is None:
+            self.first_recv_at = self.last_recv_at
+            if self.on_first_recv is not None:
+                self.on_first_recv()
+
+        return item
+
+
+def _normalize_word(word: str) -> str:
+    return "".join(c for c in word.lower() if c.isalnum())
+
+
+class _HandoffDedup:
+    """De-duplicates the final transcripts of the two connections of a handoff.
+
+    Both connections transcribe the audio from the same point (the last final transcript
+    before the handoff). A transcript can only repeat the words the other connection already
+    emitted at the same position, only this common prefix is removed.
+    """
+
+    def __init__(self, retiring_id: int, new_id: int) -> None:
+        self.retiring_id = retiring_id
+        self.new_id = new_id
+        # normalized words emitted by each connection since the handoff
+        self._words: dict[int, list[str]] = {retiring_id: [], new_id: []}
+
+    def strip(self, connection_id: int, text: str) -> str:
+        other_id = self.new_id if connection_id == self.retiring_id else self.retiring_id
+        own, other = self._words[connection_id], self._words[other_id]
+        emitted = other[len(own) :]
+
+        words = text.split()
+        matched = stripped = 0
+        for i, word in enumerate(words):
+            norm = _normalize_word(word)
+            if not norm:
+                continue  # punctuation
+
+            if matched >= len(emitted) or norm != emitted[matched]:
+                break
+
+            matched += 1
+            stripped = i + 1
+
+        own.extend(w for w in map(_normalize_word, words) if w)
+        return " ".join(words[stripped:])
@@ -8,7 +8,7 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncIterable, AsyncIterator
 from dataclasses import dataclass
 from types import TracebackType
-from typing import Generic, Literal, TypeVar, Union
+from typing import Any, Generic, Literal, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -17,7 +17,13 @@ from livekit import rtc
 from .._exceptions import APIError
 from ..log import logger
 from ..metrics import TTSMetrics
-from ..types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
+from ..metrics.registry import get_process_registry
+from ..types import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    DEFAULT_INPUT_QUEUE_OPTIONS,
+    APIConnectOptions,
+    InputQueueOptions,
+)
 from ..utils import aio, audio, codecs, log_exceptions
 
 lk_dump_tts = int(os.getenv("LK_DUMP_TTS", 0))
@@ -72,6 +78,7 @@ class TTS(
         self._sample_rate = sample_rate
         self._num_channels = num_channels
         self._label = f"{type(self).__module__}.{type(self).__name__}"
+        self._input_queue_options = DEFAULT_INPUT_QUEUE_OPTIONS
 
     @property
     def label(self) -> str:
@@ -81,6 +88,18 @@ class TTS(
     def capabilities(self) -> TTSCapabilities:
         return self._capabilities
 
+    @property
+    def input_queue_options(self) -> InputQueueOptions:
+        """Bound and overload policy of the text input of the streams and of the audio pushed
+        by the provider, "coalesce" merges the pending text or audio chunks without loss.
+        Text and encoded audio can't be dropped, "drop_oldest" isn't allowed."""
+        return self._input_queue_options
+
+    @input_queue_options.setter
+    def input_queue_options(self, opts: InputQueueOptions) -> None:
+        _check_lossless(opts)
+        self._input_queue_options = opts
+
     @property
     def sample_rate(self) -> int:
         return self._sample_rate
@@ -201,7 +220,11 @@ class ChunkedStream(ABC):
 
     async def _main_task(self) -> None:
         for i in range(self._conn_options.max_retry + 1):
-            output_emitter = AudioEmitter(label=self._tts.label, dst_ch=self._event_ch)
+            output_emitter = AudioEmitter(
+                label=self._tts.label,
+                dst_ch=self._event_ch,
+                queue_options=self._tts.input_queue_options,
+            )
             try:
                 await self._run(output_emitter)
 
@@ -284,7 +307,13 @@ class SynthesizeStream(ABC):
         super().__init__()
         self._tts = tts
         self._conn_options = conn_options
-        self._input_ch = aio.Chan[Union[str, SynthesizeStream._FlushSentinel]]()
+        self._input_ch = aio.BoundedChan[Union[str, SynthesizeStream._FlushSentinel]](
+            tts.input_queue_options.max_size,
+            policy=tts.input_queue_options.policy,
+            can_coalesce=_can_coalesce_text,
+            coalesce=_coalesce_text,
+        )
+        get_process_registry().watch_queue(self._input_ch, tts.label)
         self._event_ch = aio.Chan[SynthesizedAudio]()
         self._tee = aio.itertools.tee(self._event_ch, 2)
         self._event_aiter, self._monitor_aiter = self._tee
@@ -305,7 +334,11 @@ class SynthesizeStream(ABC):
 
     async def _main_task(self) -> None:
         for i in range(self._conn_options.max_retry + 1):
-            output_emitter = AudioEmitter(label=self._tts.label, dst_ch=self._event_ch)
+            output_emitter = AudioEmitter(
+                label=self._tts.label,
+                dst_ch=self._event_ch,
+                queue_options=self._tts.input_queue_options,
+            )
             try:
                 await self._run(output_emitter)
 
@@ -513,9 +546,12 @@ class AudioEmitter:
         *,
         label: str,
         dst_ch: aio.Chan[SynthesizedAudio],
+        queue_options: InputQueueOptions = DEFAULT_INPUT_QUEUE_OPTIONS,
     ) -> None:
+        _check_lossless(queue_options)
         self._dst_ch = dst_ch
         self._label = label
+        self._queue_options = queue_options
         self._request_id: str = ""
         self._started = False
         self._num_segments = 0
@@ -563,14 +599,20 @@ class AudioEmitter:
         self._num_channels = num_channels
         self._streaming = stream
 
-        self._write_ch = aio.Chan[
+        self._write_ch = aio.BoundedChan[
             Union[
                 bytes,
                 AudioEmitter._FlushSegment,
                 AudioEmitter._StartSegment,
                 AudioEmitter._EndSegment,
             ]
-        ]()
+        ](
+            self._queue_options.max_size,
+            policy=self._queue_options.policy,
+            can_coalesce=_can_coalesce_bytes,
+            coalesce=_coalesce_bytes,
+        )
+        get_process_registry().watch_queue(self._write_ch, self._label)
         self._main_atask = asyncio.create_task(self._main_task(), name="AudioEmitter._main_task")
 
         if not self._streaming:
@@ -858,3 +900,26 @@ class AudioEmitter:
             if audio_decoder and decode_atask:
                 await audio_decoder.aclose()
                 await aio.cancel_and_wait(decode_atask)
+
+
+def _check_lossless(opts: InputQueueOptions) -> None:
+    if opts.max_size and opts.policy == "drop_oldest":
+        raise ValueError(
+            'the TTS input can\'t be dropped, use the "coalesce" or "raise" overload policy'
+        )
+
+
+def _can_coalesce_text(a: object, b: object) -> bool:
+    return isinstance(a, str) and isinstance(b, str)
+
+
+def _coalesce_text(values: list[Any]) -> str:
+    return "".join(values)
+
+
+def _can_coalesce_bytes(a: object, b: object) -> bool:
+    return isinstance(a, bytes) and isinstance(b, bytes)
+
+
+def _coalesce_bytes(values: list[Any]) -> bytes:
+    return b"".join(values)
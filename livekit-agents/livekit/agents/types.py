@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Literal, TypeVar, Union
+from typing import TYPE_CHECKING, Literal, TypeVar, Union
 
 from typing_extensions import TypeAlias
 
+if TYPE_CHECKING:
+    from .utils.aio import OverloadPolicy
+
 ATTRIBUTE_TRANSCRIPTION_SEGMENT_ID = "lk.segment_id"
 ATTRIBUTE_TRANSCRIPTION_TRACK_ID = "lk.transcribed_track_id"
 ATTRIBUTE_TRANSCRIPTION_FINAL = "lk.transcription_final"
@@ -80,3 +85,27 @@ class APIConnectOptions:
 
 
 DEFAULT_API_CONNECT_OPTIONS = APIConnectOptions()
+
+
+@dataclass(frozen=True)
+class InputQueueOptions:
+    max_size: int = 0
+    """
+    Maximum number of pending inputs of a stream (e.g audio frames or text tokens),
+    0 means unbounded.
+    """
+
+    policy: OverloadPolicy = "drop_oldest"
+    """
+    What to do when the queue is full: "drop_oldest" drops the oldest pending audio so the
+    stream catches up with the live input (not allowed for the TTS, text and encoded audio
+    can't be dropped), "coalesce" merges the input into the last pending one, "raise" raises
+    `utils.aio.ChanFull` to the caller.
+    """
+
+    def __post_init__(self) -> None:
+        if self.max_size < 0:
+            raise ValueError("max_size must be greater than or equal to 0")
+
+
+DEFAULT_INPUT_QUEUE_OPTIONS = InputQueueOptions()
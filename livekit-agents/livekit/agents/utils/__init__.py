@@ -1,15 +1,56 @@
-from livekit import rtc
+import importlib
+import typing
 
-from . import aio, audio, codecs, http_context, hw, images
-from .audio import AudioBuffer, combine_frames, merge_frames
+from . import aio
 from .connection_pool import ConnectionPool
 from .exp_filter import ExpFilter
 from .log import log_exceptions
 from .misc import is_given, shortuuid, time_ms
 from .moving_average import MovingAverage
-from .participant import wait_for_participant
 
-EventEmitter = rtc.EventEmitter
+if typing.TYPE_CHECKING:
+    from livekit import rtc
+
+    from . import audio, codecs, http_context, hw, images, serialization
+    from .audio import AudioBuffer, combine_frames, merge_frames
+    from .participant import wait_for_participant
+    from .ws_multiplexer import WebSocketMultiplexer, ping_websocket
+
+    EventEmitter = rtc.EventEmitter
+
+# these pull in livekit.rtc, aiohttp or av, they're imported on first access (PEP 562)
+_LAZY_SUBMODULES = {"audio", "codecs", "http_context", "hw", "images", "serialization"}
+
+_LAZY_ATTRS = {
+    "AudioBuffer": ".audio",
+    "combine_frames": ".audio",
+    "merge_frames": ".audio",
+    "wait_for_participant": ".participant",
+    "WebSocketMultiplexer": ".ws_multiplexer",
+    "ping_websocket": ".ws_multiplexer",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    value: typing.Any
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    elif name == "EventEmitter":
+        from livekit import rtc
+
+        value = rtc.EventEmitter
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_ATTRS) | {"EventEmitter"})
+
 
 __all__ = [
     "AudioBuffer",
@@ -27,8 +68,11 @@ __all__ = [
     "audio",
     "aio",
     "hw",
+    "serialization",
     "is_given",
     "ConnectionPool",
+    "WebSocketMultiplexer",
+    "ping_websocket",
     "wait_for_participant",
 ]
 
@@ -1,5 +1,13 @@
 from . import debug, duplex_unix, itertools
-from .channel import Chan, ChanClosed, ChanReceiver, ChanSender
+from .channel import (
+    BoundedChan,
+    Chan,
+    ChanClosed,
+    ChanFull,
+    ChanReceiver,
+    ChanSender,
+    OverloadPolicy,
+)
 from .interval import Interval, interval
 from .sleep import Sleep, SleepFinished, sleep
 from .task_set import TaskSet
@@ -8,7 +16,10 @@ from .wait_group import WaitGroup
 
 __all__ = [
     "ChanClosed",
+    "ChanFull",
     "Chan",
+    "BoundedChan",
+    "OverloadPolicy",
     "ChanSender",
     "ChanReceiver",
     "Interval",
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from collections import deque
-from collections.abc import AsyncIterator
-from typing import Generic, Protocol, TypeVar
+from collections.abc import AsyncIterator, Callable
+from typing import Generic, Literal, Protocol, TypeVar
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -176,3 +177,109 @@ class Chan(Generic[T]):
             return await self.recv()
         except ChanClosed:
             raise StopAsyncIteration from None
+
+
+OverloadPolicy = Literal["drop_oldest", "coalesce", "raise"]
+"""
+What a `BoundedChan` does when a value is sent while it's full:
+
+- "drop_oldest": drop the oldest pending values until the channel is half full, so the
+  consumer catches up with the most recent data
+- "coalesce": merge the value into the last pending one, nothing is lost
+- "raise": raise `ChanFull`
+"""
+
+
+class BoundedChan(Chan[T]):
+    def __init__(
+        self,
+        maxsize: int = 0,
+        *,
+        policy: OverloadPolicy = "drop_oldest",
+        can_coalesce: Callable[[T, T], bool] | None = None,
+        coalesce: Callable[[list[T]], T] | None = None,
+        droppable: Callable[[T], bool] | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """Channel whose `send_nowait` never blocks nor grows past ``maxsize`` (0 is unbounded).
+
+        Args:
+            maxsize: The maximum number of pending values.
+            policy: What to do when the channel is full, see `OverloadPolicy`.
+            can_coalesce: Whether a value can be merged into the previous one, values that
+                can't (e.g sentinels) are queued even if the channel is full.
+            coalesce: Merge a run of pending values, it's called once when the merged value
+                is received so merging doesn't copy the pending data on every send.
+            droppable: Whether a value can be dropped, by default all values can.
+        """
+        super().__init__(loop=loop)
+        self._limit = max(maxsize, 0)
+        self._policy = policy
+        self._can_coalesce = can_coalesce
+        self._coalesce = coalesce
+        self._droppable = droppable
+        self._sent_at: deque[float] = deque()
+        # values merged into the last pending one, joined when it's received
+        self._tail: list[T] = []
+        self.dropped = 0
+        """Number of values dropped by the "drop_oldest" policy"""
+        self.coalesced = 0
+        """Number of values merged by the "coalesce" policy"""
+
+    @property
+    def oldest_age(self) -> float:
+        """How long the oldest pending value has been waiting, in seconds"""
+        return time.monotonic() - self._sent_at[0] if self._sent_at else 0.0
+
+    def send_nowait(self, value: T) -> None:
+        if self._closed:
+            raise ChanClosed
+
+        if self._limit and len(self._queue) >= self._limit:
+            if self._policy == "raise":
+                raise ChanFull
+            elif self._policy == "coalesce":
+                if self._can_coalesce is not None and self._coalesce is not None:
+                    last = self._tail[-1] if self._tail else self._queue[-1]
+                    if self._can_coalesce(last, value):
+                        if not self._tail:
+                            self._tail.append(last)
+                        self._tail.append(value)
+                        self.coalesced += 1
+                        return
+            else:
+                self._drop_oldest(len(self._queue) - self._limit // 2 + 1)
+
+        self._join_tail()
+        self._queue.append(value)
+        self._sent_at.append(time.monotonic())
+        self._wakeup_next(self._gets)
+
+    def recv_nowait(self) -> T:
+        if len(self._queue) == 1:
+            self._join_tail()
+
+        item = super().recv_nowait()
+        self._sent_at.popleft()
+        return item
+
+    def _join_tail(self) -> None:
+        if self._tail:
+            assert self._coalesce is not None
+            self._queue[-1] = self._coalesce(self._tail)
+            self._tail = []
+
+    def _drop_oldest(self, count: int) -> None:
+        kept: deque[T] = deque()
+        kept_at: deque[float] = deque()
+        while self._queue and count > 0:
+            value, sent_at = self._queue.popleft(), self._sent_at.popleft()
+            if self._droppable is None or self._droppable(value):
+                self.dropped += 1
+                count -= 1
+            else:
+                kept.append(value)
+                kept_at.append(sent_at)
+
+        self._queue.extendleft(reversed(kept))
+        self._sent_at.extendleft(reversed(kept_at))
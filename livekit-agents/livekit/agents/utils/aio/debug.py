@@ -1,22 +1,198 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import sys
+import threading
 import time
+import traceback
 from asyncio.base_events import _format_handle  # type: ignore
+from collections import deque
 from typing import Any
 
 from ...log import logger
 
+# upper bounds (in seconds) of the scheduling lag histogram buckets, the last bucket is +Inf
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_hook_lock = threading.Lock()
+_hook_installed = False
+_slow_duration = float("inf")
+_monitors: dict[int, LoopMonitor] = {}  # thread ident -> monitor
+
+
+def _install_hook() -> None:
+    global _hook_installed
+
+    with _hook_lock:
+        if _hook_installed:
+            return
+
+        _run = asyncio.events.Handle._run
+        get_ident = threading.get_ident
+
+        def instrumented(self: Any) -> Any:
+            monitor = _monitors.get(get_ident())
+            start = time.monotonic()
+            if monitor is not None:
+                monitor._running = (self, start)
+
+            try:
+                return _run(self)
+            finally:
+                dt = time.monotonic() - start
+                if monitor is not None:
+                    monitor._running = None
+                    if dt >= monitor._slow_callback_threshold:
+                        monitor._on_slow_callback(self, dt)
+
+                if dt >= _slow_duration:
+                    logger.warning(
+                        "Running %s took too long: %.2f seconds", _format_handle(self), dt
+                    )
+
+        asyncio.events.Handle._run = instrumented  # type: ignore
+        _hook_installed = True
+
 
 def hook_slow_callbacks(slow_duration: float) -> None:
-    _run = asyncio.events.Handle._run
+    global _slow_duration
+
+    _slow_duration = slow_duration
+    _install_hook()
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        *,
+        lag_interval: float = 0.25,
+        slow_callback_threshold: float = 0.1,
+        max_samples: int = 32,
+        max_lag_points: int = 512,
+    ) -> None:
+        """Always-on monitor of an asyncio event loop.
+
+        Measures the scheduling lag of the loop (how late a timer fires compared to when it
+        was scheduled) and samples the stack of callbacks that block the loop for longer
+        than ``slow_callback_threshold``. The stack is captured from a watchdog thread while
+        the callback is still running, so it points at the code actually blocking the loop.
+
+        Args:
+            lag_interval: Interval at which the scheduling lag is measured.
+            slow_callback_threshold: Minimum duration of a callback before it is reported.
+            max_samples: Maximum number of slow callback samples kept in memory.
+            max_lag_points: Maximum number of recent lag measurements kept in memory.
+        """
+        self._lag_interval = lag_interval
+        self._slow_callback_threshold = slow_callback_threshold
+
+        self._lag_counts = [0] * (len(LAG_BUCKETS) + 1)
+        self._lag_sum = 0.0
+        self._lag_max = 0.0
+        self._lag_points: deque[tuple[float, float]] = deque(maxlen=max_lag_points)
+
+        self._slow_count = 0
+        self._samples: deque[dict[str, Any]] = deque(maxlen=max_samples)
+
+        self._running: tuple[Any, float] | None = None
+        self._sampled_stack: tuple[Any, list[str]] | None = None
+
+        self._thread_id: int | None = None
+        self._lag_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop_ev = threading.Event()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop, must be called from the loop thread"""
+        if self._thread_id is not None:
+            raise RuntimeError("monitor already started")
+
+        self._thread_id = threading.get_ident()
+        _monitors[self._thread_id] = self
+        _install_hook()
+
+        self._lag_task = asyncio.get_running_loop().create_task(
+            self._lag_task_impl(), name="loop_monitor_lag"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watchdog_impl, name="loop_monitor_watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        if self._thread_id is None:
+            return
+
+        _monitors.pop(self._thread_id, None)
+        self._stop_ev.set()
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+
+    def export(self) -> dict[str, Any]:
+        return {
+            "lag": {
+                "buckets": [*LAG_BUCKETS, "+Inf"],
+                "counts": list(self._lag_counts),
+                "count": sum(self._lag_counts),
+                "sum": self._lag_sum,
+                "max": self._lag_max,
+                "recent": list(self._lag_points),
+            },
+            "slow_callbacks": {
+                "threshold": self._slow_callback_threshold,
+                "count": self._slow_count,
+                "samples": list(self._samples),
+            },
+        }
+
+    async def _lag_task_impl(self) -> None:
+        interval = self._lag_interval
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(interval)
+            lag = max(time.monotonic() - start - interval, 0.0)
+
+            self._lag_counts[bisect.bisect_left(LAG_BUCKETS, lag)] += 1
+            self._lag_sum += lag
+            self._lag_max = max(self._lag_max, lag)
+            self._lag_points.append((time.time(), lag))
+
+    def _watchdog_impl(self) -> None:
+        poll_interval = self._slow_callback_threshold / 2
+        while not self._stop_ev.wait(poll_interval):
+            running = self._running
+            if running is None:
+                continue
+
+            handle, start = running
+            if time.monotonic() - start < self._slow_callback_threshold:
+                continue
+
+            sampled = self._sampled_stack
+            if sampled is not None and sampled[0] is handle:
+                continue  # only sample the stack once per callback
+
+            assert self._thread_id is not None
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+
+            self._sampled_stack = (handle, traceback.format_stack(frame, limit=32))
 
-    def instrumented(self: Any) -> Any:
-        start = time.monotonic()
-        val = _run(self)
-        dt = time.monotonic() - start
-        if dt >= slow_duration:
-            logger.warning("Running %s took too long: %.2f seconds", _format_handle(self), dt)
-        return val
+    def _on_slow_callback(self, handle: Any, duration: float) -> None:
+        stack: list[str] | None = None
+        sampled = self._sampled_stack
+        if sampled is not None and sampled[0] is handle:
+            stack = sampled[1]
+            self._sampled_stack = None
 
-    asyncio.events.Handle._run = instrumented  # type: ignore
+        self._slow_count += 1
+        self._samples.append(
+            {
+                "handle": _format_handle(handle),
+                "duration": duration,
+                "timestamp": time.time(),
+                "stack": stack,
+            }
+        )
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import ctypes
 from collections.abc import AsyncGenerator
-from typing import Union
+from typing import Any, Union
 
 import aiofiles
 
@@ -38,6 +38,21 @@ def calculate_audio_duration(frames: AudioBuffer) -> float:
         return frames.duration
 
 
+def _can_coalesce_frames(a: object, b: object) -> bool:
+    """Whether two pending audio frames of an overloaded input channel can be merged"""
+    return (
+        isinstance(a, rtc.AudioFrame)
+        and isinstance(b, rtc.AudioFrame)
+        and a.sample_rate == b.sample_rate
+        and a.num_channels == b.num_channels
+    )
+
+
+def _coalesce_frames(frames: list[Any]) -> rtc.AudioFrame:
+    """Merge the pending audio frames of an overloaded input channel (see `aio.BoundedChan`)"""
+    return rtc.combine_audio_frames(frames)
+
+
 class AudioByteStream:
     """
     Buffer and chunk audio byte data into fixed-size frames.
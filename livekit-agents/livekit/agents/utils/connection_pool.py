@@ -1,15 +1,38 @@
 import asyncio
+import random
 import time
-import weakref
 from collections.abc import AsyncGenerator, Awaitable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Callable, Generic, Optional, TypeVar
 
+from ..log import logger
+from ..metrics.registry import get_process_registry
 from . import aio
 
 T = TypeVar("T")
 
 
+@dataclass
+class ConnectionPoolStats:
+    gets: int = 0
+    """Number of connections handed out by `ConnectionPool.get`"""
+    hits: int = 0
+    """Number of gets served by an idle connection, without connecting"""
+    wait_time_total: float = 0.0
+    """Total time spent waiting in `ConnectionPool.get`, in seconds"""
+    connects: int = 0
+    """Number of connections opened, including the background refills"""
+    expired: int = 0
+    """Number of connections rotated because they reached their max duration"""
+    ping_failures: int = 0
+    """Number of idle connections discarded because they failed the ping"""
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.gets if self.gets else 0.0
+
+
 class ConnectionPool(Generic[T]):
     """Helper class to manage persistent connections like websockets.
 
@@ -25,6 +48,12 @@ class ConnectionPool(Generic[T]):
         connect_cb: Optional[Callable[[float], Awaitable[T]]] = None,
         close_cb: Optional[Callable[[T], Awaitable[None]]] = None,
         connect_timeout: float = 10.0,
+        min_idle: int = 0,
+        max_idle: Optional[int] = None,
+        max_session_jitter: float = 0.1,
+        ping_cb: Optional[Callable[[T], Awaitable[None]]] = None,
+        ping_idle_after: float = 30.0,
+        label: Optional[str] = None,
     ) -> None:
         """Initialize the connection wrapper.
 
@@ -33,6 +62,11 @@ class ConnectionPool(Generic[T]):
             mark_refreshed_on_get: If True, the session will be marked as fresh when get() is called. only used when max_session_duration is set.
             connect_cb: Optional async callback to create new connections
             close_cb: Optional async callback to close connections
+            min_idle: Number of idle connections kept ready, the pool is refilled in the background after a connection is handed out
+            max_idle: Maximum number of idle connections, the connections put back above it are closed
+            max_session_jitter: Fraction of max_session_duration randomly removed from the duration of each connection, so the connections opened together don't all expire at the same time
+            ping_cb: Optional async callback validating a connection that stayed idle for ping_idle_after seconds before handing it out, the connection is discarded if it raises
+            label: Label of the provider, used to report the pool stats to the metrics registry
         """  # noqa: E501
         self._max_session_duration = max_session_duration
         self._mark_refreshed_on_get = mark_refreshed_on_get
@@ -41,11 +75,28 @@ class ConnectionPool(Generic[T]):
         self._connections: dict[T, float] = {}  # conn -> connected_at timestamp
         self._available: set[T] = set()
         self._connect_timeout = connect_timeout
+        self._min_idle = min_idle
+        self._max_idle = max_idle
+        self._max_session_jitter = max_session_jitter
+        self._ping_cb = ping_cb
+        self._ping_idle_after = ping_idle_after
+        self._label = label
+
+        self._max_durations: dict[T, float] = {}  # conn -> jittered max_session_duration
+        self._idle_since: dict[T, float] = {}
 
         # store connections to be reaped (closed) later.
         self._to_close: set[T] = set()
 
-        self._prewarm_task: Optional[weakref.ref[asyncio.Task[None]]] = None
+        self._refill_tasks: set[asyncio.Task[None]] = set()
+        self._connecting = 0
+        self._generation = 0  # incremented by invalidate()
+        self._closed = False
+        self._stats = ConnectionPoolStats()
+
+    @property
+    def stats(self) -> ConnectionPoolStats:
+        return self._stats
 
     async def _connect(self, timeout: float) -> T:
         """Create a new connection.
@@ -60,6 +111,11 @@ class ConnectionPool(Generic[T]):
             raise NotImplementedError("Must provide connect_cb or implement connect()")
         connection = await self._connect_cb(timeout)
         self._connections[connection] = time.time()
+        self._stats.connects += 1
+        if self._max_session_duration is not None:
+            self._max_durations[connection] = self._max_session_duration * (
+                1.0 - random.uniform(0.0, self._max_session_jitter)
+            )
         return connection
 
     async def _drain_to_close(self) -> None:
@@ -69,7 +125,7 @@ class ConnectionPool(Generic[T]):
         self._to_close.clear()
 
     @asynccontextmanager
-    async def connection(self, *, timeout: float) -> AsyncGenerator[T, None]:
+    async def connection(self, *, timeout: Optional[float] = None) -> AsyncGenerator[T, None]:
         """Get a connection from the pool and automatically return it when done.
 
         Yields:
@@ -84,29 +140,85 @@ class ConnectionPool(Generic[T]):
         else:
             self.put(conn)
 
-    async def get(self, *, timeout: float) -> T:
+    async def get(self, *, timeout: Optional[float] = None) -> T:
         """Get an available connection or create a new one if needed.
 
+        Args:
+            timeout: Timeout of the connection, defaults to connect_timeout
+
         Returns:
             An active connection object
         """
+        if timeout is None:
+            timeout = self._connect_timeout
+
+        started_at = time.perf_counter()
         await self._drain_to_close()
-        now = time.time()
 
+        conn = await self._get_available(timeout)
+        hit = conn is not None
+        if conn is None:
+            conn = await self._connect(timeout)
+
+        _report_get(self._stats, self._label, hit, time.perf_counter() - started_at)
+        self._refill()
+        return conn
+
+    async def _get_available(self, timeout: float) -> Optional[T]:
         # try to reuse an available connection that hasn't expired
         while self._available:
             conn = self._available.pop()
-            if (
-                self._max_session_duration is None
-                or now - self._connections[conn] <= self._max_session_duration
-            ):
-                if self._mark_refreshed_on_get:
-                    self._connections[conn] = now
-                return conn
-            # connection expired; mark it for resetting.
-            self.remove(conn)
+            now = time.time()
+            max_duration = self._max_durations.get(conn)
+            if max_duration is not None and now - self._connections[conn] > max_duration:
+                # connection expired; mark it for resetting.
+                self._stats.expired += 1
+                self.remove(conn)
+                continue
+
+            idle_since = self._idle_since.pop(conn, now)
+            if self._ping_cb is not None and now - idle_since >= self._ping_idle_after:
+                try:
+                    await asyncio.wait_for(self._ping_cb(conn), timeout)
+                except Exception:
+                    logger.debug("discarding an idle connection that failed the ping")
+                    self._stats.ping_failures += 1
+                    self.remove(conn)
+                    continue
+
+            if self._mark_refreshed_on_get:
+                self._connections[conn] = now
+            return conn
+
+        return None
+
+    def _refill(self, target: Optional[int] = None) -> None:
+        """Open connections in the background until ``target`` (default min_idle) are idle"""
+        if target is None:
+            target = self._min_idle
+
+        if self._closed or self._connect_cb is None:
+            return
+
+        for _ in range(target - len(self._available) - self._connecting):
+            self._connecting += 1
+            task = asyncio.create_task(self._refill_one(self._generation))
+            self._refill_tasks.add(task)
+            task.add_done_callback(self._refill_tasks.discard)
+
+    async def _refill_one(self, generation: int) -> None:
+        try:
+            conn = await self._connect(timeout=self._connect_timeout)
+        except Exception:
+            logger.warning("failed to open a connection for the pool", exc_info=True)
+            return
+        finally:
+            self._connecting -= 1
 
-        return await self._connect(timeout)
+        if generation != self._generation:
+            self.remove(conn)  # invalidated while connecting
+        else:
+            self.put(conn)
 
     def put(self, conn: T) -> None:
         """Mark a connection as available for reuse.
@@ -116,8 +228,15 @@ class ConnectionPool(Generic[T]):
         Args:
             conn: The connection to make available
         """
-        if conn in self._connections:
-            self._available.add(conn)
+        if conn not in self._connections:
+            return
+
+        if self._max_idle is not None and len(self._available) >= self._max_idle:
+            self.remove(conn)
+            return
+
+        self._available.add(conn)
+        self._idle_since[conn] = time.time()
 
     async def _maybe_close_connection(self, conn: T) -> None:
         """Close a connection if close_cb is provided.
@@ -137,6 +256,8 @@ class ConnectionPool(Generic[T]):
             conn: The connection to reset
         """
         self._available.discard(conn)
+        self._max_durations.pop(conn, None)
+        self._idle_since.pop(conn, None)
         if conn in self._connections:
             self._to_close.add(conn)
             self._connections.pop(conn, None)
@@ -150,30 +271,40 @@ class ConnectionPool(Generic[T]):
             self._to_close.add(conn)
         self._connections.clear()
         self._available.clear()
+        self._max_durations.clear()
+        self._idle_since.clear()
+        self._generation += 1
 
     def prewarm(self) -> None:
         """Initiate prewarming of the connection pool without blocking.
 
-        This method starts a background task that creates a new connection if none exist.
-        The task automatically cleans itself up when the connection pool is closed.
+        This method starts background tasks opening connections until min_idle (at least one)
+        are idle. The tasks are cancelled when the connection pool is closed.
         """
-        if self._prewarm_task is not None or self._connections:
+        if self._connections and not self._min_idle:
             return
 
-        async def _prewarm_impl() -> None:
-            if not self._connections:
-                conn = await self._connect(timeout=self._connect_timeout)
-                self._available.add(conn)
-
-        task = asyncio.create_task(_prewarm_impl())
-        self._prewarm_task = weakref.ref(task)
+        self._refill(max(self._min_idle, 1))
 
     async def aclose(self) -> None:
         """Close all connections, draining any pending connection closures."""
-        if self._prewarm_task is not None:
-            task = self._prewarm_task()
-            if task:
-                await aio.gracefully_cancel(task)
+        self._closed = True
+        await aio.cancel_and_wait(*self._refill_tasks)
 
         self.invalidate()
         await self._drain_to_close()
+
+
+def _report_get(
+    stats: ConnectionPoolStats, label: Optional[str], hit: bool, wait_time: float
+) -> None:
+    stats.gets += 1
+    stats.hits += int(hit)
+    stats.wait_time_total += wait_time
+
+    if label is not None:
+        registry = get_process_registry()
+        registry.observe("lk_agents_connection_pool_wait_seconds", label, wait_time)
+        registry.inc("lk_agents_connection_pool_gets_total", label)
+        if hit:
+            registry.inc("lk_agents_connection_pool_hits_total", label)
@@ -1,17 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
+import time
+from dataclasses import dataclass, field
 from typing import Callable
+from urllib.parse import urlsplit
 
 import aiohttp
 
 from ..log import logger
+from . import aio
 
 _ClientFactory = Callable[[], aiohttp.ClientSession]
 _ContextVar = contextvars.ContextVar("agent_http_session")
 
 
-def _new_session_ctx() -> _ClientFactory:
+@dataclass
+class HTTPSessionOptions:
+    """Configuration of the HTTP session shared by the plugins of a job (see `http_session`)"""
+
+    limit_per_host: int = 50
+    """Maximum number of simultaneous connections to the same endpoint"""
+    keepalive_timeout: float = 120.0
+    """How long an idle connection is kept open for reuse, aiohttp's default is only 15s"""
+    dns_cache_ttl: float | None = 300.0
+    """How long the resolved addresses are cached, None caches them forever"""
+    warmup_urls: list[str] = field(default_factory=list)
+    """Endpoints of the providers (e.g ``https://api.openai.com``), their DNS is resolved and a
+    TLS connection is opened as soon as the job process starts, so the first request of a job
+    doesn't pay for it. See also `JobProcess.prewarm_http`."""
+
+
+def _new_session_ctx(
+    opts: HTTPSessionOptions | None = None, *, http_proxy: str | None = None
+) -> _ClientFactory:
+    # the proxy is given by the job process, the session can be created (e.g. by the warmup)
+    # before the job context exists
     g_session: aiohttp.ClientSession | None = None
 
     def _new_session() -> aiohttp.ClientSession:
@@ -19,18 +44,21 @@ def _new_session_ctx() -> _ClientFactory:
         if g_session is None:
             logger.debug("http_session(): creating a new httpclient ctx")
 
-            from ..job import get_job_context
-
-            try:
-                http_proxy = get_job_context().proc.http_proxy
-            except RuntimeError:
-                http_proxy = None
-
+            session_opts = opts or HTTPSessionOptions()
             connector = aiohttp.TCPConnector(
-                limit_per_host=50,
-                keepalive_timeout=120,  # the default is only 15s
+                limit_per_host=session_opts.limit_per_host,
+                keepalive_timeout=session_opts.keepalive_timeout,
+                ttl_dns_cache=(
+                    int(session_opts.dns_cache_ttl)
+                    if session_opts.dns_cache_ttl is not None
+                    else None
+                ),
+            )
+            g_session = aiohttp.ClientSession(
+                proxy=http_proxy,
+                connector=connector,
+                trace_configs=[_warmup_trace_config()],
             )
-            g_session = aiohttp.ClientSession(proxy=http_proxy, connector=connector)
         return g_session
 
     _ContextVar.set(_new_session)
@@ -51,7 +79,102 @@ def http_session() -> aiohttp.ClientSession:
     return val()
 
 
+def _has_http_ctx() -> bool:
+    return _ContextVar.get(None) is not None
+
+
+async def _warmup(urls: list[str], *, timeout: float = 10.0) -> None:
+    """Resolve and open a connection to the origin of each url using the shared session.
+
+    The connections are kept alive by the session and reused by the first requests of the job,
+    websocket urls are warmed through their http(s) origin.
+    """
+    session = http_session()
+    origins = {_origin(url) for url in urls}
+    await asyncio.gather(*(_warmup_origin(session, origin, timeout) for origin in origins))
+
+
+def prewarm_connection(url: str, *, session: aiohttp.ClientSession | None = None) -> None:
+    """Open a connection to the origin of ``url`` in the background, without blocking.
+
+    Used by the plugins to implement ``prewarm()``: the DNS resolution and the TLS handshake
+    are done ahead of the first request (or websocket) using the same session, which then
+    reuses the idle connection.
+
+    Args:
+        url: Any url of the endpoint, http(s) or ws(s).
+        session: The session used by the plugin, defaults to `http_session`.
+    """
+    task = asyncio.create_task(
+        _warmup_origin(session or http_session(), _origin(url), 10.0), name="http_prewarm"
+    )
+    _prewarm_tasks.add(task)
+    task.add_done_callback(_prewarm_tasks.discard)
+
+
+_prewarm_tasks: set[asyncio.Task[None]] = set()
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    scheme = {"ws": "http", "wss": "https"}.get(parts.scheme, parts.scheme)
+    return f"{scheme}://{parts.netloc}/"
+
+
+async def _warmup_origin(session: aiohttp.ClientSession, origin: str, timeout: float) -> None:
+    timings: dict[str, float] = {}
+    try:
+        async with session.head(
+            origin,
+            allow_redirects=False,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            trace_request_ctx=timings,
+        ):
+            pass
+    except Exception as e:
+        logger.debug("failed to warm up the http connection", extra={"url": origin, "error": e})
+        return
+
+    if "connect_duration" in timings:
+        # time the first request would have spent resolving and connecting
+        logger.info(
+            "warmed up the http connection",
+            extra={"url": origin, "saved": round(timings["connect_duration"], 3)},
+        )
+
+
+def _warmup_trace_config() -> aiohttp.TraceConfig:
+    """Measure the connection setup (DNS, TCP and TLS) of the warmup requests"""
+
+    async def _on_connection_create_start(
+        session: aiohttp.ClientSession, ctx: object, params: object
+    ) -> None:
+        timings = getattr(ctx, "trace_request_ctx", None)
+        if isinstance(timings, dict):
+            timings["connect_started_at"] = time.perf_counter()
+
+    async def _on_connection_create_end(
+        session: aiohttp.ClientSession, ctx: object, params: object
+    ) -> None:
+        timings = getattr(ctx, "trace_request_ctx", None)
+        if isinstance(timings, dict) and "connect_started_at" in timings:
+            timings["connect_duration"] = time.perf_counter() - timings["connect_started_at"]
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    return trace_config
+
+
 async def _close_http_ctx() -> None:
+    # jobs of the thread executor run in the same process, each with their own loop
+    loop = asyncio.get_running_loop()
+    await aio.cancel_and_wait(*(t for t in _prewarm_tasks if t.get_loop() is loop))
+
+    from .ws_multiplexer import _close_shared
+
+    await _close_shared()  # the shared websockets use the http session
+
     val = _ContextVar.get(None)
     if val is not None:
         logger.debug("http_session(): closing the httpclient ctx")
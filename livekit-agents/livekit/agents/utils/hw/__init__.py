@@ -1,10 +1,13 @@
 from .cpu import CGroupV2CPUMonitor, CPUMonitor, DefaultCPUMonitor, get_cpu_monitor
+from .resources import ResourceMonitor, ResourceUsage
 
 __all__ = [
     "get_cpu_monitor",
     "CPUMonitor",
     "CGroupV2CPUMonitor",
     "DefaultCPUMonitor",
+    "ResourceMonitor",
+    "ResourceUsage",
 ]
 
 # Cleanup docs of unexported modules
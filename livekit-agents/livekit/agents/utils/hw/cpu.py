@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+import functools
 import os
 import time
 from abc import ABC, abstractmethod
@@ -28,7 +31,22 @@ class DefaultCPUMonitor(CPUMonitor):
 
 
 class CGroupV2CPUMonitor(CPUMonitor):
+    # the quota rarely changes, avoid re-reading cpu.max on every call
+    _QUOTA_CACHE_TTL = 30.0
+
+    def __init__(self) -> None:
+        self._cpu_count: float | None = None
+        self._cpu_count_time = 0.0
+
     def cpu_count(self) -> float:
+        now = time.monotonic()
+        if self._cpu_count is None or now - self._cpu_count_time > self._QUOTA_CACHE_TTL:
+            self._cpu_count = self._read_cpu_count()
+            self._cpu_count_time = now
+
+        return self._cpu_count
+
+    def _read_cpu_count(self) -> float:
         # quota: The maximum CPU time in microseconds that the cgroup can use within a given period.
         # period: The period of time in microseconds over which the quota applies.
         # If the quota is set to "max", it means the cgroup is allowed to use all available CPUs without restriction.  # noqa: E501
@@ -74,6 +92,7 @@ class CGroupV2CPUMonitor(CPUMonitor):
         raise RuntimeError("Failed to read CPU usage")
 
 
+@functools.cache
 def get_cpu_monitor() -> CPUMonitor:
     if _is_cgroup_v2():
         return CGroupV2CPUMonitor()
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from dataclasses import dataclass
+
+import psutil
+
+from .cpu import get_cpu_monitor
+
+_CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+@dataclass
+class ResourceUsage:
+    cpu: float
+    """CPU usage between 0 and 1, relative to the CPUs available to the process (cgroup quota)"""
+    memory: float
+    """Memory usage between 0 and 1. The working set of the cgroup relative to its limit, or
+    without a cgroup limit, the RSS of the worker process tree relative to the host memory"""
+    cpu_pressure: float
+    """Share of time at least one task was stalled waiting for CPU (PSI "some"), between 0 and 1"""
+    memory_pressure: float
+    """Share of time at least one task was stalled waiting for memory (PSI "some")"""
+    timestamp: float
+
+
+class ResourceMonitor:
+    def __init__(self, *, limits_refresh_interval: float = 30.0) -> None:
+        """Non-blocking sampler of the CPU, memory and pressure stall (PSI) metrics.
+
+        Each call to `sample` reads the cumulative counters (cgroup v2 when available, the
+        host otherwise) and returns the usage since the previous call, it never sleeps.
+        The CPU quota and memory limit are cached and only re-read every
+        ``limits_refresh_interval`` seconds.
+        """
+        self._refresh_interval = limits_refresh_interval
+        self._cgroup = os.path.exists(f"{_CGROUP_ROOT}/cpu.stat")
+        self._cpu_psi_path = _first_existing(f"{_CGROUP_ROOT}/cpu.pressure", "/proc/pressure/cpu")
+        self._mem_psi_path = _first_existing(
+            f"{_CGROUP_ROOT}/memory.pressure", "/proc/pressure/memory"
+        )
+
+        self._limits_time = 0.0
+        self._cpu_count = 1.0
+        self._memory_limit: int | None = None
+        self._host_memory = 1
+        self._process = psutil.Process()
+
+        self._last_time = time.monotonic()
+        self._last_cpu_usage = 0.0
+        self._last_cpu_usage = self._read_cpu_usage()
+        self._last_cpu_stall = _read_psi_total(self._cpu_psi_path)
+        self._last_mem_stall = _read_psi_total(self._mem_psi_path)
+        self._usage = ResourceUsage(
+            cpu=0.0, memory=0.0, cpu_pressure=0.0, memory_pressure=0.0, timestamp=time.time()
+        )
+
+    @property
+    def usage(self) -> ResourceUsage:
+        """The last sampled usage"""
+        return self._usage
+
+    def sample(self) -> ResourceUsage:
+        now = time.monotonic()
+        elapsed = now - self._last_time
+        if elapsed <= 0:
+            return self._usage
+
+        self._refresh_limits(now)
+
+        cpu_usage = self._read_cpu_usage()
+        if self._cgroup:
+            # usage_usec is the cpu time consumed by the cgroup
+            cpu = (cpu_usage - self._last_cpu_usage) / 1e6 / (elapsed * self._cpu_count)
+        else:
+            cpu = cpu_usage  # psutil already returns the usage since the last call
+
+        cpu_stall = _read_psi_total(self._cpu_psi_path)
+        mem_stall = _read_psi_total(self._mem_psi_path)
+
+        self._usage = ResourceUsage(
+            cpu=min(max(cpu, 0.0), 1.0),
+            memory=self._read_memory(),
+            cpu_pressure=_stall_ratio(self._last_cpu_stall, cpu_stall, elapsed),
+            memory_pressure=_stall_ratio(self._last_mem_stall, mem_stall, elapsed),
+            timestamp=time.time(),
+        )
+
+        self._last_time = now
+        self._last_cpu_usage = cpu_usage
+        self._last_cpu_stall = cpu_stall
+        self._last_mem_stall = mem_stall
+        return self._usage
+
+    def _refresh_limits(self, now: float) -> None:
+        if now - self._limits_time < self._refresh_interval:
+            return
+
+        self._limits_time = now
+        self._cpu_count = get_cpu_monitor().cpu_count()
+        self._memory_limit = _read_cgroup_int("memory.max") if self._cgroup else None
+        self._host_memory = psutil.virtual_memory().total
+
+    def _read_cpu_usage(self) -> float:
+        if self._cgroup:
+            usage = _read_cgroup_stat("cpu.stat", "usage_usec")
+            return usage if usage is not None else self._last_cpu_usage
+
+        return psutil.cpu_percent(interval=None) / 100.0
+
+    def _read_memory(self) -> float:
+        if self._memory_limit:
+            usage = _read_cgroup_working_set()
+            if usage is not None:
+                return min(usage / self._memory_limit, 1.0)
+
+        # the host memory used by other processes isn't counted, and the pages shared by the
+        # job processes (e.g. forked from the same parent) are counted in each of them
+        return min(_process_tree_rss(self._process) / self._host_memory, 1.0)
+
+
+def _first_existing(*paths: str) -> str | None:
+    return next((path for path in paths if os.path.exists(path)), None)
+
+
+def _read_cgroup_int(name: str) -> int | None:
+    try:
+        with open(f"{_CGROUP_ROOT}/{name}") as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+
+    return None if value == "max" else int(value)
+
+
+def _read_cgroup_stat(name: str, key: str) -> int | None:
+    """value of a key of a flat keyed cgroup file (e.g. cpu.stat, memory.stat)"""
+    try:
+        with open(f"{_CGROUP_ROOT}/{name}") as f:
+            for line in f:
+                field, _, value = line.partition(" ")
+                if field == key:
+                    return int(value)
+    except OSError:
+        pass
+
+    return None
+
+
+def _read_cgroup_working_set() -> int | None:
+    """memory.current without the inactive page cache, which is reclaimed before the cgroup
+    gets OOM killed (same as the working set reported by the kubelet)"""
+    usage = _read_cgroup_int("memory.current")
+    if usage is None:
+        return None
+
+    inactive_file = _read_cgroup_stat("memory.stat", "inactive_file") or 0
+    return max(usage - inactive_file, 0)
+
+
+def _process_tree_rss(process: psutil.Process) -> int:
+    rss = 0
+    with contextlib.suppress(psutil.Error):
+        rss += process.memory_info().rss
+        for child in process.children(recursive=True):
+            with contextlib.suppress(psutil.Error):  # the child may have exited
+                rss += child.memory_info().rss
+
+    return rss
+
+
+def _read_psi_total(path: str | None) -> int | None:
+    """cumulative stall time (us) of the "some" line of a PSI file"""
+    if path is None:
+        return None
+
+    try:
+        with open(path) as f:
+            line = f.readline()  # some avg10=0.00 avg60=0.00 avg300=0.00 total=12345
+    except OSError:
+        return None
+
+    for field in line.split():
+        if field.startswith("total="):
+            return int(field[6:])
+
+    return None
+
+
+def _stall_ratio(last: int | None, current: int | None, elapsed: float) -> float:
+    if last is None or current is None:
+        return 0.0
+
+    return min(max((current - last) / 1e6 / elapsed, 0.0), 1.0)
@@ -0,0 +1,109 @@
+"""JSON and base64 helpers for the streaming hot paths.
+
+The realtime and streaming plugins (de)serialize one message per audio chunk. These helpers
+use orjson when it's installed (``pip install orjson``) and fall back to the standard library
+otherwise, the backend can be changed with `set_json_backend` (e.g to benchmark it).
+"""
+
+from __future__ import annotations
+
+import binascii
+import json
+from typing import Any, Literal, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+JSONBackend = Literal["json", "orjson"]
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_backend: JSONBackend = "orjson" if orjson is not None else "json"
+
+
+def json_backend() -> JSONBackend:
+    return _backend
+
+
+def available_json_backends() -> list[JSONBackend]:
+    return ["json", "orjson"] if orjson is not None else ["json"]
+
+
+def set_json_backend(backend: JSONBackend) -> None:
+    global _backend
+
+    if backend == "orjson" and orjson is None:
+        raise ValueError("the 'orjson' package is required to use the orjson backend")
+
+    _backend = backend
+
+
+def json_loads(data: str | bytes | bytearray) -> Any:
+    """Parse a JSON document, orjson raises a subclass of `json.JSONDecodeError`"""
+    if _backend == "orjson":
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a compact JSON string.
+
+    Objects orjson can't serialize (e.g non-str keys or integers above 64 bits) go through
+    the standard library.
+    """
+    if _backend == "orjson":
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def b64encode(data: BytesLike) -> str:
+    """Base64 encode ``data``, memoryviews (e.g `rtc.AudioFrame.data`) are encoded in place"""
+    if isinstance(data, memoryview) and data.format != "B":
+        data = data.cast("B")
+
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def b64decode(data: str | BytesLike) -> bytes:
+    return binascii.a2b_base64(data)
+
+
+class Base64JSONTemplate:
+    _SLOT = "\x00lk_b64\x00"
+
+    def __init__(self, template: dict[str, Any]) -> None:
+        """A JSON message with a single base64 field, serialized once.
+
+        The slot is marked with ``...``, e.g
+        ``Base64JSONTemplate({"type": "input_audio_buffer.append", "audio": ...})``. Rendering
+        only concatenates the encoded audio, the base64 alphabet never needs to be escaped.
+        """
+        encoded = json.dumps(_fill_slot(template, self._SLOT), separators=(",", ":"))
+        slot = json.dumps(self._SLOT)
+        if encoded.count(slot) != 1:
+            raise ValueError("the template must contain exactly one slot (...)")
+
+        self._prefix, self._suffix = encoded.split(slot)
+
+    def render(self, data: str | BytesLike) -> str:
+        """Render the message, ``data`` is the raw bytes or the already encoded base64 string"""
+        if not isinstance(data, str):
+            data = b64encode(data)
+
+        return f'{self._prefix}"{data}"{self._suffix}'
+
+
+def _fill_slot(value: Any, slot: str) -> Any:
+    if value is ...:
+        return slot
+    if isinstance(value, dict):
+        return {k: _fill_slot(v, slot) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill_slot(v, slot) for v in value]
+    return value
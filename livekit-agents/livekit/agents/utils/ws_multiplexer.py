@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Hashable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable
+
+import aiohttp
+
+from .._exceptions import APIConnectionError, APIStatusError
+from ..log import logger
+from . import aio, serialization
+from .connection_pool import ConnectionPoolStats, _report_get
+
+# the multiplexers are removed when released by all their owners or when the job ends (see
+# `_close_shared`), their connections and tasks reference the loop and the http session
+_shared: dict[asyncio.AbstractEventLoop, dict[Hashable, WebSocketMultiplexer]] = {}
+
+
+async def ping_websocket(ws: aiohttp.ClientWebSocketResponse) -> None:
+    """Send a PING on an idle websocket and wait for its PONG, e.g as the ``ping_cb`` of a
+    `ConnectionPool`. The websocket must not be read concurrently, the caller bounds the wait.
+
+    Raises:
+        APIConnectionError: The websocket is closed or another message was received.
+    """
+    if ws.closed:
+        raise APIConnectionError("websocket connection closed")
+
+    with _receive_pongs(ws):
+        await ws.ping()
+        while True:
+            msg = await ws.receive()
+            if msg.type == aiohttp.WSMsgType.PONG:
+                return
+
+            if msg.type == aiohttp.WSMsgType.PING:
+                await ws.pong(msg.data)
+                continue
+
+            raise APIConnectionError(f"unexpected websocket message {msg.type} instead of a PONG")
+
+
+@contextmanager
+def _receive_pongs(ws: aiohttp.ClientWebSocketResponse) -> Iterator[None]:
+    # aiohttp swallows the PONGs (and answers the PINGs) when autoping is enabled
+    autoping = ws._autoping
+    ws._autoping = False
+    try:
+        yield
+    finally:
+        ws._autoping = autoping
+
+
+class _Connection:
+    def __init__(self, ws: aiohttp.ClientWebSocketResponse, expires_at: float | None) -> None:
+        self.ws = ws
+        self.expires_at = expires_at
+        self.contexts: dict[str, aio.Chan[dict[str, Any]]] = {}
+        self.closed = False
+        self.error: Exception | None = None
+        self.recv_task: asyncio.Task[None] | None = None
+        self.idle_handle: asyncio.TimerHandle | None = None
+        self.idle_since = time.monotonic()
+        self.pong_fut: asyncio.Future[None] | None = None
+
+    def accepts_contexts(self, max_contexts: int) -> bool:
+        if self.closed or len(self.contexts) >= max_contexts:
+            return False
+
+        # expired connections are drained, they're closed once their contexts are done
+        return self.expires_at is None or time.monotonic() < self.expires_at
+
+
+class MultiplexedContext:
+    def __init__(self, conn: _Connection, context_id: str, ch: aio.Chan[dict[str, Any]]) -> None:
+        self._conn = conn
+        self._context_id = context_id
+        self._ch = ch
+        self._done = False
+
+    @property
+    def context_id(self) -> str:
+        return self._context_id
+
+    async def send(self, data: dict[str, Any]) -> None:
+        """Send a JSON message on the shared websocket, the context id must be included"""
+        if self._conn.closed:
+            raise self._conn.error or APIConnectionError("websocket connection closed")
+
+        await self._conn.ws.send_str(serialization.json_dumps(data))
+
+    async def recv(self) -> dict[str, Any]:
+        """Receive the next message routed to this context.
+
+        Raises:
+            APIConnectionError: The shared connection was closed or failed.
+        """
+        try:
+            return await self._ch.recv()
+        except aio.ChanClosed:
+            raise self._conn.error or APIConnectionError("websocket connection closed") from None
+
+    def mark_done(self) -> None:
+        """The provider completed the context, it doesn't need to be cancelled when released"""
+        self._done = True
+
+
+class WebSocketMultiplexer:
+    def __init__(
+        self,
+        *,
+        connect_cb: Callable[[float], Awaitable[aiohttp.ClientWebSocketResponse]],
+        context_id_fnc: Callable[[dict[str, Any]], str | None],
+        cancel_packet_fnc: Callable[[str], dict[str, Any]] | None = None,
+        max_contexts: int = 32,
+        max_session_duration: float | None = None,
+        idle_timeout: float = 60.0,
+        connect_timeout: float = 10.0,
+        ping_idle_after: float | None = 30.0,
+        label: str | None = None,
+    ) -> None:
+        """Share a few websockets between the streams of providers supporting contexts.
+
+        Each stream opens a context (e.g Cartesia's ``context_id``), the JSON messages received
+        on a websocket are routed to the context they belong to. A new websocket is only opened
+        when every connection already serves ``max_contexts`` contexts.
+
+        Args:
+            connect_cb: Open a new websocket, receives the timeout.
+            context_id_fnc: Return the context id of a received message, messages without one
+                (e.g connection errors) are sent to every context of the connection.
+            cancel_packet_fnc: Message sent when a context is released before being completed
+                (e.g on interruption), so the provider stops generating it.
+            max_contexts: Maximum number of concurrent contexts on a single websocket.
+            max_session_duration: Connections older than this don't accept new contexts and are
+                closed once their contexts are done.
+            idle_timeout: Close the connections without any context for this long.
+            ping_idle_after: A connection that had no context for this long is pinged before
+                opening a context on it, it's discarded if the PONG isn't received within the
+                connect timeout. None disables the ping.
+            label: Label of the provider, used to report the stats to the metrics registry
+                (same metrics as `ConnectionPool`).
+        """
+        self._connect_cb = connect_cb
+        self._context_id_fnc = context_id_fnc
+        self._cancel_packet_fnc = cancel_packet_fnc
+        self._max_contexts = max_contexts
+        self._max_session_duration = max_session_duration
+        self._idle_timeout = idle_timeout
+        self._connect_timeout = connect_timeout
+        self._ping_idle_after = ping_idle_after
+        self._label = label
+
+        self._connections: list[_Connection] = []
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._stats = ConnectionPoolStats()
+        self._owners: weakref.WeakSet[Any] = weakref.WeakSet()
+        self._shared_key: tuple[asyncio.AbstractEventLoop, Hashable] | None = None
+
+    @classmethod
+    def shared(
+        cls, key: Hashable, factory: Callable[[], WebSocketMultiplexer], *, owner: object
+    ) -> WebSocketMultiplexer:
+        """Return the multiplexer of the running event loop for ``key``, created with ``factory``.
+
+        Websockets are bound to their event loop, streams are therefore shared between all the
+        plugin instances of a process (or of a job when using the thread executor). The
+        multiplexer is closed once released by all its owners (see `release`), or when the job
+        ends.
+        """
+        loop = asyncio.get_running_loop()
+        muxes = _shared.setdefault(loop, {})
+        if (mux := muxes.get(key)) is None:
+            mux = muxes[key] = factory()
+            mux._shared_key = (loop, key)
+        mux._owners.add(owner)
+        return mux
+
+    async def release(self, owner: object) -> None:
+        """Release a multiplexer returned by `shared`, it's closed when it has no owner left"""
+        self._owners.discard(owner)
+        if self._owners:
+            return
+
+        if self._shared_key is not None:
+            loop, key = self._shared_key
+            muxes = _shared.get(loop, {})
+            if muxes.get(key) is self:
+                del muxes[key]
+                if not muxes:
+                    del _shared[loop]
+            self._shared_key = None
+
+        await self.aclose()
+
+    @property
+    def num_connections(self) -> int:
+        return len(self._connections)
+
+    @property
+    def stats(self) -> ConnectionPoolStats:
+        return self._stats
+
+    @asynccontextmanager
+    async def context(
+        self, context_id: str, *, timeout: float | None = None
+    ) -> AsyncIterator[MultiplexedContext]:
+        """Open a context on one of the shared websockets.
+
+        The context is cancelled (see ``cancel_packet_fnc``) when released before `mark_done`
+        was called, e.g when the stream is interrupted.
+        """
+        started_at = time.perf_counter()
+        conn, hit = await self._acquire(timeout if timeout is not None else self._connect_timeout)
+        _report_get(self._stats, self._label, hit, time.perf_counter() - started_at)
+
+        ch = aio.Chan[dict[str, Any]]()
+        conn.contexts[context_id] = ch
+        ctx = MultiplexedContext(conn, context_id, ch)
+        try:
+            yield ctx
+        finally:
+            conn.contexts.pop(context_id, None)
+            if not ctx._done and not conn.closed and self._cancel_packet_fnc is not None:
+                with contextlib.suppress(Exception):
+                    await conn.ws.send_str(
+                        serialization.json_dumps(self._cancel_packet_fnc(context_id))
+                    )
+
+            self._release(conn)
+
+    def prewarm(self) -> None:
+        """Open a connection in the background if there is none"""
+        if self._connections or self._tasks:
+            return
+
+        async def _prewarm() -> None:
+            conn, _ = await self._acquire(self._connect_timeout)
+            self._release(conn)
+
+        self._spawn(_prewarm())
+
+    async def aclose(self) -> None:
+        await aio.cancel_and_wait(*self._tasks)
+        for conn in list(self._connections):
+            await self._close_connection(conn)
+
+    async def _acquire(self, timeout: float) -> tuple[_Connection, bool]:
+        """Return the least loaded connection accepting contexts (opening one if needed), and
+        whether an existing connection was reused"""
+        async with self._lock:
+            while candidates := [
+                c for c in self._connections if c.accepts_contexts(self._max_contexts)
+            ]:
+                conn = min(candidates, key=lambda c: len(c.contexts))
+                if await self._ping_idle(conn, timeout):
+                    break
+            else:
+                ws = await self._connect_cb(timeout)
+                self._stats.connects += 1
+                expires_at = (
+                    time.monotonic() + self._max_session_duration
+                    if self._max_session_duration is not None
+                    else None
+                )
+                conn = _Connection(ws, expires_at)
+                conn.recv_task = asyncio.create_task(self._recv_task(conn), name="ws_mux_recv")
+                self._connections.append(conn)
+                return conn, False
+
+            if conn.idle_handle is not None:
+                conn.idle_handle.cancel()
+                conn.idle_handle = None
+
+            return conn, True
+
+    async def _ping_idle(self, conn: _Connection, timeout: float) -> bool:
+        """Ping a connection that stayed without context, it's discarded if the ping fails"""
+        if (
+            self._ping_idle_after is None
+            or conn.contexts
+            or time.monotonic() - conn.idle_since < self._ping_idle_after
+        ):
+            return True
+
+        try:
+            await asyncio.wait_for(self._ping(conn), timeout)
+        except Exception:
+            logger.debug("discarding an idle websocket that failed the ping")
+            self._stats.ping_failures += 1
+            await self._close_connection(conn)
+            return False
+
+        return True
+
+    async def _ping(self, conn: _Connection) -> None:
+        """Send a PING and wait for the PONG, it's received by the `_recv_task`"""
+        if conn.closed or conn.ws.closed:
+            raise conn.error or APIConnectionError("websocket connection closed")
+
+        conn.pong_fut = asyncio.get_running_loop().create_future()
+        try:
+            with _receive_pongs(conn.ws):
+                await conn.ws.ping()
+                await conn.pong_fut
+        finally:
+            conn.pong_fut = None
+
+    def _release(self, conn: _Connection) -> None:
+        if conn.contexts or conn.closed:
+            return
+
+        conn.idle_since = time.monotonic()
+        if not conn.accepts_contexts(self._max_contexts):
+            self._stats.expired += 1
+            self._spawn(self._close_connection(conn))
+        else:
+
+            def _on_idle() -> None:
+                conn.idle_handle = None
+                if not conn.contexts:
+                    self._spawn(self._close_connection(conn))
+
+            conn.idle_handle = asyncio.get_running_loop().call_later(self._idle_timeout, _on_idle)
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _close_connection(self, conn: _Connection) -> None:
+        self._discard(conn, None)
+        if conn.recv_task is not None:
+            await aio.cancel_and_wait(conn.recv_task)
+
+        with contextlib.suppress(Exception):
+            await conn.ws.close()
+
+    def _discard(self, conn: _Connection, error: Exception | None) -> None:
+        conn.closed = True
+        conn.error = conn.error or error
+        if conn.idle_handle is not None:
+            conn.idle_handle.cancel()
+            conn.idle_handle = None
+
+        with contextlib.suppress(ValueError):
+            self._connections.remove(conn)
+
+        for ch in conn.contexts.values():
+            ch.close()
+
+        if conn.pong_fut is not None and not conn.pong_fut.done():
+            conn.pong_fut.set_exception(
+                conn.error or APIConnectionError("websocket connection closed")
+            )
+
+    async def _recv_task(self, conn: _Connection) -> None:
+        error: Exception = APIStatusError("websocket connection closed unexpectedly")
+        try:
+            while True:
+                msg = await conn.ws.receive()
+                if msg.type in (
+                    aiohttp.WSMsgType.CLOSED,
+                    aiohttp.WSMsgType.CLOSE,
+                    aiohttp.WSMsgType.CLOSING,
+                ):
+                    break
+
+                if msg.type == aiohttp.WSMsgType.PONG:
+                    if conn.pong_fut is not None and not conn.pong_fut.done():
+                        conn.pong_fut.set_result(None)
+                    continue
+
+                if msg.type == aiohttp.WSMsgType.PING:  # autoping is disabled during `_ping`
+                    await conn.ws.pong(msg.data)
+                    continue
+
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    logger.warning("unexpected websocket message type %s", msg.type)
+                    continue
+
+                data = serialization.json_loads(msg.data)
+                context_id = self._context_id_fnc(data)
+                if context_id is None:
+                    for ch in conn.contexts.values():
+                        ch.send_nowait(data)
+                elif context_id in conn.contexts:
+                    conn.contexts[context_id].send_nowait(data)
+                # else: late message of a released context
+        except Exception as e:
+            error = APIConnectionError("websocket connection failed")
+            error.__cause__ = e
+        finally:
+            self._discard(conn, error)
+
+
+async def _close_shared() -> None:
+    """Close the multiplexers shared on the running loop, called when the job ends"""
+    muxes = _shared.pop(asyncio.get_running_loop(), {})
+    for mux in muxes.values():
+        mux._shared_key = None
+        await mux.aclose()
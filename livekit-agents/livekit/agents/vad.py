@@ -11,7 +11,10 @@ from typing import Literal, Union
 from livekit import rtc
 
 from .metrics import VADMetrics
+from .metrics.registry import get_process_registry
+from .types import DEFAULT_INPUT_QUEUE_OPTIONS, InputQueueOptions
 from .utils import aio
+from .utils.audio import _can_coalesce_frames, _coalesce_frames
 
 
 @unique
@@ -77,11 +80,26 @@ class VAD(ABC, rtc.EventEmitter[Literal["metrics_collected"]]):
         super().__init__()
         self._capabilities = capabilities
         self._label = f"{type(self).__module__}.{type(self).__name__}"
+        self._input_queue_options = DEFAULT_INPUT_QUEUE_OPTIONS
 
     @property
     def capabilities(self) -> VADCapabilities:
         return self._capabilities
 
+    @property
+    def input_queue_options(self) -> InputQueueOptions:
+        """Bound and overload policy of the input queue of the streams created afterwards"""
+        return self._input_queue_options
+
+    @input_queue_options.setter
+    def input_queue_options(self, opts: InputQueueOptions) -> None:
+        self._input_queue_options = opts
+
+    @property
+    def input_sample_rate(self) -> int | None:
+        """The sample rate used for the inference, None if any rate is accepted"""
+        return None
+
     @abstractmethod
     def stream(self) -> VADStream: ...
 
@@ -93,7 +111,14 @@ class VADStream(ABC):
     def __init__(self, vad: VAD) -> None:
         self._vad = vad
         self._last_activity_time = time.perf_counter()
-        self._input_ch = aio.Chan[Union[rtc.AudioFrame, VADStream._FlushSentinel]]()
+        self._input_ch = aio.BoundedChan[Union[rtc.AudioFrame, VADStream._FlushSentinel]](
+            vad.input_queue_options.max_size,
+            policy=vad.input_queue_options.policy,
+            can_coalesce=_can_coalesce_frames,
+            coalesce=_coalesce_frames,
+            droppable=lambda item: isinstance(item, rtc.AudioFrame),
+        )
+        get_process_registry().watch_queue(self._input_ch, vad._label)
         self._event_ch = aio.Chan[VADEvent]()
 
         self._event_aiter, monitor_aiter = aio.itertools.tee(self._event_ch, 2)
@@ -112,11 +137,13 @@ class VADStream(ABC):
 
         inference_duration_total = 0.0
         inference_count = 0
+        backlog_duration = 0.0
 
         async for ev in event_aiter:
             if ev.type == VADEventType.INFERENCE_DONE:
                 inference_duration_total += ev.inference_duration
                 inference_count += 1
+                backlog_duration = max(backlog_duration, self._input_ch.oldest_age)
 
                 if inference_count >= 1 / self._vad.capabilities.update_interval:
                     vad_metrics = VADMetrics(
@@ -124,12 +151,14 @@ class VADStream(ABC):
                         idle_time=time.perf_counter() - self._last_activity_time,
                         inference_duration_total=inference_duration_total,
                         inference_count=inference_count,
+                        backlog_duration=backlog_duration,
                         label=self._vad._label,
                     )
                     self._vad.emit("metrics_collected", vad_metrics)
 
                     inference_duration_total = 0.0
                     inference_count = 0
+                    backlog_duration = 0.0
             elif ev.type in [VADEventType.START_OF_SPEECH, VADEventType.END_OF_SPEECH]:
                 self._last_activity_time = time.perf_counter()
 
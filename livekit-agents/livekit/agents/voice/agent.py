@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from ..llm import mcp
     from .agent_activity import AgentActivity
     from .agent_session import AgentSession, TurnDetectionMode
+    from .events import UserStateChangedEvent
 
 
 @dataclass
@@ -316,6 +317,16 @@ class Agent:
                 wrapped_stt = stt.StreamAdapter(stt=wrapped_stt, vad=activity.vad)
 
             async with wrapped_stt.stream() as stream:
+                gate_opts = activity.session.options.stt_audio_gate
+                drive_gate = gate_opts is not None and wrapped_stt is activity.stt
+                if drive_gate:
+                    stream.enable_audio_gate(gate_opts)
+
+                def _on_user_state_changed(ev: UserStateChangedEvent) -> None:
+                    stream.update_speaking(ev.new_state == "speaking")
+
+                if drive_gate and activity.vad:
+                    activity.session.on("user_state_changed", _on_user_state_changed)
 
                 @utils.log_exceptions(logger=logger)
                 async def _forward_input() -> None:
@@ -327,6 +338,7 @@ class Agent:
                     async for event in stream:
                         yield event
                 finally:
+                    activity.session.off("user_state_changed", _on_user_state_changed)
                     await utils.aio.cancel_and_wait(forward_task)
 
         @staticmethod
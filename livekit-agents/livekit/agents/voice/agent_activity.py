@@ -20,9 +20,11 @@ from ..metrics import (
     TTSMetrics,
     VADMetrics,
 )
+from ..metrics.registry import get_process_registry
 from ..tokenize.basic import split_words
 from ..types import NOT_GIVEN, NotGivenOr
 from ..utils.misc import is_given
+from . import io
 from .agent import Agent, ModelSettings
 from .audio_recognition import AudioRecognition, RecognitionHooks, _EndOfTurnInfo
 from .events import (
@@ -296,6 +298,15 @@ class AgentActivity(RecognitionHooks):
         async with self._lock:
             self._agent._activity = self
 
+            # open the provider connections ahead of the first user turn, while the rest of the
+            # activity starts
+            for model in (self.stt, self.tts):
+                if isinstance(model, (stt.STT, tts.TTS)):
+                    try:
+                        model.prewarm()
+                    except Exception:
+                        logger.warning(f"failed to prewarm {model.label}", exc_info=True)
+
             if self.mcp_servers:
 
                 @utils.log_exceptions(logger=logger)
@@ -379,6 +390,13 @@ class AgentActivity(RecognitionHooks):
                 hooks=self,
                 stt=self._agent.stt_node if self.stt else None,
                 vad=self.vad,
+                audio_frontend=self._session._audio_frontend,
+                stt_sample_rate=(
+                    # non-streaming STTs are wrapped with a StreamAdapter, which uses the VAD frames
+                    self.stt.input_sample_rate
+                    if self.stt and self.stt.capabilities.streaming
+                    else None
+                ),
                 turn_detector=(
                     self.turn_detection if not isinstance(self.turn_detection, str) else None
                 ),
@@ -462,7 +480,10 @@ class AgentActivity(RecognitionHooks):
             return
 
         if self._rt_session is not None:
-            self._rt_session.push_audio(frame)
+            for f in self._session._audio_frontend.resample(
+                frame, self._rt_session.input_sample_rate
+            ):
+                self._rt_session.push_audio(f)
 
         if self._audio_recognition is not None:
             self._audio_recognition.push_audio(frame)
@@ -673,8 +694,51 @@ class AgentActivity(RecognitionHooks):
             raise RuntimeError("cannot schedule new speech, the agent is draining")
 
         heapq.heappush(self._speech_q, (priority, time.time(), speech))
+        speech.add_done_callback(self._on_speech_done)
         self._wake_up_main_task()
 
+    def _on_speech_done(self, speech: SpeechHandle) -> None:
+        latency = speech._latency
+        if latency.llm_started_at is None and latency.first_frame_captured_at is None:
+            return  # nothing was generated (e.g. interrupted before being authorized)
+
+        latency.timestamp = time.time()
+        latency.interrupted = speech.interrupted
+        played_at = latency.playout_started_at
+        if played_at is None and latency.first_frame_captured_at is not None:
+            # the audio output didn't report the playout start (e.g. interrupted before it)
+            played_at = latency.first_frame_captured_at
+            latency.e2e_latency_from_first_frame = True
+            logger.debug(
+                "playout start not reported, e2e latency ends at the first captured frame",
+                extra={"speech_id": speech.id},
+            )
+
+        if latency.end_of_speech_at is not None and played_at is not None:
+            latency.e2e_latency = played_at - latency.end_of_speech_at
+
+        get_process_registry().collect(latency)
+        self._session.emit("metrics_collected", MetricsCollectedEvent(metrics=latency))
+
+    def _track_audio_latency(
+        self, speech_handle: SpeechHandle, audio_output: io.AudioOutput, audio_out: _AudioOutput
+    ) -> None:
+        latency = speech_handle._latency
+
+        def _on_first_frame(_: asyncio.Future[None]) -> None:
+            if latency.first_frame_captured_at is None:
+                latency.first_frame_captured_at = time.time()
+
+        def _on_playback_started(ev: io.PlaybackStartedEvent) -> None:
+            if latency.playout_started_at is None:
+                latency.playout_started_at = ev.created_at
+
+        audio_out.first_frame_fut.add_done_callback(_on_first_frame)
+        audio_output.on("playback_started", _on_playback_started)
+        speech_handle.add_done_callback(
+            lambda _: audio_output.off("playback_started", _on_playback_started)
+        )
+
     @utils.log_exceptions(logger=logger)
     async def _main_task(self) -> None:
         while True:
@@ -702,6 +766,20 @@ class AgentActivity(RecognitionHooks):
             isinstance(ev, LLMMetrics) or isinstance(ev, TTSMetrics)
         ):
             ev.speech_id = speech_handle.id
+
+            # the metrics are emitted once the request is done, derive when it started
+            latency = speech_handle._latency
+            started_at = ev.timestamp - ev.duration
+            if isinstance(ev, LLMMetrics) and latency.llm_started_at is None:
+                latency.llm_started_at = started_at
+                if ev.ttft >= 0:
+                    latency.llm_first_token_at = started_at + ev.ttft
+            elif isinstance(ev, TTSMetrics) and latency.tts_started_at is None:
+                latency.tts_started_at = started_at
+                if ev.ttfb >= 0:
+                    latency.tts_first_byte_at = started_at + ev.ttfb
+
+        get_process_registry().collect(ev)
         self._session.emit("metrics_collected", MetricsCollectedEvent(metrics=ev))
 
     def _on_error(
@@ -960,6 +1038,18 @@ class AgentActivity(RecognitionHooks):
             user_message=user_message, chat_ctx=temp_mutable_chat_ctx
         )
 
+        latency = speech_handle._latency
+        latency.end_of_speech_at = info.end_of_speech_at
+        latency.final_transcript_at = info.final_transcript_at
+        latency.eou_inference_started_at = info.eou_inference_started_at
+        latency.eou_inference_ended_at = info.eou_inference_ended_at
+        latency.eou_inference_duration = info.eou_inference_duration
+        latency.eou_ipc_delay = info.eou_ipc_delay
+        if info.end_of_speech_at is not None:
+            latency.end_of_turn_at = info.end_of_speech_at + info.end_of_utterance_delay
+        latency.user_turn_completed_started_at = start_time
+        latency.user_turn_completed_ended_at = start_time + callback_duration
+
         if self._user_turn_completed_atask != asyncio.current_task():
             # If a new user turn has already started, interrupt this one since it's now outdated
             # (We still create the SpeechHandle and the generate_reply coroutine, otherwise we may
@@ -973,6 +1063,7 @@ class AgentActivity(RecognitionHooks):
             on_user_turn_completed_delay=callback_duration,
             speech_id=speech_handle.id,
         )
+        get_process_registry().collect(eou_metrics)
         self._session.emit("metrics_collected", MetricsCollectedEvent(metrics=eou_metrics))
 
     # AudioRecognition is calling this method to retrieve the chat context before running the TurnDetector model  # noqa: E501
@@ -1060,6 +1151,7 @@ class AgentActivity(RecognitionHooks):
                 tasks.append(forward_task)
 
             audio_out.first_frame_fut.add_done_callback(_on_first_frame)
+            self._track_audio_latency(speech_handle, audio_output, audio_out)
 
         await speech_handle.wait_if_not_interrupted([*tasks])
 
@@ -1181,6 +1273,7 @@ class AgentActivity(RecognitionHooks):
             tasks.append(forward_task)
 
             audio_out.first_frame_fut.add_done_callback(_on_first_frame)
+            self._track_audio_latency(speech_handle, audio_output, audio_out)
         elif text_out is not None:
             text_out.first_text_fut.add_done_callback(_on_first_frame)
 
@@ -1485,6 +1578,7 @@ class AgentActivity(RecognitionHooks):
                             )
                             forward_tasks.append(forward_task)
                             audio_out.first_frame_fut.add_done_callback(_on_first_frame)
+                            self._track_audio_latency(speech_handle, audio_output, audio_out)
                     elif text_out is not None:
                         text_out.first_text_fut.add_done_callback(_on_first_frame)
 
@@ -19,6 +19,7 @@ from ..utils.misc import is_given
 from . import io, room_io
 from .agent import Agent
 from .agent_activity import AgentActivity
+from .audio_frontend import AudioFrontEnd
 from .audio_recognition import _TurnDetector
 from .events import (
     AgentEvent,
@@ -47,6 +48,7 @@ class VoiceOptions:
     max_endpointing_delay: float
     max_tool_steps: int
     user_away_timeout: float | None
+    stt_audio_gate: stt.AudioGateOptions | None
 
 
 Userdata_T = TypeVar("Userdata_T")
@@ -119,6 +121,7 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
         max_tool_steps: int = 3,
         video_sampler: NotGivenOr[_VideoSampler | None] = NOT_GIVEN,
         user_away_timeout: float | None = 15.0,
+        stt_audio_gate: stt.AudioGateOptions | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
         """`AgentSession` is the LiveKit Agents runtime that glues together
@@ -176,6 +179,10 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
             user_away_timeout (float, optional): If set, set the user state as
                 "away" after this amount of time after user and agent are silent.
                 Default ``15.0`` s, set to ``None`` to disable.
+            stt_audio_gate (stt.AudioGateOptions, optional): If set, only the user
+                speech (plus the pre-roll and hangover padding) is streamed to the
+                STT instead of the continuous audio. The gate follows the VAD when
+                one is available. Default ``None``.
             loop (asyncio.AbstractEventLoop, optional): Event loop to bind the
                 session to. Falls back to :pyfunc:`asyncio.get_event_loop()`.
         """
@@ -198,6 +205,7 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
             max_endpointing_delay=max_endpointing_delay,
             max_tool_steps=max_tool_steps,
             user_away_timeout=user_away_timeout,
+            stt_audio_gate=stt_audio_gate,
         )
         self._started = False
         self._turn_detection = turn_detection or None
@@ -225,6 +233,9 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
         # this is not exposed, if users want access to it, they can create their own RoomIO
         self._room_io: room_io.RoomIO | None = None
 
+        # shared by the activities so the user audio is resampled once per target rate
+        self._audio_frontend = AudioFrontEnd()
+
         self._agent: Agent | None = None
         self._activity: AgentActivity | None = None
         self._next_activity: AgentActivity | None = None
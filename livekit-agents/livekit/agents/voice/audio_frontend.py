@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from livekit import rtc
+
+
+class AudioFrontEnd:
+    def __init__(self) -> None:
+        """Resamples the user audio once per target rate and shares it between the consumers.
+
+        The STT, the VAD and the realtime model usually all need the user audio at a rate
+        that differs from the room's (e.g 48kHz -> 16kHz). Instead of each of them running its
+        own resampler on the same input, they ask the front-end for the rate they declare
+        (``input_sample_rate``), and consumers sharing a rate receive the exact same frames.
+        """
+        self._resamplers: dict[tuple[int, int, int], rtc.AudioResampler] = {}
+        self._last_frame: rtc.AudioFrame | None = None
+        self._cache: dict[int, list[rtc.AudioFrame]] = {}
+
+    def resample(self, frame: rtc.AudioFrame, sample_rate: int | None) -> list[rtc.AudioFrame]:
+        """Return ``frame`` resampled to ``sample_rate``, the frame is returned as is when
+        ``sample_rate`` is None or already matches.
+
+        Frames must be pushed in order, the result for the last pushed frame is cached so
+        it's only resampled once for every consumer of the same rate.
+        """
+        if sample_rate is None or sample_rate == frame.sample_rate:
+            return [frame]
+
+        if frame is not self._last_frame:
+            self._last_frame = frame
+            self._cache.clear()
+        elif (frames := self._cache.get(sample_rate)) is not None:
+            return frames
+
+        key = (frame.sample_rate, sample_rate, frame.num_channels)
+        if (resampler := self._resamplers.get(key)) is None:
+            resampler = self._resamplers[key] = rtc.AudioResampler(
+                input_rate=frame.sample_rate,
+                output_rate=sample_rate,
+                num_channels=frame.num_channels,
+                quality=rtc.AudioResamplerQuality.HIGH,
+            )
+
+        frames = self._cache[sample_rate] = resampler.push(frame)
+        return frames
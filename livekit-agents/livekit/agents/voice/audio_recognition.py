@@ -10,10 +10,12 @@ from livekit import rtc
 
 from .. import llm, stt, utils, vad
 from ..debug import tracing
+from ..ipc.inference_executor import _inference_timings, _InferenceTimings
 from ..log import logger
 from ..utils import aio
 from . import io
 from .agent import ModelSettings
+from .audio_frontend import AudioFrontEnd
 
 if TYPE_CHECKING:
     from .agent_session import TurnDetectionMode
@@ -26,6 +28,12 @@ class _EndOfTurnInfo:
     new_transcript: str
     transcription_delay: float
     end_of_utterance_delay: float
+    end_of_speech_at: float | None = None
+    final_transcript_at: float | None = None
+    eou_inference_started_at: float | None = None
+    eou_inference_ended_at: float | None = None
+    eou_inference_duration: float | None = None
+    eou_ipc_delay: float | None = None
 
 
 class _TurnDetector(Protocol):
@@ -54,6 +62,8 @@ class AudioRecognition:
         hooks: RecognitionHooks,
         stt: io.STTNode | None,
         vad: vad.VAD | None,
+        audio_frontend: AudioFrontEnd,
+        stt_sample_rate: int | None,
         turn_detector: _TurnDetector | None,
         min_endpointing_delay: float,
         max_endpointing_delay: float,
@@ -70,6 +80,9 @@ class AudioRecognition:
         self._turn_detector = turn_detector
         self._stt = stt
         self._vad = vad
+        self._audio_frontend = audio_frontend
+        self._stt_sample_rate = stt_sample_rate
+        self._vad_sample_rate = vad.input_sample_rate if vad else None
         self._turn_detection_mode = turn_detection_mode
         self._vad_base_turn_detection = turn_detection_mode in ("vad", None)
         self._user_turn_committed = False  # true if user turn ended but EOU task not done
@@ -105,10 +118,12 @@ class AudioRecognition:
     def push_audio(self, frame: rtc.AudioFrame) -> None:
         self._sample_rate = frame.sample_rate
         if self._stt_ch is not None:
-            self._stt_ch.send_nowait(frame)
+            for f in self._audio_frontend.resample(frame, self._stt_sample_rate):
+                self._stt_ch.send_nowait(f)
 
         if self._vad_ch is not None:
-            self._vad_ch.send_nowait(frame)
+            for f in self._audio_frontend.resample(frame, self._vad_sample_rate):
+                self._vad_ch.send_nowait(f)
 
     async def aclose(self) -> None:
         await aio.cancel_and_wait(*self._tasks)
@@ -313,12 +328,18 @@ class AudioRecognition:
         @utils.log_exceptions(logger=logger)
         async def _bounce_eou_task(last_speaking_time: float) -> None:
             endpointing_delay = self._min_endpointing_delay
+            eou_started_at: float | None = None
+            eou_ended_at: float | None = None
+            timings = _InferenceTimings()
 
             if turn_detector is not None:
                 if not turn_detector.supports_language(self._last_language):
                     logger.debug("Turn detector does not support language %s", self._last_language)
                 else:
+                    _inference_timings.set(timings)  # scoped to this task
+                    eou_started_at = time.time()
                     end_of_turn_probability = await turn_detector.predict_end_of_turn(chat_ctx)
+                    eou_ended_at = time.time()
                     tracing.Tracing.log_event(
                         "end of user turn probability",
                         {"probability": end_of_turn_probability},
@@ -341,6 +362,15 @@ class AudioRecognition:
                         self._last_final_transcript_time - last_speaking_time, 0
                     ),
                     end_of_utterance_delay=time.time() - last_speaking_time,
+                    end_of_speech_at=last_speaking_time,
+                    final_transcript_at=self._last_final_transcript_time or None,
+                    eou_inference_started_at=eou_started_at,
+                    eou_inference_ended_at=eou_ended_at,
+                    # only known when the model runs in the inference process
+                    eou_inference_duration=timings.duration if timings.round_trip else None,
+                    eou_ipc_delay=(
+                        timings.round_trip - timings.duration if timings.round_trip else None
+                    ),
                 )
             )
             if committed:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from collections.abc import AsyncGenerator, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
 from dataclasses import asdict
 from typing import Any
 
@@ -62,6 +62,22 @@ class DataStreamAudioOutput(AudioOutput):
         """Capture and stream audio frame to remote worker"""
         await super().capture_frame(frame)
 
+        stream_writer = await self._ensure_stream_writer(frame)
+        await stream_writer.write(bytes(frame.data))
+        self._pushed_duration += frame.duration
+
+    async def capture_frames(self, frames: Sequence[rtc.AudioFrame]) -> None:
+        """Capture and stream a burst of audio frames to remote worker in a single write"""
+        if not frames:
+            return
+
+        await super().capture_frame(frames[0])
+
+        stream_writer = await self._ensure_stream_writer(frames[0])
+        await stream_writer.write(b"".join(bytes(frame.data) for frame in frames))
+        self._pushed_duration += sum(frame.duration for frame in frames)
+
+    async def _ensure_stream_writer(self, frame: rtc.AudioFrame) -> rtc.ByteStreamWriter:
         if not self._stream_writer:
             self._stream_writer = await self._room.local_participant.stream_bytes(
                 name=utils.shortuuid("AUDIO_"),
@@ -73,8 +89,7 @@ class DataStreamAudioOutput(AudioOutput):
                 },
             )
             self._pushed_duration = 0.0
-        await self._stream_writer.write(bytes(frame.data))
-        self._pushed_duration += frame.duration
+        return self._stream_writer
 
     def flush(self) -> None:
         """Mark end of current audio segment"""
@@ -4,7 +4,12 @@ import asyncio
 import atexit
 import contextlib
 import enum
+import hashlib
+import os
 import random
+import tempfile
+import threading
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, AsyncIterator, Generator
 from importlib.resources import as_file, files
 from typing import Any, NamedTuple, Union, cast
@@ -327,25 +332,14 @@ class BackgroundAudioPlayer:
             sound = sound.path()
 
         if isinstance(sound, str):
-            if loop:
-                sound = _loop_audio_frames(sound)
-            else:
-                sound = audio_frames_from_file(sound)
+            # files are decoded once per process and scaled once per volume
+            sound = _audio_clip_frames(sound, volume=volume, loop=loop)
+        elif volume != 1.0:
+            sound = _scale_frames(sound, volume)
 
         async def _gen_wrapper() -> AsyncGenerator[rtc.AudioFrame, None]:
             async for frame in sound:
-                if volume != 1.0:
-                    data = np.frombuffer(frame.data, dtype=np.int16).astype(np.float32)
-                    data *= 10 ** (np.log10(volume))
-                    np.clip(data, -32768, 32767, out=data)
-                    yield rtc.AudioFrame(
-                        data=data.astype(np.int16).tobytes(),
-                        sample_rate=frame.sample_rate,
-                        num_channels=frame.num_channels,
-                        samples_per_channel=frame.samples_per_channel,
-                    )
-                else:
-                    yield frame
+                yield frame
 
             # TODO(theomonnom): the wait_for_playout() may be innaccurate by 400ms
             play_handle._mark_playout_done()
@@ -422,7 +416,239 @@ class PlayHandle:
             self._done_fut.set_result(None)
 
 
-async def _loop_audio_frames(file_path: str) -> AsyncGenerator[rtc.AudioFrame, None]:
-    while True:
-        async for frame in audio_frames_from_file(file_path):
-            yield frame
+_CLIP_SAMPLE_RATE = 48000
+_CLIP_FRAME_SIZE = 4800  # 100ms, same as the mixer blocksize
+
+# when set, decoded clips are stored in this directory and memory-mapped, so the PCM is
+# shared between the job processes through the page cache
+_CLIP_CACHE_DIR = os.getenv("LK_AUDIO_CLIP_CACHE_DIR")
+# ~11 minutes of decoded audio
+_CLIP_CACHE_MAX_BYTES = int(os.getenv("LK_AUDIO_CLIP_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+class _AudioClip:
+    """An audio file decoded to 48kHz mono int16 and scaled to a volume, shared read-only
+    across sessions"""
+
+    def __init__(self, data: np.ndarray, *, stamp: tuple[int, int]) -> None:
+        data.flags.writeable = False
+        self._data = data
+        self._stamp = stamp  # (size, mtime) of the decoded file
+
+    @property
+    def duration(self) -> float:
+        return len(self._data) / _CLIP_SAMPLE_RATE
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    async def frames(self, *, loop: bool = False) -> AsyncGenerator[rtc.AudioFrame, None]:
+        if len(self._data) == 0:
+            return
+
+        while True:
+            for i in range(0, len(self._data), _CLIP_FRAME_SIZE):
+                chunk = self._data[i : i + _CLIP_FRAME_SIZE]
+                yield rtc.AudioFrame(
+                    data=chunk.tobytes(),
+                    sample_rate=_CLIP_SAMPLE_RATE,
+                    num_channels=1,
+                    samples_per_channel=len(chunk),
+                )
+
+            if not loop:
+                break
+
+
+_ClipKey = tuple[str, float]  # (path, volume)
+
+
+class _ClipCache:
+    """LRU of the decoded clips (one per file and volume), bounded by their total size in
+    bytes"""
+
+    def __init__(self, *, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._clips: OrderedDict[_ClipKey, _AudioClip] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def get(self, key: _ClipKey, stamp: tuple[int, int]) -> _AudioClip | None:
+        with self._lock:
+            clip = self._clips.get(key)
+            if clip is None or clip._stamp != stamp:
+                return None
+
+            self._clips.move_to_end(key)
+            return clip
+
+    def put(self, key: _ClipKey, clip: _AudioClip) -> _AudioClip:
+        with self._lock:
+            if (cached := self._clips.get(key)) is not None:
+                if cached._stamp == clip._stamp:
+                    # another session decoded the same file concurrently
+                    self._clips.move_to_end(key)
+                    return cached
+
+                self._nbytes -= cached.nbytes  # the file changed
+                del self._clips[key]
+
+            if clip.nbytes > self._max_bytes:
+                return clip
+
+            self._clips[key] = clip
+            self._nbytes += clip.nbytes
+            while self._nbytes > self._max_bytes:
+                _, evicted = self._clips.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+            return clip
+
+
+_clip_cache = _ClipCache(max_bytes=_CLIP_CACHE_MAX_BYTES)
+
+
+def _clip_stamp(file_path: str) -> tuple[int, int]:
+    st = os.stat(file_path)
+    return st.st_size, st.st_mtime_ns
+
+
+async def _load_audio_clip(file_path: str, *, volume: float = 1.0) -> _AudioClip:
+    """Return the clip of a file at ``volume``, decoding the whole file if it isn't cached"""
+    file_path = os.path.abspath(file_path)
+    stamp = await asyncio.get_running_loop().run_in_executor(None, _clip_stamp, file_path)
+    if (clip := await _get_audio_clip(file_path, stamp, volume)) is not None:
+        return clip
+
+    chunks = [frame.data async for frame in _decode_audio_file(file_path)]
+    return await _put_audio_clip(file_path, stamp, chunks, volume)
+
+
+async def _audio_clip_frames(
+    file_path: str, *, volume: float = 1.0, loop: bool = False
+) -> AsyncGenerator[rtc.AudioFrame, None]:
+    """Play a file from the clip cache. When it isn't cached, the frames are played while the
+    file is decoded so long clips don't delay the playout, and the clip is cached once done"""
+    file_path = os.path.abspath(file_path)
+    stamp = await asyncio.get_running_loop().run_in_executor(None, _clip_stamp, file_path)
+    clip = await _get_audio_clip(file_path, stamp, volume)
+    if clip is None:
+        chunks: list[memoryview] = []
+        async for frame in _decode_audio_file(file_path):
+            chunks.append(frame.data)
+            yield _scale_frame(frame, volume) if volume != 1.0 else frame
+
+        clip = await _put_audio_clip(file_path, stamp, chunks, volume)
+        if not loop:
+            return
+
+    async for frame in clip.frames(loop=loop):
+        yield frame
+
+
+async def _get_audio_clip(
+    file_path: str, stamp: tuple[int, int], volume: float
+) -> _AudioClip | None:
+    if (clip := _clip_cache.get((file_path, volume), stamp)) is not None:
+        return clip
+
+    loop = asyncio.get_running_loop()
+    if (raw := _clip_cache.get((file_path, 1.0), stamp)) is None:
+        cache_file = _clip_cache_file(file_path, stamp)
+        if cache_file is None:
+            return None
+
+        data = await loop.run_in_executor(None, _read_clip_cache, cache_file)
+        if data is None:
+            return None
+
+        raw = _clip_cache.put((file_path, 1.0), _AudioClip(data, stamp=stamp))
+
+    if volume == 1.0:
+        return raw
+
+    scaled = await loop.run_in_executor(None, _scale_pcm, raw._data, volume)
+    return _clip_cache.put((file_path, volume), _AudioClip(scaled, stamp=stamp))
+
+
+async def _put_audio_clip(
+    file_path: str, stamp: tuple[int, int], chunks: list[memoryview], volume: float
+) -> _AudioClip:
+    loop = asyncio.get_running_loop()
+    cache_file = _clip_cache_file(file_path, stamp)
+    data = await loop.run_in_executor(None, _concat_pcm, chunks, cache_file)
+    raw = _clip_cache.put((file_path, 1.0), _AudioClip(data, stamp=stamp))
+    if volume == 1.0:
+        return raw
+
+    scaled = await loop.run_in_executor(None, _scale_pcm, raw._data, volume)
+    return _clip_cache.put((file_path, volume), _AudioClip(scaled, stamp=stamp))
+
+
+def _decode_audio_file(file_path: str) -> AsyncIterator[rtc.AudioFrame]:
+    # the decoding itself runs on the decoder executor
+    return audio_frames_from_file(file_path, sample_rate=_CLIP_SAMPLE_RATE, num_channels=1)
+
+
+def _clip_cache_file(file_path: str, stamp: tuple[int, int]) -> str | None:
+    if not _CLIP_CACHE_DIR:
+        return None
+
+    digest = hashlib.sha1(repr((file_path, stamp)).encode()).hexdigest()
+    return os.path.join(_CLIP_CACHE_DIR, f"{digest}.pcm")
+
+
+def _scale_pcm(data: np.ndarray, volume: float) -> np.ndarray:
+    scaled = data * np.float32(volume)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return scaled.astype(np.int16)
+
+
+def _scale_frame(frame: rtc.AudioFrame, volume: float) -> rtc.AudioFrame:
+    return rtc.AudioFrame(
+        data=_scale_pcm(np.frombuffer(frame.data, dtype=np.int16), volume).tobytes(),
+        sample_rate=frame.sample_rate,
+        num_channels=frame.num_channels,
+        samples_per_channel=frame.samples_per_channel,
+    )
+
+
+async def _scale_frames(
+    frames: AsyncIterator[rtc.AudioFrame], volume: float
+) -> AsyncGenerator[rtc.AudioFrame, None]:
+    async for frame in frames:
+        yield _scale_frame(frame, volume)
+
+
+def _concat_pcm(chunks: list[memoryview], cache_file: str | None) -> np.ndarray:
+    data = np.frombuffer(b"".join(chunks), dtype=np.int16)
+    if cache_file is not None and len(data):
+        data = _write_clip_cache(cache_file, data)
+
+    return data
+
+
+def _read_clip_cache(cache_file: str) -> np.ndarray | None:
+    if not os.path.exists(cache_file):
+        return None
+
+    return np.memmap(cache_file, dtype=np.int16, mode="r")
+
+
+def _write_clip_cache(cache_file: str, data: np.ndarray) -> np.ndarray:
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+            f.write(data.tobytes())
+
+        os.replace(f.name, cache_file)
+        return np.memmap(cache_file, dtype=np.int16, mode="r")
+    except OSError:
+        logger.warning("failed to write the audio clip cache", exc_info=True)
+        return data
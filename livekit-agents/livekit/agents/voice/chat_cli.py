@@ -107,6 +107,7 @@ class _AudioOutput(io.AudioOutput):
             self._capturing = True
             self._pushed_duration = 0.0
             self._capture_start = time.monotonic()
+            self.on_playback_started(created_at=time.time())
 
         self._pushed_duration += frame.duration
         with self._output_lock:
@@ -195,7 +195,8 @@ async def _text_forwarding_task(
 
 @dataclass
 class _AudioOutput:
-    audio: list[rtc.AudioFrame]
+    # the generated audio isn't kept, the playback position and the synchronized transcript
+    # are reported by the audio output
     first_frame_fut: asyncio.Future[None]
 
 
@@ -204,11 +205,14 @@ def perform_audio_forwarding(
     audio_output: io.AudioOutput,
     tts_output: AsyncIterable[rtc.AudioFrame],
 ) -> tuple[asyncio.Task[None], _AudioOutput]:
-    out = _AudioOutput(audio=[], first_frame_fut=asyncio.Future())
+    out = _AudioOutput(first_frame_fut=asyncio.Future())
     task = asyncio.create_task(_audio_forwarding_task(audio_output, tts_output, out))
     return task, out
 
 
+_MAX_CAPTURE_BATCH_DURATION = 2.0
+
+
 @utils.log_exceptions(logger=logger)
 async def _audio_forwarding_task(
     audio_output: io.AudioOutput,
@@ -218,8 +222,6 @@ async def _audio_forwarding_task(
     resampler: rtc.AudioResampler | None = None
     try:
         async for frame in tts_output:
-            out.audio.append(frame)
-
             if (
                 not out.first_frame_fut.done()
                 and audio_output.sample_rate is not None
@@ -232,11 +234,20 @@ async def _audio_forwarding_task(
                     num_channels=frame.num_channels,
                 )
 
+            frames = [frame]
+            if out.first_frame_fut.done() and isinstance(tts_output, aio.Chan):
+                # TTS audio often arrives in bursts, hand everything that is already
+                # available to the output in a single call (the first frame is always
+                # forwarded alone to keep the time to first audio low)
+                frames.extend(_drain_chan(tts_output, max_duration=_MAX_CAPTURE_BATCH_DURATION))
+
             if resampler:
-                for f in resampler.push(frame):
-                    await audio_output.capture_frame(f)
-            else:
-                await audio_output.capture_frame(frame)
+                frames = [rf for f in frames for rf in resampler.push(f)]
+
+            if len(frames) == 1:
+                await audio_output.capture_frame(frames[0])
+            elif frames:
+                await audio_output.capture_frames(frames)
 
             # set the first frame future if not already set
             # (after completing the first frame)
@@ -247,12 +258,27 @@ async def _audio_forwarding_task(
             await tts_output.aclose()
 
         if resampler:
-            for frame in resampler.flush():
-                await audio_output.capture_frame(frame)
+            if frames := resampler.flush():
+                await audio_output.capture_frames(frames)
 
         audio_output.flush()
 
 
+def _drain_chan(ch: aio.Chan[rtc.AudioFrame], *, max_duration: float) -> list[rtc.AudioFrame]:
+    frames: list[rtc.AudioFrame] = []
+    duration = 0.0
+    while duration < max_duration and not ch.empty():
+        try:
+            frame = ch.recv_nowait()
+        except (aio.channel.ChanEmpty, aio.ChanClosed):
+            break
+
+        frames.append(frame)
+        duration += frame.duration
+
+    return frames
+
+
 @dataclass
 class _ToolOutput:
     output: list[_PythonOutput]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterable, AsyncIterator, Awaitable
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Sequence
 from dataclasses import dataclass
 from typing import Callable, Literal, Optional, Union
 
@@ -88,7 +88,13 @@ class PlaybackFinishedEvent:
     When None, the transcript is not synchronized with the playback"""
 
 
-class AudioOutput(ABC, rtc.EventEmitter[Literal["playback_finished"]]):
+@dataclass
+class PlaybackStartedEvent:
+    created_at: float
+    """When the first audio frame of the segment started playing"""
+
+
+class AudioOutput(ABC, rtc.EventEmitter[Literal["playback_started", "playback_finished"]]):
     def __init__(
         self,
         *,
@@ -112,6 +118,10 @@ class AudioOutput(ABC, rtc.EventEmitter[Literal["playback_finished"]]):
         )
 
         if self._next_in_chain:
+            self._next_in_chain.on(
+                "playback_started",
+                lambda ev: self.on_playback_started(created_at=ev.created_at),
+            )
             self._next_in_chain.on(
                 "playback_finished",
                 lambda ev: self.on_playback_finished(
@@ -121,6 +131,13 @@ class AudioOutput(ABC, rtc.EventEmitter[Literal["playback_finished"]]):
                 ),
             )
 
+    def on_playback_started(self, *, created_at: float) -> None:
+        """
+        Audio sinks should call this method when the first frame of a segment starts playing,
+        it's used to measure the latency of the agent responses.
+        """
+        self.emit("playback_started", PlaybackStartedEvent(created_at=created_at))
+
     def on_playback_finished(
         self,
         *,
@@ -178,6 +195,15 @@ class AudioOutput(ABC, rtc.EventEmitter[Literal["playback_finished"]]):
             self.__capturing = True
             self.__playback_segments_count += 1
 
+    async def capture_frames(self, frames: Sequence[rtc.AudioFrame]) -> None:
+        """Capture multiple audio frames at once (e.g. a burst of synthesized audio)
+
+        The default implementation calls capture_frame for each frame. Audio sinks that can
+        handle a burst more efficiently (e.g. by coalescing the frames) should override it.
+        """
+        for frame in frames:
+            await self.capture_frame(frame)
+
     @abstractmethod
     def flush(self) -> None:
         """Flush any buffered audio, marking the current playback/segment as complete"""
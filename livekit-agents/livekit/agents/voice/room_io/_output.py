@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Sequence
+from typing import Any, Union
 
 from livekit import rtc
 
@@ -25,8 +28,14 @@ class _ParticipantAudioOutput(io.AudioOutput):
         sample_rate: int,
         num_channels: int,
         track_publish_options: rtc.TrackPublishOptions,
-        queue_size_ms: int = 100_000,  # TODO(long): move buffer to python
+        queue_size_ms: int = 200,
+        pacing_chunk_ms: int = 20,
     ) -> None:
+        """
+        The synthesized audio is buffered in python and paced to the native audio source in
+        small chunks, the native queue only holds `queue_size_ms` of audio. This bounds the
+        native memory, makes the interruptions instant and the playback position exact.
+        """
         super().__init__(next_in_chain=None, sample_rate=sample_rate)
         self._room = room
         self._lock = asyncio.Lock()
@@ -35,13 +44,23 @@ class _ParticipantAudioOutput(io.AudioOutput):
         self._publication: rtc.LocalTrackPublication | None = None
         self._started_fut = asyncio.Future[None]()
 
+        self._audio_bstream = utils.audio.AudioByteStream(
+            sample_rate, num_channels, samples_per_channel=sample_rate * pacing_chunk_ms // 1000
+        )
+        self._audio_buf = utils.aio.Chan[Union[rtc.AudioFrame, asyncio.Future[None]]]()
+        self._forward_atask: asyncio.Task[None] | None = None
+        self._capture_done = asyncio.Event()  # cleared while a chunk is being captured
+        self._capture_done.set()
+
         # used to republish track on reconnection
         self._republish_task: asyncio.Task[None] | None = None
         self._flush_task: asyncio.Task[None] | None = None
         self._interrupted_event = asyncio.Event()
 
         self._pushed_duration: float = 0.0
+        self._forwarded_duration: float = 0.0  # duration pushed to the native audio source
         self._interrupted: bool = False
+        self._buffer_generation = 0  # incremented when the buffered audio is cleared
 
     async def _publish_track(self) -> None:
         async with self._lock:
@@ -53,6 +72,7 @@ class _ParticipantAudioOutput(io.AudioOutput):
 
     async def start(self) -> None:
         await self._publish_track()
+        self._forward_atask = asyncio.create_task(self._forward_audio())
         self._started_fut.set_result(None)
         self._room.on("reconnected", self._on_reconnected)
 
@@ -62,24 +82,37 @@ class _ParticipantAudioOutput(io.AudioOutput):
             await utils.aio.cancel_and_wait(self._republish_task)
         if self._flush_task:
             await utils.aio.cancel_and_wait(self._flush_task)
+        if self._forward_atask:
+            await utils.aio.cancel_and_wait(self._forward_atask)
 
         await self._audio_source.aclose()
 
     async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await self.capture_frames([frame])
+
+    async def capture_frames(self, frames: Sequence[rtc.AudioFrame]) -> None:
+        if not frames:
+            return
+
         await self._started_fut
 
-        await super().capture_frame(frame)
+        await super().capture_frame(frames[0])
 
         if self._flush_task and not self._flush_task.done():
             logger.error("capture_frame called while flush is in progress")
             await self._flush_task
 
-        self._pushed_duration += frame.duration
-        await self._audio_source.capture_frame(frame)
+        for frame in frames:
+            self._pushed_duration += frame.duration
+            for f in self._audio_bstream.push(frame.data):
+                self._audio_buf.send_nowait(f)
 
     def flush(self) -> None:
         super().flush()
 
+        for f in self._audio_bstream.flush():
+            self._audio_buf.send_nowait(f)
+
         if not self._pushed_duration:
             return
 
@@ -88,32 +121,74 @@ class _ParticipantAudioOutput(io.AudioOutput):
             logger.error("flush called while playback is in progress")
             self._flush_task.cancel()
 
-        self._flush_task = asyncio.create_task(self._wait_for_playout())
+        # marks the end of the segment, resolved by the forwarding task once played out
+        playout_fut = asyncio.Future[None]()
+        self._audio_buf.send_nowait(playout_fut)
+        self._flush_task = asyncio.create_task(self._wait_for_playout(playout_fut))
 
     def clear_buffer(self) -> None:
         if not self._pushed_duration:
             return
+
+        # drop the buffered audio right away, it never reaches the native audio source
+        self._audio_bstream.flush()
+        while True:
+            try:
+                item = self._audio_buf.recv_nowait()
+            except (utils.aio.channel.ChanEmpty, utils.aio.ChanClosed):
+                break
+
+            if isinstance(item, asyncio.Future) and not item.done():
+                item.set_result(None)
+
+        # the end of the segment may have been dropped, the next chunk starts a new one
+        self._buffer_generation += 1
         self._interrupted_event.set()
 
-    async def _wait_for_playout(self) -> None:
+    async def _forward_audio(self) -> None:
+        started_generation: int | None = None  # buffer generation of the started segment
+        async for item in self._audio_buf:
+            if isinstance(item, asyncio.Future):
+                await self._audio_source.wait_for_playout()
+                if not item.done():
+                    item.set_result(None)
+                started_generation = None
+                continue
+
+            generation = self._buffer_generation
+            # the native queue is small, capture_frame waits until there is room for the chunk
+            self._capture_done.clear()
+            try:
+                await self._audio_source.capture_frame(item)
+                self._forwarded_duration += item.duration
+            finally:
+                self._capture_done.set()
+
+            if started_generation != generation and generation == self._buffer_generation:
+                # the queue is drained between segments, the first chunk plays right away.
+                # a chunk captured while the buffer was cleared belongs to the interrupted one
+                started_generation = generation
+                self.on_playback_started(created_at=time.time())
+
+    async def _wait_for_playout(self, playout_fut: asyncio.Future[None]) -> None:
         wait_for_interruption = asyncio.create_task(self._interrupted_event.wait())
-        wait_for_playout = asyncio.create_task(self._audio_source.wait_for_playout())
-        await asyncio.wait(
-            [wait_for_playout, wait_for_interruption],
-            return_when=asyncio.FIRST_COMPLETED,
-        )
+        waiters: list[asyncio.Future[Any]] = [playout_fut, wait_for_interruption]
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
 
         interrupted = wait_for_interruption.done()
         pushed_duration = self._pushed_duration
 
         if interrupted:
-            pushed_duration = max(pushed_duration - self._audio_source.queued_duration, 0)
+            # the python buffer is already dropped, let the chunk being captured (if any)
+            # reach the native queue instead of cancelling the native call, then clear it
+            await self._capture_done.wait()
+            pushed_duration = max(self._forwarded_duration - self._audio_source.queued_duration, 0)
             self._audio_source.clear_queue()
-            wait_for_playout.cancel()
         else:
             wait_for_interruption.cancel()
 
         self._pushed_duration = 0
+        self._forwarded_duration = 0
         self._interrupted_event.clear()
         self.on_playback_finished(playback_position=pushed_duration, interrupted=interrupted)
 
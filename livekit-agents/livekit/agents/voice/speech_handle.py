@@ -6,6 +6,7 @@ from collections.abc import Generator
 from typing import Any, Callable
 
 from .. import llm, utils
+from ..metrics import TurnLatencyMetrics
 
 
 class SpeechHandle:
@@ -33,6 +34,7 @@ class SpeechHandle:
         self._parent = parent
 
         self._chat_message: llm.ChatMessage | None = None
+        self._latency = TurnLatencyMetrics(speech_id=speech_id)
 
     @staticmethod
     def create(
@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import functools
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Callable
 
@@ -492,6 +493,23 @@ class _SyncedAudioOutput(io.AudioOutput):
 
         self._synchronizer._impl.push_audio(frame)
 
+    async def capture_frames(self, frames: Sequence[rtc.AudioFrame]) -> None:
+        if not frames:
+            return
+
+        await self._synchronizer.barrier()
+
+        self._capturing = True
+        await super().capture_frame(frames[0])
+        await self._next_in_chain.capture_frames(frames)  # passthrough audio
+        self._pushed_duration += sum(frame.duration for frame in frames)
+
+        if not self._synchronizer.enabled:
+            return
+
+        for frame in frames:
+            self._synchronizer._impl.push_audio(frame)
+
     def flush(self) -> None:
         super().flush()
         self._next_in_chain.flush()
@@ -23,13 +23,12 @@ import math
 import multiprocessing as mp
 import os
 import sys
-import threading
 import time
 from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import reduce
-from typing import Any, Callable, Generic, Literal, TypeVar
+from typing import Any, Callable, Generic, Literal, TypeVar, cast
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
@@ -52,10 +51,12 @@ from .job import (
     RunningJobInfo,
 )
 from .log import DEV_LEVEL, logger
+from .metrics.registry import MetricsRegistry
 from .plugin import Plugin
 from .types import NOT_GIVEN, NotGivenOr
 from .utils import is_given
-from .utils.hw import get_cpu_monitor
+from .utils.http_context import HTTPSessionOptions
+from .utils.hw import ResourceMonitor, ResourceUsage, get_cpu_monitor
 from .version import __version__
 
 ASSIGNMENT_TIMEOUT = 7.5
@@ -82,34 +83,28 @@ class SimulateJobInfo:
     participant_identity: str | None = None
 
 
-class _DefaultLoadCalc:
-    _instance = None
-
-    def __init__(self) -> None:
-        self._m_avg = utils.MovingAverage(5)  # avg over 2.5
-        self._cpu_monitor = get_cpu_monitor()
-        self._thread = threading.Thread(
-            target=self._calc_load, daemon=True, name="worker_cpu_load_monitor"
-        )
-        self._lock = threading.Lock()
-        self._thread.start()
+# the inference process is considered fully loaded when its p95 latency or the number of
+# pending requests reach these values
+INFERENCE_P95_BUDGET = 0.5
+INFERENCE_MAX_PENDING = 32
 
-    def _calc_load(self) -> None:
-        while True:
-            cpu_p = self._cpu_monitor.cpu_percent(interval=0.5)
-            with self._lock:
-                self._m_avg.add_sample(cpu_p)
 
-    def _get_avg(self) -> float:
-        with self._lock:
-            return self._m_avg.get_avg()
+class _DefaultLoadCalc:
+    """Composite load of the worker, the most loaded resource (CPU, memory or the inference
+    process) determines the load."""
 
-    @classmethod
-    def get_load(cls, worker: Worker) -> float:
-        if cls._instance is None:
-            cls._instance = _DefaultLoadCalc()
+    @staticmethod
+    def get_load(worker: Worker) -> float:
+        inference = 0.0
+        if (inf_executor := worker._inference_executor) is not None:
+            inference = max(
+                inf_executor.latency_p95 / INFERENCE_P95_BUDGET,
+                inf_executor.pending_requests / INFERENCE_MAX_PENDING,
+            )
 
-        return cls._instance._m_avg.get_avg()
+        cpu, memory = worker._cpu_avg.get_avg(), worker._memory_avg.get_avg()
+        tracing.Tracing.store_kv("load", {"cpu": cpu, "memory": memory, "inference": inference})
+        return min(max(cpu, memory, inference), 1.0)
 
 
 @dataclass
@@ -134,16 +129,22 @@ T = TypeVar("T")
 
 @dataclass(frozen=True)
 class _WorkerEnvOption(Generic[T]):
-    dev_default: T
-    prod_default: T
+    dev_default: T | Callable[[], T]
+    prod_default: T | Callable[[], T]
+    """a callable default is resolved when the option is read (must be pickle-able)"""
 
     @staticmethod
     def getvalue(opt: T | _WorkerEnvOption[T], devmode: bool) -> T:
         if isinstance(opt, _WorkerEnvOption):
-            return opt.dev_default if devmode else opt.prod_default
+            value = opt.dev_default if devmode else opt.prod_default
+            return cast(T, value() if callable(value) else value)
         return opt
 
 
+def _cpu_count_ceil() -> int:
+    return math.ceil(get_cpu_monitor().cpu_count())
+
+
 # NOTE: this object must be pickle-able
 @dataclass
 class WorkerOptions:
@@ -164,6 +165,9 @@ class WorkerOptions:
     )
     """When the load exceeds this threshold, the worker will be marked as unavailable.
 
+    Jobs that would bring the load over it are rejected right away when ``request_fnc`` isn't
+    set, a custom ``request_fnc`` is still called and decides.
+
     Defaults to 0.75 on "production" mode, and is disabled in "development" mode.
     """
 
@@ -177,7 +181,7 @@ class WorkerOptions:
     drain_timeout: int = 1800
     """Number of seconds to wait for current jobs to finish upon receiving TERM or INT signal."""
     num_idle_processes: int | _WorkerEnvOption[int] = _WorkerEnvOption(
-        dev_default=0, prod_default=math.ceil(get_cpu_monitor().cpu_count())
+        dev_default=0, prod_default=_cpu_count_ceil
     )
     """Number of idle processes to keep warm."""
     shutdown_process_timeout: float = 60.0
@@ -220,6 +224,9 @@ class WorkerOptions:
 
     By default it uses ``HTTP_PROXY`` or ``HTTPS_PROXY`` from environment
     """
+    http_options: HTTPSessionOptions = field(default_factory=HTTPSessionOptions)
+    """Tuning of the HTTP session shared by the plugins of a job (connection limits, keepalive,
+    DNS cache) and the provider endpoints to connect to as soon as a job process starts."""
     multiprocessing_context: Literal["spawn", "forkserver"] = (
         "spawn" if not sys.platform.startswith("linux") else "forkserver"
     )
@@ -309,6 +316,7 @@ class Worker(utils.EventEmitter[EventTypes]):
                 http_proxy=opts.http_proxy or None,
             )
 
+        self._metrics_registry = MetricsRegistry()
         self._proc_pool = ipc.proc_pool.ProcPool(
             initialize_process_fnc=opts.prewarm_fnc,
             job_entrypoint_fnc=opts.entrypoint_fnc,
@@ -322,6 +330,8 @@ class Worker(utils.EventEmitter[EventTypes]):
             memory_warn_mb=opts.job_memory_warn_mb,
             memory_limit_mb=opts.job_memory_limit_mb,
             http_proxy=opts.http_proxy or None,
+            http_options=opts.http_options,
+            metrics_registry=self._metrics_registry,
         )
 
         self._previous_status = agent.WorkerStatus.WS_AVAILABLE
@@ -347,14 +357,50 @@ class Worker(utils.EventEmitter[EventTypes]):
             )
             return web.Response(body=body, content_type="application/json")
 
+        async def metrics(_: Any) -> web.Response:
+            gauges = {
+                "lk_agents_worker_load": ("Current load of the worker", self._worker_load),
+                "lk_agents_active_jobs": ("Number of running jobs", len(self.active_jobs)),
+                "lk_agents_processes": (
+                    "Number of job processes",
+                    len(self._proc_pool.processes),
+                ),
+                "lk_agents_idle_processes": (
+                    "Number of warmed processes waiting for a job",
+                    self._proc_pool.num_idle_processes,
+                ),
+                "lk_agents_warming_processes": (
+                    "Number of processes being initialized",
+                    self._proc_pool.num_warming_processes,
+                ),
+            }
+            if self._inference_executor is not None:
+                gauges["lk_agents_inference_pending_requests"] = (
+                    "Number of inference requests waiting for a result",
+                    self._inference_executor.pending_requests,
+                )
+
+            return web.Response(
+                text=self._metrics_registry.render(gauges),
+                content_type="text/plain; version=0.0.4",
+            )
+
         self._http_server.app.add_routes([web.get("/", health_check)])
         self._http_server.app.add_routes([web.get("/worker", worker)])
+        self._http_server.app.add_routes([web.get("/metrics", metrics)])
         self._http_server.app.add_subapp("/debug", tracing._create_tracing_app(self))
 
         self._conn_task: asyncio.Task[None] | None = None
         self._load_task: asyncio.Task[None] | None = None
 
         self._worker_load: float = 0.0
+        self._resource_monitor = ResourceMonitor()
+        self._cpu_avg = utils.MovingAverage(5)  # avg over 2.5s
+        self._memory_avg = utils.MovingAverage(5)
+        # load of the worker without any job (runtime, idle processes, other tenants of the
+        # host) and load added by a single job on top of it, learned from the running jobs
+        self._idle_load = utils.ExpFilter(alpha=0.9)
+        self._job_cost = utils.ExpFilter(alpha=0.9)
         self._worker_load_graph = tracing.Tracing.add_graph(
             title="worker_load",
             x_label="time",
@@ -364,6 +410,31 @@ class Worker(utils.EventEmitter[EventTypes]):
             max_data_points=int(1 / UPDATE_LOAD_INTERVAL * 30),
         )
 
+        self._cpu_graph = tracing.Tracing.add_graph(
+            title="cpu",
+            x_label="time",
+            y_label="usage",
+            x_type="time",
+            y_range=(0, 1),
+            max_data_points=int(1 / UPDATE_LOAD_INTERVAL * 30),
+        )
+        self._memory_graph = tracing.Tracing.add_graph(
+            title="memory",
+            x_label="time",
+            y_label="usage",
+            x_type="time",
+            y_range=(0, 1),
+            max_data_points=int(1 / UPDATE_LOAD_INTERVAL * 30),
+        )
+        self._pressure_graph = tracing.Tracing.add_graph(
+            title="cpu_pressure",
+            x_label="time",
+            y_label="stall",
+            x_type="time",
+            y_range=(0, 1),
+            max_data_points=int(1 / UPDATE_LOAD_INTERVAL * 30),
+        )
+
         default_num_idle_processes = _WorkerEnvOption.getvalue(
             self._opts.num_idle_processes, self._devmode
         )
@@ -401,7 +472,9 @@ class Worker(utils.EventEmitter[EventTypes]):
         if self._opts.multiprocessing_context == "forkserver":
             plugin_packages = [p.package for p in Plugin.registered_plugins]
             logger.info("preloading plugins", extra={"packages": plugin_packages})
-            self._mp_ctx.set_forkserver_preload(plugin_packages)
+            self._mp_ctx.set_forkserver_preload(
+                [*plugin_packages, "livekit.agents.ipc._forkserver_prewarm"]
+            )
 
         if self._inference_executor is not None:
             logger.info("starting inference executor")
@@ -435,6 +508,14 @@ class Worker(utils.EventEmitter[EventTypes]):
             while True:
                 await interval.tick()
 
+                # without a cgroup limit, the memory is read by walking the process tree
+                usage = await self._loop.run_in_executor(None, self._resource_monitor.sample)
+                self._cpu_avg.add_sample(usage.cpu)
+                self._memory_avg.add_sample(usage.memory)
+                self._cpu_graph.plot(usage.timestamp, usage.cpu)
+                self._memory_graph.plot(usage.timestamp, usage.memory)
+                self._pressure_graph.plot(usage.timestamp, usage.cpu_pressure)
+
                 def load_fnc() -> float:
                     signature = inspect.signature(self._opts.load_fnc)
                     parameters = list(signature.parameters.values())
@@ -450,10 +531,12 @@ class Worker(utils.EventEmitter[EventTypes]):
                     self._opts.num_idle_processes, self._devmode
                 )
 
+                active_jobs = len(self.active_jobs)
+                self._learn_job_cost(active_jobs)
+
                 if not math.isinf(load_threshold):
-                    active_jobs = len(self.active_jobs)
                     if active_jobs > 0:
-                        job_load = self._worker_load / len(self.active_jobs)
+                        job_load = self._estimated_job_cost()
                         if job_load > 0.0:
                             available_load = max(load_threshold - self._worker_load, 0.0)
                             available_job = min(
@@ -813,6 +896,35 @@ class Worker(utils.EventEmitter[EventTypes]):
         )
         self.emit("worker_registered", reg.worker_id, reg.server_info)
 
+    @property
+    def resource_usage(self) -> ResourceUsage:
+        """CPU, memory and pressure stall metrics of the worker host (or container), sampled
+        every 0.5s. Can be used by a custom `load_fnc`."""
+        return self._resource_monitor.usage
+
+    def _learn_job_cost(self, active_jobs: int) -> None:
+        if self._proc_pool.num_warming_processes > 0:
+            return  # warming processes temporarily inflate the load, don't learn from it
+
+        if active_jobs == 0:
+            self._idle_load.apply(1.0, self._worker_load)
+            return
+
+        idle_load = self._idle_load.filtered()
+        if idle_load < 0.0:
+            return  # no idle baseline yet
+
+        self._job_cost.apply(1.0, max(self._worker_load - idle_load, 0.0) / active_jobs)
+
+    def _estimated_job_cost(self) -> float:
+        return max(self._job_cost.filtered(), 0.0)  # -1 until the first job is measured
+
+    def _projected_load(self) -> float:
+        """Current load including the jobs accepted but not yet running"""
+        return min(
+            self._worker_load + len(self._pending_assignments) * self._estimated_job_cost(), 1.0
+        )
+
     def _handle_availability(self, msg: agent.AvailabilityRequest) -> None:
         task = self._loop.create_task(self._answer_availability(msg))
         self._tasks.add(task)
@@ -859,6 +971,8 @@ class Worker(utils.EventEmitter[EventTypes]):
                     extra={"job_request": job_req, "agent_name": self._opts.agent_name},
                 )
                 raise AssignmentTimeoutError() from None
+            finally:
+                self._pending_assignments.pop(job_req.id, None)
 
             job_assign = wait_assignment.result()
             running_info = RunningJobInfo(
@@ -886,6 +1000,22 @@ class Worker(utils.EventEmitter[EventTypes]):
 
         @utils.log_exceptions(logger=logger)
         async def _job_request_task() -> None:
+            load_threshold = _WorkerEnvOption.getvalue(self._opts.load_threshold, self._devmode)
+            projected_load = self._projected_load() + self._estimated_job_cost()
+            if projected_load >= load_threshold:
+                extra = {
+                    "job_id": msg.job.id,
+                    "projected_load": projected_load,
+                    "threshold": load_threshold,
+                }
+                if self._opts.request_fnc is _default_request_fnc:
+                    logger.info("rejecting job, not enough capacity", extra=extra)
+                    await _on_reject()
+                    return
+
+                # a custom request_fnc may still accept it (e.g. priority jobs)
+                logger.debug("job request over capacity, deferring to request_fnc", extra=extra)
+
             try:
                 await self._opts.request_fnc(job_req)
             except Exception:
@@ -932,20 +1062,21 @@ class Worker(utils.EventEmitter[EventTypes]):
             return
 
         load_threshold = _WorkerEnvOption.getvalue(self._opts.load_threshold, self._devmode)
-        is_full = self._worker_load >= load_threshold
+        load = self._projected_load()
+        is_full = load >= load_threshold
         currently_available = not is_full and not self._draining
 
         status = (
             agent.WorkerStatus.WS_AVAILABLE if currently_available else agent.WorkerStatus.WS_FULL
         )
 
-        update = agent.UpdateWorkerStatus(load=self._worker_load, status=status, job_count=job_cnt)
+        update = agent.UpdateWorkerStatus(load=load, status=status, job_count=job_cnt)
 
         # only log if status has changed
         if self._previous_status != status and not self._draining:
             self._previous_status = status
             extra = {
-                "load": self._worker_load,
+                "load": load,
                 "threshold": self._opts.load_threshold,
             }
             if is_full:
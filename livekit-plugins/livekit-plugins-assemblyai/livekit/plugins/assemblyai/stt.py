@@ -44,6 +44,7 @@ from .log import logger
 
 ENGLISH = "en"
 DEFAULT_ENCODING = "pcm_s16le"
+WS_URL = "wss://api.assemblyai.com/v2/realtime/ws"
 
 # Define bytes per frame for different encoding types
 bytes_per_frame = {
@@ -114,6 +115,9 @@ class STT(stt.STT):
             self._session = utils.http_context.http_session()
         return self._session
 
+    def prewarm(self) -> None:
+        utils.http_context.prewarm_connection(WS_URL, session=self.session)
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -123,6 +127,10 @@ class STT(stt.STT):
     ) -> stt.SpeechEvent:
         raise NotImplementedError("Not implemented")
 
+    @property
+    def input_sample_rate(self) -> int:
+        return self._opts.sample_rate
+
     def stream(
         self,
         *,
@@ -340,9 +348,8 @@ class SpeechStream(stt.SpeechStream):
             "Content-Type": "application/json",
         }
 
-        ws_url = "wss://api.assemblyai.com/v2/realtime/ws"
         filtered_config = {k: v for k, v in live_config.items() if v is not None}
-        url = f"{ws_url}?{urlencode(filtered_config).lower()}"
+        url = f"{WS_URL}?{urlencode(filtered_config).lower()}"
         ws = await self._session.ws_connect(url, headers=headers)
         return ws
 
@@ -15,8 +15,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
 import os
 import weakref
 from dataclasses import dataclass, replace
@@ -35,6 +33,7 @@ from livekit.agents import (
 )
 from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, NotGivenOr
 from livekit.agents.utils import is_given
+from livekit.agents.utils.ws_multiplexer import MultiplexedContext
 
 from .log import logger
 from .models import (
@@ -125,23 +124,33 @@ class TTS(tts.TTS):
             base_url=base_url,
         )
         self._session = http_session
-        self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
-            connect_cb=self._connect_ws,
-            close_cb=self._close_ws,
-            max_session_duration=300,
-            mark_refreshed_on_get=True,
-        )
         self._streams = weakref.WeakSet[SynthesizeStream]()
+        self._multiplexers: set[utils.WebSocketMultiplexer] = set()
 
-    async def _connect_ws(self, timeout: float) -> aiohttp.ClientWebSocketResponse:
+    def _multiplexer(self) -> utils.WebSocketMultiplexer:
+        """The streams of every TTS instance of the process using the same key and session
+        share a few websockets, a stream only opens a context on one of them"""
         session = self._ensure_session()
         url = self._opts.get_ws_url(
             f"/tts/websocket?api_key={self._opts.api_key}&cartesia_version={API_VERSION}"
         )
-        return await asyncio.wait_for(session.ws_connect(url), timeout)
 
-    async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse):
-        await ws.close()
+        async def _connect_ws(timeout: float) -> aiohttp.ClientWebSocketResponse:
+            return await asyncio.wait_for(session.ws_connect(url), timeout)
+
+        mux = utils.WebSocketMultiplexer.shared(
+            (url, session),
+            lambda: utils.WebSocketMultiplexer(
+                connect_cb=_connect_ws,
+                context_id_fnc=lambda data: data.get("context_id"),
+                cancel_packet_fnc=lambda context_id: {"context_id": context_id, "cancel": True},
+                max_session_duration=300,
+                label=self.label,
+            ),
+            owner=self,
+        )
+        self._multiplexers.add(mux)
+        return mux
 
     def _ensure_session(self) -> aiohttp.ClientSession:
         if not self._session:
@@ -150,7 +159,7 @@ class TTS(tts.TTS):
         return self._session
 
     def prewarm(self) -> None:
-        self._pool.prewarm()
+        self._multiplexer().prewarm()
 
     def update_options(
         self,
@@ -200,7 +209,10 @@ class TTS(tts.TTS):
             await stream.aclose()
 
         self._streams.clear()
-        await self._pool.aclose()
+
+        for mux in self._multiplexers:
+            await mux.release(self)
+        self._multiplexers.clear()
 
 
 class ChunkedStream(tts.ChunkedStream):
@@ -270,27 +282,26 @@ class SynthesizeStream(tts.SynthesizeStream):
         last_segment_id: str | None = None
         input_ended = False
 
-        async def _sentence_stream_task(ws: aiohttp.ClientWebSocketResponse):
+        async def _sentence_stream_task(ctx: MultiplexedContext):
             nonlocal last_segment_id, input_ended
 
-            context_id = utils.shortuuid()
-            last_segment_id = context_id  # no multi-segment support yet
+            last_segment_id = ctx.context_id  # no multi-segment support yet
 
             base_pkt = _to_cartesia_options(self._opts)
             async for ev in self._sent_tokenizer_stream:
                 token_pkt = base_pkt.copy()
-                token_pkt["context_id"] = context_id
+                token_pkt["context_id"] = ctx.context_id
                 token_pkt["transcript"] = ev.token + " "
                 token_pkt["continue"] = True
                 self._mark_started()
-                await ws.send_str(json.dumps(token_pkt))
+                await ctx.send(token_pkt)
 
             end_pkt = base_pkt.copy()
-            end_pkt["context_id"] = context_id
+            end_pkt["context_id"] = ctx.context_id
             end_pkt["transcript"] = " "
             end_pkt["continue"] = False
             input_ended = True
-            await ws.send_str(json.dumps(end_pkt))
+            await ctx.send(end_pkt)
 
         async def _input_task():
             async for data in self._input_ch:
@@ -302,47 +313,36 @@ class SynthesizeStream(tts.SynthesizeStream):
 
             self._sent_tokenizer_stream.end_input()
 
-        async def _recv_task(ws: aiohttp.ClientWebSocketResponse):
+        async def _recv_task(ctx: MultiplexedContext):
             current_segment_id: str | None = None
             while True:
-                msg = await ws.receive()
-                if msg.type in (
-                    aiohttp.WSMsgType.CLOSED,
-                    aiohttp.WSMsgType.CLOSE,
-                    aiohttp.WSMsgType.CLOSING,
-                ):
-                    raise APIStatusError(
-                        "Cartesia connection closed unexpectedly", request_id=request_id
-                    )
-
-                if msg.type != aiohttp.WSMsgType.TEXT:
-                    logger.warning("unexpected Cartesia message type %s", msg.type)
-                    continue
-
-                data = json.loads(msg.data)
+                data = await ctx.recv()
                 segment_id = data.get("context_id")
                 if current_segment_id is None:
                     current_segment_id = segment_id
                     output_emitter.start_segment(segment_id=segment_id)
 
                 if data.get("data"):
-                    b64data = base64.b64decode(data["data"])
+                    b64data = utils.serialization.b64decode(data["data"])
                     output_emitter.push(b64data)
                 elif data.get("done"):
                     current_segment_id = None
 
                     if input_ended and segment_id == last_segment_id:  # last segment
+                        ctx.mark_done()
                         output_emitter.end_input()
                         break
                 else:
                     logger.warning("unexpected message %s", data)
 
         try:
-            async with self._tts._pool.connection(timeout=self._conn_options.timeout) as ws:
+            async with self._tts._multiplexer().context(
+                utils.shortuuid(), timeout=self._conn_options.timeout
+            ) as ctx:
                 tasks = [
                     asyncio.create_task(_input_task()),
-                    asyncio.create_task(_sentence_stream_task(ws)),
-                    asyncio.create_task(_recv_task(ws)),
+                    asyncio.create_task(_sentence_stream_task(ctx)),
+                    asyncio.create_task(_recv_task(ctx)),
                 ]
 
                 try:
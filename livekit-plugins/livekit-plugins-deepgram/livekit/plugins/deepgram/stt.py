@@ -217,6 +217,9 @@ class STT(stt.STT):
 
         return self._session
 
+    def prewarm(self) -> None:
+        utils.http_context.prewarm_connection(self._base_url, session=self._ensure_session())
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -269,6 +272,10 @@ class STT(stt.STT):
         except Exception as e:
             raise APIConnectionError() from e
 
+    @property
+    def input_sample_rate(self) -> int:
+        return self._opts.sample_rate
+
     def stream(
         self,
         *,
@@ -401,12 +408,19 @@ class SpeechStream(stt.SpeechStream):
             duration=5.0,
         )
 
-        self._audio_energy_filter: AudioEnergyFilter | None = None
         if opts.energy_filter:
-            if isinstance(opts.energy_filter, AudioEnergyFilter):
-                self._audio_energy_filter = opts.energy_filter
-            else:
-                self._audio_energy_filter = AudioEnergyFilter()
+            energy_filter = (
+                opts.energy_filter
+                if isinstance(opts.energy_filter, AudioEnergyFilter)
+                else AudioEnergyFilter()
+            )
+            # the silence suppression is done by the audio gate of the base stream
+            self.enable_audio_gate(
+                stt.AudioGateOptions(
+                    hangover=energy_filter._cooldown_seconds,
+                    rms_threshold=energy_filter._rms_threshold,
+                )
+            )
 
         self._request_id = ""
         self._reconnect_event = asyncio.Event()
@@ -490,27 +504,10 @@ class SpeechStream(stt.SpeechStream):
             )
 
             has_ended = False
-            last_frame: rtc.AudioFrame | None = None
             async for data in self._input_ch:
                 frames: list[rtc.AudioFrame] = []
                 if isinstance(data, rtc.AudioFrame):
-                    state = self._check_energy_state(data)
-                    if state in (
-                        AudioEnergyFilter.State.START,
-                        AudioEnergyFilter.State.SPEAKING,
-                    ):
-                        if last_frame:
-                            frames.extend(audio_bstream.write(last_frame.data.tobytes()))
-                            last_frame = None
-                        frames.extend(audio_bstream.write(data.data.tobytes()))
-                    elif state == AudioEnergyFilter.State.END:
-                        # no need to buffer as we have cooldown period
-                        frames.extend(audio_bstream.flush())
-                        has_ended = True
-                    elif state == AudioEnergyFilter.State.SILENCE:
-                        # buffer the last silence frame, since it could contain beginning of speech
-                        # TODO: improve accuracy by using a ring buffer with longer window
-                        last_frame = data
+                    frames.extend(audio_bstream.write(data.data.tobytes()))
                 elif isinstance(data, self._FlushSentinel):
                     frames.extend(audio_bstream.flush())
                     has_ended = True
@@ -551,7 +548,7 @@ class SpeechStream(stt.SpeechStream):
                     continue
 
                 try:
-                    self._process_stream_event(json.loads(msg.data))
+                    self._process_stream_event(utils.serialization.json_loads(msg.data))
                 except Exception:
                     logger.exception("failed to process deepgram message")
 
@@ -628,10 +625,9 @@ class SpeechStream(stt.SpeechStream):
         )
         return ws
 
-    def _check_energy_state(self, frame: rtc.AudioFrame) -> AudioEnergyFilter.State:
-        if self._audio_energy_filter:
-            return self._audio_energy_filter.update(frame)
-        return AudioEnergyFilter.State.SPEAKING
+    def _gate_keepalive(self, frame: rtc.AudioFrame) -> None:
+        # the connection is already kept alive with KeepAlive messages, see keepalive_task
+        pass
 
     def _on_audio_duration_report(self, duration: float) -> None:
         usage_event = stt.SpeechEvent(
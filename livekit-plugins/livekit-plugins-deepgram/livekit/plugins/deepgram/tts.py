@@ -96,6 +96,8 @@ class TTS(tts.TTS):
         self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
             connect_cb=self._connect_ws,
             close_cb=self._close_ws,
+            ping_cb=utils.ping_websocket,
+            label=self.label,
             max_session_duration=3600,  # 1 hour
             mark_refreshed_on_get=False,
         )
@@ -82,6 +82,9 @@ class STT(stt.STT):
 
         return self._session
 
+    def prewarm(self) -> None:
+        http_context.prewarm_connection(self._opts.base_url, session=self._ensure_session())
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
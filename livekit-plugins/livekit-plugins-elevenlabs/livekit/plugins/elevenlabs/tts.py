@@ -15,11 +15,11 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import dataclasses
 import json
 import os
 import weakref
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, replace
 from typing import Any
 
@@ -37,6 +37,7 @@ from livekit.agents import (
 )
 from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, NotGivenOr
 from livekit.agents.utils import is_given
+from livekit.agents.utils.ws_multiplexer import MultiplexedContext
 
 from .log import logger
 from .models import TTSEncoding, TTSModels
@@ -71,6 +72,7 @@ DEFAULT_VOICE_ID = "bIHbv24MWmeRgasZH58o"
 API_BASE_URL_V1 = "https://api.elevenlabs.io/v1"
 AUTHORIZATION_HEADER = "xi-api-key"
 WS_INACTIVITY_TIMEOUT = 300
+MAX_CONTEXTS_PER_CONNECTION = 5
 
 
 @dataclass
@@ -88,6 +90,7 @@ class _TTSOptions:
     chunk_length_schedule: NotGivenOr[list[int]]
     enable_ssml_parsing: bool
     inactivity_timeout: int
+    multi_context: bool
 
 
 class TTS(tts.TTS):
@@ -107,6 +110,7 @@ class TTS(tts.TTS):
         chunk_length_schedule: NotGivenOr[list[int]] = NOT_GIVEN,  # range is [50, 500]
         http_session: aiohttp.ClientSession | None = None,
         language: NotGivenOr[str] = NOT_GIVEN,
+        multi_context: bool = False,
     ) -> None:
         """
         Create a new instance of ElevenLabs TTS.
@@ -124,6 +128,7 @@ class TTS(tts.TTS):
             chunk_length_schedule (NotGivenOr[list[int]]): Schedule for chunk lengths, ranging from 50 to 500. Defaults are [120, 160, 250, 290].
             http_session (aiohttp.ClientSession | None): Custom HTTP session for API requests. Optional.
             language (NotGivenOr[str]): Language code for the TTS model, as of 10/24/24 only valid for "eleven_turbo_v2_5".
+            multi_context (bool): Use the multi-context websocket, the streams of the process then share a few connections instead of opening one per segment. Defaults to False.
         """  # noqa: E501
 
         if not is_given(encoding):
@@ -162,9 +167,11 @@ class TTS(tts.TTS):
             enable_ssml_parsing=enable_ssml_parsing,
             language=language,
             inactivity_timeout=inactivity_timeout,
+            multi_context=multi_context,
         )
         self._session = http_session
         self._streams = weakref.WeakSet[SynthesizeStream]()
+        self._multiplexers: set[utils.WebSocketMultiplexer] = set()
 
     def _ensure_session(self) -> aiohttp.ClientSession:
         if not self._session:
@@ -172,6 +179,41 @@ class TTS(tts.TTS):
 
         return self._session
 
+    def _multiplexer(self, opts: _TTSOptions) -> utils.WebSocketMultiplexer:
+        session = self._ensure_session()
+        url = _stream_url(opts)
+        api_key = opts.api_key
+
+        async def _connect_ws(timeout: float) -> aiohttp.ClientWebSocketResponse:
+            return await asyncio.wait_for(
+                session.ws_connect(url, headers={AUTHORIZATION_HEADER: api_key}), timeout
+            )
+
+        mux = utils.WebSocketMultiplexer.shared(
+            (url, api_key, session),
+            lambda: utils.WebSocketMultiplexer(
+                connect_cb=_connect_ws,
+                context_id_fnc=lambda data: data.get("contextId") or data.get("context_id"),
+                cancel_packet_fnc=lambda context_id: {
+                    "context_id": context_id,
+                    "close_context": True,
+                },
+                max_contexts=MAX_CONTEXTS_PER_CONNECTION,
+                label=self.label,
+            ),
+            owner=self,
+        )
+        self._multiplexers.add(mux)
+        return mux
+
+    def prewarm(self) -> None:
+        if self._opts.multi_context:
+            self._multiplexer(self._opts).prewarm()
+        else:
+            utils.http_context.prewarm_connection(
+                self._opts.base_url, session=self._ensure_session()
+            )
+
     async def list_voices(self) -> list[Voice]:
         async with self._ensure_session().get(
             f"{self._opts.base_url}/voices",
@@ -221,6 +263,10 @@ class TTS(tts.TTS):
 
         self._streams.clear()
 
+        for mux in self._multiplexers:
+            await mux.release(self)
+        self._multiplexers.clear()
+
 
 class ChunkedStream(tts.ChunkedStream):
     """Synthesize using the chunked api endpoint"""
@@ -348,6 +394,13 @@ class SynthesizeStream(tts.SynthesizeStream):
         segment_id = utils.shortuuid()
         output_emitter.start_segment(segment_id=segment_id)
 
+        if self._opts.multi_context:
+            async with self._tts._multiplexer(self._opts).context(
+                segment_id, timeout=self._conn_options.timeout
+            ) as ctx:
+                await self._run_context(ctx, word_stream, output_emitter)
+            return
+
         ws_conn = await asyncio.wait_for(
             self._tts._ensure_session().ws_connect(
                 _stream_url(self._opts), headers={AUTHORIZATION_HEADER: self._opts.api_key}
@@ -356,47 +409,17 @@ class SynthesizeStream(tts.SynthesizeStream):
         )
 
         # 11labs protocol expects the first message to be an "init msg"
-        init_pkt: dict = {
-            "text": " ",
-        }
-        if is_given(self._opts.chunk_length_schedule):
-            init_pkt["generation_config"] = {
-                "chunk_length_schedule": self._opts.chunk_length_schedule
-            }
-        if is_given(self._opts.voice_settings):
-            init_pkt["voice_settings"] = _strip_nones(dataclasses.asdict(self._opts.voice_settings))
-        await ws_conn.send_str(json.dumps(init_pkt))
+        await ws_conn.send_str(json.dumps(_init_packet(self._opts)))
         eos_sent = False
 
         @utils.log_exceptions(logger=logger)
         async def send_task():
             nonlocal eos_sent
-            xml_content = []
-            async for data in word_stream:
-                text = data.token
-                # send xml tags fully formed
-                xml_start_tokens = ["<phoneme", "<break"]
-                xml_end_tokens = ["</phoneme>", "/>"]
-
-                if (
-                    self._opts.enable_ssml_parsing
-                    and any(data.token.startswith(start) for start in xml_start_tokens)
-                    or xml_content
-                ):
-                    xml_content.append(text)
-
-                    if any(data.token.find(end) > -1 for end in xml_end_tokens):
-                        text = self._opts.word_tokenizer.format_words(xml_content)
-                        xml_content = []
-                    else:
-                        continue
-
+            async for text in self._tokens(word_stream):
                 data_pkt = {"text": f"{text} "}  # must always end with a space
 
                 self._mark_started()
-                await ws_conn.send_str(json.dumps(data_pkt))
-            if xml_content:
-                logger.warning("11labs stream ended with incomplete xml content")
+                await ws_conn.send_str(utils.serialization.json_dumps(data_pkt))
 
             # no more token, mark eos
             eos_pkt = {"text": ""}
@@ -425,9 +448,9 @@ class SynthesizeStream(tts.SynthesizeStream):
                     logger.warning("unexpected 11labs message type %s", msg.type)
                     continue
 
-                data = json.loads(msg.data)
+                data = utils.serialization.json_loads(msg.data)
                 if data.get("audio"):
-                    b64data = base64.b64decode(data["audio"])
+                    b64data = utils.serialization.b64decode(data["audio"])
                     output_emitter.push(b64data)
                 elif data.get("isFinal"):
                     output_emitter.flush()
@@ -447,6 +470,75 @@ class SynthesizeStream(tts.SynthesizeStream):
             await utils.aio.gracefully_cancel(*tasks)
             await ws_conn.close()
 
+    async def _run_context(
+        self,
+        ctx: MultiplexedContext,
+        word_stream: tokenize.WordStream,
+        output_emitter: tts.AudioEmitter,
+    ) -> None:
+        """Synthesize a segment on a context of the shared multi-context websocket"""
+        await ctx.send({**_init_packet(self._opts), "context_id": ctx.context_id})
+
+        @utils.log_exceptions(logger=logger)
+        async def send_task():
+            async for text in self._tokens(word_stream):
+                self._mark_started()
+                await ctx.send({"text": f"{text} ", "context_id": ctx.context_id})
+
+            # generate the buffered text then close the context, 11labs answers with isFinal
+            await ctx.send({"context_id": ctx.context_id, "flush": True})
+            await ctx.send({"context_id": ctx.context_id, "close_context": True})
+
+        @utils.log_exceptions(logger=logger)
+        async def recv_task():
+            while True:
+                data = await ctx.recv()
+                if data.get("audio"):
+                    b64data = utils.serialization.b64decode(data["audio"])
+                    output_emitter.push(b64data)
+                elif data.get("isFinal"):
+                    ctx.mark_done()
+                    output_emitter.flush()
+                    return
+                elif data.get("error"):
+                    raise APIError(message=data["error"])
+
+        tasks = [
+            asyncio.create_task(send_task()),
+            asyncio.create_task(recv_task()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await utils.aio.gracefully_cancel(*tasks)
+
+    async def _tokens(self, word_stream: tokenize.WordStream) -> AsyncIterator[str]:
+        """Yield the words to send, the xml tags are only sent fully formed"""
+        xml_content = []
+        async for data in word_stream:
+            text = data.token
+            # send xml tags fully formed
+            xml_start_tokens = ["<phoneme", "<break"]
+            xml_end_tokens = ["</phoneme>", "/>"]
+
+            if (
+                self._opts.enable_ssml_parsing
+                and any(data.token.startswith(start) for start in xml_start_tokens)
+                or xml_content
+            ):
+                xml_content.append(text)
+
+                if any(data.token.find(end) > -1 for end in xml_end_tokens):
+                    text = self._opts.word_tokenizer.format_words(xml_content)
+                    xml_content = []
+                else:
+                    continue
+
+            yield text
+
+        if xml_content:
+            logger.warning("11labs stream ended with incomplete xml content")
+
 
 def _dict_to_voices_list(data: dict[str, Any]):
     voices: list[Voice] = []
@@ -460,6 +552,17 @@ def _strip_nones(data: dict[str, Any]):
     return {k: v for k, v in data.items() if is_given(v) and v is not None}
 
 
+def _init_packet(opts: _TTSOptions) -> dict[str, Any]:
+    init_pkt: dict[str, Any] = {
+        "text": " ",
+    }
+    if is_given(opts.chunk_length_schedule):
+        init_pkt["generation_config"] = {"chunk_length_schedule": opts.chunk_length_schedule}
+    if is_given(opts.voice_settings):
+        init_pkt["voice_settings"] = _strip_nones(dataclasses.asdict(opts.voice_settings))
+    return init_pkt
+
+
 def _synthesize_url(opts: _TTSOptions) -> str:
     base_url = opts.base_url
     voice_id = opts.voice_id
@@ -482,8 +585,9 @@ def _stream_url(opts: _TTSOptions) -> str:
     enable_ssml = str(opts.enable_ssml_parsing).lower()
     language = opts.language
     inactivity_timeout = opts.inactivity_timeout
+    endpoint = "multi-stream-input" if opts.multi_context else "stream-input"
     url = (
-        f"{base_url}/text-to-speech/{voice_id}/stream-input?"
+        f"{base_url}/text-to-speech/{voice_id}/{endpoint}?"
         f"model_id={model_id}&output_format={output_format}&"
         f"enable_ssml_parsing={enable_ssml}&inactivity_timeout={inactivity_timeout}"
     )
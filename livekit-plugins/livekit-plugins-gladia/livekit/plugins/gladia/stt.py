@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import dataclasses
 import json
 import os
@@ -43,6 +42,9 @@ from ._utils import PeriodicCollector
 from .log import logger
 
 BASE_URL = "https://api.gladia.io/v2/live"
+_AUDIO_CHUNK_TEMPLATE = utils.serialization.Base64JSONTemplate(
+    {"type": "audio_chunk", "data": {"chunk": ...}}
+)
 
 MAGIC_NUMBER_THRESHOLD = 0.004**2
 
@@ -205,6 +207,9 @@ class STT(stt.STT):
 
         return self._session
 
+    def prewarm(self) -> None:
+        utils.http_context.prewarm_connection(self._base_url, session=self._ensure_session())
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
@@ -278,10 +283,7 @@ class STT(stt.STT):
                 # Send raw PCM audio data in chunks
                 for i in range(0, len(pcm_data), chunk_size):
                     chunk = pcm_data[i : i + chunk_size]
-                    chunk_b64 = base64.b64encode(chunk).decode("utf-8")
-                    await ws.send_str(
-                        json.dumps({"type": "audio_chunk", "data": {"chunk": chunk_b64}})
-                    )
+                    await ws.send_str(_AUDIO_CHUNK_TEMPLATE.render(chunk))
 
                 # Tell Gladia we're done sending audio
                 await ws.send_str(json.dumps({"type": "stop_recording"}))
@@ -295,7 +297,7 @@ class STT(stt.STT):
                     receive_timeout = conn_options.timeout * 5
                     async for msg in ws.iter(timeout=receive_timeout):
                         if msg.type == aiohttp.WSMsgType.TEXT:
-                            data = json.loads(msg.data)
+                            data = utils.serialization.json_loads(msg.data)
                             # Collect final utterances
                             if data["type"] == "transcript" and data["data"]["is_final"]:
                                 utterance = data["data"]["utterance"]
@@ -773,10 +775,7 @@ class SpeechStream(stt.SpeechStream):
 
             for frame in frames:
                 self._audio_duration_collector.push(frame.duration)
-                # Encode the audio data as base64
-                chunk_b64 = base64.b64encode(frame.data.tobytes()).decode("utf-8")
-                message = json.dumps({"type": "audio_chunk", "data": {"chunk": chunk_b64}})
-                await self._ws.send_str(message)
+                await self._ws.send_str(_AUDIO_CHUNK_TEMPLATE.render(frame.data))
 
                 if has_ended:
                     self._audio_duration_collector.flush()
@@ -795,7 +794,7 @@ class SpeechStream(stt.SpeechStream):
         async for msg in self._ws:
             if msg.type == aiohttp.WSMsgType.TEXT:
                 try:
-                    data = json.loads(msg.data)
+                    data = utils.serialization.json_loads(msg.data)
                     self._process_gladia_message(data)
                 except Exception as e:
                     logger.exception(f"Error processing Gladia message: {e}")
@@ -378,6 +378,10 @@ class RealtimeSession(llm.RealtimeSession):
             self._tools = llm.ToolContext(tools)
             self._mark_restart_needed()
 
+    @property
+    def input_sample_rate(self) -> int:
+        return INPUT_AUDIO_SAMPLE_RATE
+
     @property
     def chat_ctx(self) -> llm.ChatContext:
         return self._chat_ctx.copy()
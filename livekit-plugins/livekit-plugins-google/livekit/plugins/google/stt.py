@@ -166,9 +166,10 @@ class STT(stt.STT):
         self._pool = utils.ConnectionPool[SpeechAsyncClient](
             max_session_duration=_max_session_duration,
             connect_cb=self._create_client,
+            label=self.label,
         )
 
-    async def _create_client(self) -> SpeechAsyncClient:
+    async def _create_client(self, timeout: float) -> SpeechAsyncClient:
         # Add support for passing a specific location that matches recognizer
         # see: https://cloud.google.com/speech-to-text/v2/docs/speech-to-text-supported-languages
         client_options = None
@@ -403,7 +404,7 @@ class SpeechStream(stt.SpeechStream):
                 logger.exception("an error occurred while streaming input to google STT")
 
         async def process_stream(client: SpeechAsyncClient, stream):
-            has_started = False
+            handed_off = False
             async for resp in stream:
                 if (
                     resp.speech_event_type
@@ -412,7 +413,6 @@ class SpeechStream(stt.SpeechStream):
                     self._event_ch.send_nowait(
                         stt.SpeechEvent(type=stt.SpeechEventType.START_OF_SPEECH)
                     )
-                    has_started = True
 
                 if (
                     resp.speech_event_type
@@ -440,18 +440,17 @@ class SpeechStream(stt.SpeechStream):
                                 alternatives=[speech_data],
                             )
                         )
-                        if time.time() - self._session_connected_at > _max_session_duration:
+                        if (
+                            not handed_off
+                            and time.time() - self._session_connected_at > _max_session_duration
+                        ):
                             logger.debug(
-                                "Google STT maximum connection time reached. Reconnecting..."
+                                "Google STT maximum connection time reached, opening a new stream"
                             )
-                            self._pool.remove(client)
-                            if has_started:
-                                self._event_ch.send_nowait(
-                                    stt.SpeechEvent(type=stt.SpeechEventType.END_OF_SPEECH)
-                                )
-                                has_started = False
-                            self._reconnect_event.set()
-                            return
+                            # this stream keeps receiving the audio until the new one is ready,
+                            # the expired client is then dropped by the pool
+                            self._handoff()
+                            handed_off = True
 
                 if (
                     resp.speech_event_type
@@ -460,7 +459,6 @@ class SpeechStream(stt.SpeechStream):
                     self._event_ch.send_nowait(
                         stt.SpeechEvent(type=stt.SpeechEventType.END_OF_SPEECH)
                     )
-                    has_started = False
 
         while True:
             try:
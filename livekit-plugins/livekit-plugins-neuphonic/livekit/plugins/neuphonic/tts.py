@@ -102,6 +102,11 @@ class TTS(tts.TTS):
 
         return self._session
 
+    def prewarm(self) -> None:
+        utils.http_context.prewarm_connection(
+            f"https://{self._opts.base_url}", session=self._ensure_session()
+        )
+
     def update_options(
         self,
         *,
@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import base64
 import contextlib
-import json
 import os
 import time
 import weakref
@@ -36,7 +35,6 @@ from openai.types.beta.realtime import (
     ConversationItemInputAudioTranscriptionFailedEvent,
     ConversationItemTruncateEvent,
     ErrorEvent,
-    InputAudioBufferAppendEvent,
     InputAudioBufferClearEvent,
     InputAudioBufferCommitEvent,
     InputAudioBufferSpeechStartedEvent,
@@ -144,6 +142,11 @@ class _CreateResponseHandle:
 
 _MOCK_AUDIO_ID_PREFIX = "lk_mock_audio_item_"
 
+_AUDIO_APPEND_TEMPLATE = utils.serialization.Base64JSONTemplate(
+    {"type": "input_audio_buffer.append", "audio": ...}
+)
+_AUDIO_APPEND_KEYS = {"type", "audio"}  # without an event_id
+
 # default values got from a "default" session from their API
 DEFAULT_TEMPERATURE = 0.8
 DEFAULT_TURN_DETECTION = TurnDetection(
@@ -546,7 +549,14 @@ class RealtimeSession(
                         )
 
                     self.emit("openai_client_event_queued", msg)
-                    await ws_conn.send_str(json.dumps(msg))
+                    if (
+                        msg.get("type") == "input_audio_buffer.append"
+                        and msg.keys() == _AUDIO_APPEND_KEYS
+                    ):
+                        # sent for every 100ms of audio, skip the generic serialization
+                        await ws_conn.send_str(_AUDIO_APPEND_TEMPLATE.render(msg["audio"]))
+                    else:
+                        await ws_conn.send_str(utils.serialization.json_dumps(msg))
 
                     if lk_oai_debug:
                         msg_copy = msg.copy()
@@ -584,7 +594,7 @@ class RealtimeSession(
                 elif msg.type != aiohttp.WSMsgType.TEXT:
                     continue
 
-                event = json.loads(msg.data)
+                event = utils.serialization.json_loads(msg.data)
 
                 # emit the raw json dictionary instead of the BaseModel because different
                 # providers can have different event types that are not part of the OpenAI Realtime API  # noqa: E501
@@ -722,6 +732,10 @@ class RealtimeSession(
             )
         )
 
+    @property
+    def input_sample_rate(self) -> int:
+        return SAMPLE_RATE
+
     @property
     def chat_ctx(self) -> llm.ChatContext:
         return self._remote_chat_ctx.to_chat_ctx()
@@ -893,11 +907,12 @@ class RealtimeSession(
         for f in self._resample_audio(frame):
             data = f.data.tobytes()
             for nf in self._bstream.write(data):
+                # a plain dict instead of InputAudioBufferAppendEvent, it's sent using a template
                 self.send_event(
-                    InputAudioBufferAppendEvent(
-                        type="input_audio_buffer.append",
-                        audio=base64.b64encode(nf.data).decode("utf-8"),
-                    )
+                    {
+                        "type": "input_audio_buffer.append",
+                        "audio": utils.serialization.b64encode(nf.data),
+                    }
                 )
                 self._pushed_duration_s += nf.duration
 
@@ -1225,7 +1240,7 @@ class RealtimeSession(
         assert self._current_generation is not None, "current_generation is None"
         item_generation = self._current_generation.messages[event.item_id]
 
-        data = base64.b64decode(event.delta)
+        data = utils.serialization.b64decode(event.delta)
         item_generation.audio_ch.send_nowait(
             rtc.AudioFrame(
                 data=data,
@@ -149,6 +149,7 @@ class STT(stt.STT):
             max_session_duration=_max_session_duration,
             connect_cb=self._connect_ws,
             close_cb=self._close_ws,
+            label=self.label,
         )
 
     @staticmethod
@@ -246,6 +247,10 @@ class STT(stt.STT):
             use_realtime=False,
         )
 
+    @property
+    def input_sample_rate(self) -> int:
+        return SAMPLE_RATE
+
     def stream(
         self,
         *,
@@ -302,7 +307,7 @@ class STT(stt.STT):
             if is_given(language):
                 stream.update_options(language=language)
 
-    async def _connect_ws(self) -> aiohttp.ClientWebSocketResponse:
+    async def _connect_ws(self, timeout: float) -> aiohttp.ClientWebSocketResponse:
         prompt = self._opts.prompt if is_given(self._opts.prompt) else ""
         realtime_config: dict[str, Any] = {
             "type": "transcription_session.update",
@@ -340,7 +345,7 @@ class STT(stt.STT):
         session = self._ensure_session()
         ws = await asyncio.wait_for(
             session.ws_connect(url, headers=headers),
-            DEFAULT_API_CONNECT_OPTIONS.timeout,
+            timeout,
         )
         await ws.send_json(realtime_config)
         return ws
@@ -105,6 +105,8 @@ class TTS(tts.TTS):
         self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
             connect_cb=self._connect_ws,
             close_cb=self._close_ws,
+            ping_cb=utils.ping_websocket,
+            label=self.label,
         )
 
     async def _connect_ws(self, timeout: float) -> aiohttp.ClientWebSocketResponse:
@@ -146,6 +146,9 @@ class TTS(tts.TTS):
 
         return self._session
 
+    def prewarm(self) -> None:
+        utils.http_context.prewarm_connection(self._base_url, session=self._ensure_session())
+
     def synthesize(
         self, text: str, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
     ) -> ChunkedStream:
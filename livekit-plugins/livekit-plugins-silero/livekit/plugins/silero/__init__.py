@@ -31,6 +31,11 @@ class SileroPlugin(Plugin):
     def __init__(self):
         super().__init__(__name__, __version__, __package__, logger)
 
+    def model_files(self) -> list[str]:
+        from .onnx_model import model_path
+
+        return [model_path()]
+
 
 Plugin.register_plugin(SileroPlugin())
 
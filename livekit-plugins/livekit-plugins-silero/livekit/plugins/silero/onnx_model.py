@@ -5,6 +5,8 @@ from contextlib import ExitStack
 import numpy as np
 import onnxruntime  # type: ignore
 
+from livekit.agents import ipc
+
 _resource_files = ExitStack()
 atexit.register(_resource_files.close)
 
@@ -12,10 +14,17 @@ atexit.register(_resource_files.close)
 SUPPORTED_SAMPLE_RATES = [8000, 16000]
 
 
-def new_inference_session(force_cpu: bool) -> onnxruntime.InferenceSession:
+def model_path() -> str:
     res = importlib.resources.files("livekit.plugins.silero.resources") / "silero_vad.onnx"
     ctx = importlib.resources.as_file(res)
-    path = str(_resource_files.enter_context(ctx))
+    return str(_resource_files.enter_context(ctx))
+
+
+def new_inference_session(force_cpu: bool) -> onnxruntime.InferenceSession:
+    path = model_path()
+    # use the copy loaded by the forkserver when available (see SileroPlugin.model_files),
+    # onnxruntime still builds the initializers of each session from it
+    model: str | bytes = ipc.prewarm.get_model_file(path) or path
 
     opts = onnxruntime.SessionOptions()
     opts.add_session_config_entry("session.intra_op.allow_spinning", "0")
@@ -26,10 +35,10 @@ def new_inference_session(force_cpu: bool) -> onnxruntime.InferenceSession:
 
     if force_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
         session = onnxruntime.InferenceSession(
-            path, providers=["CPUExecutionProvider"], sess_options=opts
+            model, providers=["CPUExecutionProvider"], sess_options=opts
         )
     else:
-        session = onnxruntime.InferenceSession(path, sess_options=opts)
+        session = onnxruntime.InferenceSession(model, sess_options=opts)
 
     return session
 
@@ -36,6 +36,9 @@ from . import onnx_model
 from .log import logger
 
 SLOW_INFERENCE_THRESHOLD = 0.2  # late by 200ms
+# mean square of the normalized samples above which a window is considered speech while
+# catching up
+CATCH_UP_ENERGY_THRESHOLD = 0.004**2
 
 
 @dataclass
@@ -46,6 +49,7 @@ class _VADOptions:
     max_buffered_speech: float
     activation_threshold: float
     sample_rate: int
+    catch_up_threshold: float | None
 
 
 class VAD(agents.vad.VAD):
@@ -66,6 +70,7 @@ class VAD(agents.vad.VAD):
         activation_threshold: float = 0.5,
         sample_rate: Literal[8000, 16000] = 16000,
         force_cpu: bool = True,
+        catch_up_threshold: float | None = 1.0,
         # deprecated
         padding_duration: NotGivenOr[float] = NOT_GIVEN,
     ) -> VAD:
@@ -103,6 +108,7 @@ class VAD(agents.vad.VAD):
             activation_threshold (float): Threshold to consider a frame as speech.
             sample_rate (Literal[8000, 16000]): Sample rate for the inference (only 8KHz and 16KHz are supported).
             force_cpu (bool): Force the use of CPU for inference.
+            catch_up_threshold (float | None): When the audio waits longer than this for inference (e.g. CPU starvation), the speech is estimated from the audio energy instead of the model until the VAD is back to realtime. None always runs the model.
             padding_duration (float | None): **Deprecated**. Use `prefix_padding_duration` instead.
 
         Returns:
@@ -128,6 +134,7 @@ class VAD(agents.vad.VAD):
             max_buffered_speech=max_buffered_speech,
             activation_threshold=activation_threshold,
             sample_rate=sample_rate,
+            catch_up_threshold=catch_up_threshold,
         )
         return cls(session=session, opts=opts)
 
@@ -142,6 +149,10 @@ class VAD(agents.vad.VAD):
         self._opts = opts
         self._streams = weakref.WeakSet[VADStream]()
 
+    @property
+    def input_sample_rate(self) -> int:
+        return self._opts.sample_rate
+
     def stream(self) -> VADStream:
         """
         Create a new VADStream for processing audio data.
@@ -167,6 +178,7 @@ class VAD(agents.vad.VAD):
         prefix_padding_duration: NotGivenOr[float] = NOT_GIVEN,
         max_buffered_speech: NotGivenOr[float] = NOT_GIVEN,
         activation_threshold: NotGivenOr[float] = NOT_GIVEN,
+        catch_up_threshold: NotGivenOr[float | None] = NOT_GIVEN,
     ) -> None:
         """
         Update the VAD options.
@@ -179,6 +191,7 @@ class VAD(agents.vad.VAD):
             prefix_padding_duration (float): Duration of padding to add to the beginning of each speech chunk.
             max_buffered_speech (float): Maximum duration of speech to keep in the buffer (in seconds).
             activation_threshold (float): Threshold to consider a frame as speech.
+            catch_up_threshold (float | None): Delay of the audio above which the speech is estimated from the audio energy to catch up.
         """  # noqa: E501
         if is_given(min_speech_duration):
             self._opts.min_speech_duration = min_speech_duration
@@ -190,6 +203,8 @@ class VAD(agents.vad.VAD):
             self._opts.max_buffered_speech = max_buffered_speech
         if is_given(activation_threshold):
             self._opts.activation_threshold = activation_threshold
+        if is_given(catch_up_threshold):
+            self._opts.catch_up_threshold = catch_up_threshold
 
         for stream in self._streams:
             stream.update_options(
@@ -198,6 +213,7 @@ class VAD(agents.vad.VAD):
                 prefix_padding_duration=prefix_padding_duration,
                 max_buffered_speech=max_buffered_speech,
                 activation_threshold=activation_threshold,
+                catch_up_threshold=catch_up_threshold,
             )
 
 
@@ -224,6 +240,7 @@ class VADStream(agents.vad.VADStream):
         prefix_padding_duration: NotGivenOr[float] = NOT_GIVEN,
         max_buffered_speech: NotGivenOr[float] = NOT_GIVEN,
         activation_threshold: NotGivenOr[float] = NOT_GIVEN,
+        catch_up_threshold: NotGivenOr[float | None] = NOT_GIVEN,
     ) -> None:
         """
         Update the VAD options.
@@ -236,6 +253,7 @@ class VADStream(agents.vad.VADStream):
             prefix_padding_duration (float): Duration of padding to add to the beginning of each speech chunk.
             max_buffered_speech (float): Maximum duration of speech to keep in the buffer (in seconds).
             activation_threshold (float): Threshold to consider a frame as speech.
+            catch_up_threshold (float | None): Delay of the audio above which the speech is estimated from the audio energy to catch up.
         """  # noqa: E501
         old_max_buffered_speech = self._opts.max_buffered_speech
 
@@ -249,6 +267,8 @@ class VADStream(agents.vad.VADStream):
             self._opts.max_buffered_speech = max_buffered_speech
         if is_given(activation_threshold):
             self._opts.activation_threshold = activation_threshold
+        if is_given(catch_up_threshold):
+            self._opts.catch_up_threshold = catch_up_threshold
 
         if self._input_sample_rate:
             assert self._speech_buffer is not None
@@ -288,6 +308,8 @@ class VADStream(agents.vad.VADStream):
         input_copy_remaining_fract = 0.0
 
         extra_inference_time = 0.0
+        catching_up = False
+        catch_up_count = 0
 
         async for input_frame in self._input_ch:
             if not isinstance(input_frame, rtc.AudioFrame):
@@ -350,10 +372,32 @@ class VADStream(agents.vad.VADStream):
                     dtype=np.float32,
                 )
 
-                # run the inference
-                p = await self._loop.run_in_executor(
-                    self._executor, self._model, inference_f32_data
-                )
+                # when the inference fell behind realtime (e.g. CPU starvation), the model can't
+                # process the backlog any faster, use the audio energy until caught up.
+                # extra_inference_time only grows when the inference is slower than the audio, so
+                # pushing a whole file at once doesn't trigger it
+                catch_up_threshold = self._opts.catch_up_threshold
+                if catch_up_threshold is None or (
+                    catching_up and extra_inference_time < catch_up_threshold / 2
+                ):
+                    catching_up = False
+                elif not catching_up and extra_inference_time > catch_up_threshold:
+                    catching_up = True
+                    # the stream keeps oscillating while the CPU is overloaded, only warn once
+                    (logger.debug if catch_up_count else logger.warning)(
+                        "inference is late, estimating speech from the audio energy to catch up",
+                        extra={"delay": extra_inference_time},
+                    )
+                    catch_up_count += 1
+
+                if catching_up:
+                    energy = float(np.mean(np.square(inference_f32_data)))
+                    p = 1.0 if energy > CATCH_UP_ENERGY_THRESHOLD else 0.0
+                else:
+                    # run the inference
+                    p = await self._loop.run_in_executor(
+                        self._executor, self._model, inference_f32_data
+                    )
                 p = self._exp_filter.apply(exp=1.0, sample=p)
 
                 window_duration = self._model.window_size_samples / self._opts.sample_rate
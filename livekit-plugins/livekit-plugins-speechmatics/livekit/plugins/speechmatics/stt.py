@@ -90,6 +90,9 @@ class STT(stt.STT):
             self._session = utils.http_context.http_session()
         return self._session
 
+    def prewarm(self) -> None:
+        utils.http_context.prewarm_connection(self._connection_settings.url, session=self.session)
+
     async def _recognize_impl(
         self,
         buffer: AudioBuffer,
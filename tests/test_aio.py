@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 from livekit.agents.utils import aio
 
@@ -39,3 +40,64 @@ async def test_sleep():
     sleep = aio.sleep(5)
     sleep.reset(0.1)
     await sleep
+
+
+async def test_loop_monitor():
+    monitor = aio.debug.LoopMonitor(lag_interval=0.02, slow_callback_threshold=0.1)
+    monitor.start()
+
+    await asyncio.sleep(0.05)
+    asyncio.get_running_loop().call_soon(time.sleep, 0.25)
+    await asyncio.sleep(0.1)
+    monitor.stop()
+
+    info = monitor.export()
+    assert info["lag"]["count"] > 0
+    assert info["lag"]["max"] >= 0.1
+    assert info["slow_callbacks"]["count"] == 1
+    assert info["slow_callbacks"]["samples"][0]["stack"] is not None
+
+
+def test_bounded_channel():
+    ch = aio.BoundedChan[object](4, droppable=lambda v: isinstance(v, int))
+    for v in (0, 1, "flush", 2, 3, 4):
+        ch.send_nowait(v)
+
+    # half of the queue is dropped when full, keeping the non-droppable values
+    assert ch.dropped == 3
+    assert [ch.recv_nowait() for _ in range(ch.qsize())] == ["flush", 3, 4]
+
+    joined: list[list[object]] = []
+
+    def _join(values: list[object]) -> object:
+        joined.append(values)
+        return "".join(values)  # type: ignore[arg-type]
+
+    ch = aio.BoundedChan[object](
+        2,
+        policy="coalesce",
+        can_coalesce=lambda a, b: isinstance(a, str) and isinstance(b, str),
+        coalesce=_join,
+    )
+    for v in ("a", "b", "c", "d", None, "e"):
+        ch.send_nowait(v)
+
+    # the merged values are joined once
+    assert ch.coalesced == 2
+    assert joined == [["b", "c", "d"]]
+    assert [ch.recv_nowait() for _ in range(ch.qsize())] == ["a", "bcd", None, "e"]
+
+    # the last pending value is joined when it's received
+    for v in ("f", "g", "h"):
+        ch.send_nowait(v)
+    assert ch.qsize() == 2 and ch.coalesced == 3
+    assert ch.recv_nowait() == "f"
+    assert ch.recv_nowait() == "gh"
+
+    ch = aio.BoundedChan[int](1, policy="raise")
+    ch.send_nowait(1)
+    try:
+        ch.send_nowait(2)
+        raise AssertionError("expected ChanFull")
+    except aio.ChanFull:
+        pass
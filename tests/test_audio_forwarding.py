@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from livekit import rtc
+from livekit.agents.utils import aio
+from livekit.agents.voice import io
+from livekit.agents.voice.generation import _MAX_CAPTURE_BATCH_DURATION, perform_audio_forwarding
+
+SAMPLE_RATE = 24000
+FRAME_SIZE = SAMPLE_RATE // 100  # 10ms
+
+
+class BatchRecordingOutput(io.AudioOutput):
+    def __init__(self) -> None:
+        super().__init__(sample_rate=SAMPLE_RATE)
+        self.calls: list[list[rtc.AudioFrame]] = []
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await super().capture_frame(frame)
+        self.calls.append([frame])
+
+    async def capture_frames(self, frames: Sequence[rtc.AudioFrame]) -> None:
+        for frame in frames:
+            await super().capture_frame(frame)
+        self.calls.append(list(frames))
+
+    def flush(self) -> None:
+        super().flush()
+        self.on_playback_finished(playback_position=0.0, interrupted=False)
+
+    def clear_buffer(self) -> None:
+        pass
+
+
+def _frame(index: int) -> rtc.AudioFrame:
+    data = np.full(FRAME_SIZE, index, dtype=np.int16).tobytes()
+    return rtc.AudioFrame(data, SAMPLE_RATE, 1, FRAME_SIZE)
+
+
+def _index(frame: rtc.AudioFrame) -> int:
+    return int(np.frombuffer(frame.data, dtype=np.int16)[0])
+
+
+async def test_forwarding_batches() -> None:
+    audio_output = BatchRecordingOutput()
+    tts_ch = aio.Chan[rtc.AudioFrame]()
+    num_frames = 500  # a 5s burst
+    for i in range(num_frames):
+        tts_ch.send_nowait(_frame(i))
+    tts_ch.close()
+
+    task, _ = perform_audio_forwarding(audio_output=audio_output, tts_output=tts_ch)
+    await task
+
+    # the first frame is forwarded alone, the rest of the burst in batches
+    assert [len(batch) for batch in audio_output.calls] == [1, 201, 201, 97]
+    for batch in audio_output.calls:
+        # the frame that triggered the drain + at most the max batch duration
+        assert sum(f.duration for f in batch) <= _MAX_CAPTURE_BATCH_DURATION + 0.01 + 1e-6
+
+    forwarded = [_index(f) for batch in audio_output.calls for f in batch]
+    assert forwarded == list(range(num_frames))
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from livekit import rtc
+from livekit.agents.voice.audio_frontend import AudioFrontEnd
+
+
+def _frame(sample_rate: int = 48000) -> rtc.AudioFrame:
+    samples = sample_rate // 100
+    return rtc.AudioFrame(
+        b"\x00\x00" * samples, sample_rate=sample_rate, num_channels=1, samples_per_channel=samples
+    )
+
+
+def test_audio_frontend_shared_resampling() -> None:
+    frontend = AudioFrontEnd()
+
+    frame = _frame()
+    assert frontend.resample(frame, None) == [frame]
+    assert frontend.resample(frame, 48000) == [frame]
+
+    total = 0
+    for _ in range(10):
+        frame = _frame()
+        stt_frames = frontend.resample(frame, 16000)
+        vad_frames = frontend.resample(frame, 16000)
+        assert vad_frames is stt_frames  # resampled once for both consumers
+        assert all(f.sample_rate == 16000 for f in stt_frames)
+        total += sum(f.samples_per_channel for f in stt_frames)
+
+        frontend.resample(frame, 24000)  # a second rate uses its own resampler
+
+    assert 0 < total <= 1600
+    assert len(frontend._resamplers) == 2
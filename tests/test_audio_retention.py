@@ -0,0 +1,59 @@
+"""
+Simulate a long-form agent speech and check that the audio forwarded to the output is not
+retained in memory
+"""
+
+import tracemalloc
+
+from livekit import rtc
+from livekit.agents.voice import io
+from livekit.agents.voice.generation import perform_audio_forwarding
+
+SAMPLE_RATE = 24000
+FRAME_DURATION = 0.1
+SPEECH_DURATION = 600.0  # retaining the whole speech would use ~29MB
+MAX_MEMORY_GROWTH = 2 * 1024 * 1024
+
+
+class NullAudioOutput(io.AudioOutput):
+    def __init__(self) -> None:
+        super().__init__(sample_rate=SAMPLE_RATE)
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await super().capture_frame(frame)
+
+    def flush(self) -> None:
+        super().flush()
+        self.on_playback_finished(playback_position=0.0, interrupted=False)
+
+    def clear_buffer(self) -> None:
+        pass
+
+
+async def _fake_tts(duration: float):
+    samples_per_channel = int(SAMPLE_RATE * FRAME_DURATION)
+    for _ in range(int(duration / FRAME_DURATION)):
+        yield rtc.AudioFrame.create(SAMPLE_RATE, 1, samples_per_channel)
+
+
+async def test_audio_forwarding_memory():
+    audio_output = NullAudioOutput()
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        task, out = perform_audio_forwarding(
+            audio_output=audio_output, tts_output=_fake_tts(SPEECH_DURATION)
+        )
+        await task
+        assert out.first_frame_fut.done()
+
+        # the speech handle keeps `out` alive, neither it nor the forwarding keeps the audio
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert current - start < MAX_MEMORY_GROWTH, f"retained {(current - start) / 1e6:.2f}MB"
+    assert peak - start < MAX_MEMORY_GROWTH, f"peak growth {(peak - start) / 1e6:.2f}MB"
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import wave
+
+import numpy as np
+import pytest
+
+from livekit.agents.voice import background_audio
+from livekit.agents.voice.background_audio import _ClipCache, _load_audio_clip
+
+
+def _write_wav(path: str, duration: float, value: int = 1000) -> None:
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(48000)
+        f.writeframes(np.full(int(48000 * duration), value, dtype=np.int16).tobytes())
+
+
+@pytest.fixture
+def clip_cache(monkeypatch: pytest.MonkeyPatch) -> _ClipCache:
+    cache = _ClipCache(max_bytes=16 * 1024 * 1024)
+    monkeypatch.setattr(background_audio, "_clip_cache", cache)
+    return cache
+
+
+async def test_clip_decoded_once(tmp_path, clip_cache: _ClipCache) -> None:
+    path = str(tmp_path / "a.wav")
+    _write_wav(path, 0.5)
+
+    clip = await _load_audio_clip(path)
+    assert 0 < clip.duration <= 0.5
+    assert await _load_audio_clip(path) is clip
+    assert clip_cache.nbytes == clip.nbytes
+
+    # the cached PCM isn't scaled, the volume is applied at playout
+    frames = [f async for f in clip.frames()]
+    assert sum(f.samples_per_channel for f in frames) == len(clip._data)
+    assert np.all(np.frombuffer(frames[0].data, dtype=np.int16) == 1000)
+
+    # a modified file is decoded again and replaces the stale entry
+    _write_wav(path, 1.0)
+    os.utime(path, ns=(0, 0))
+    reloaded = await _load_audio_clip(path)
+    assert reloaded is not clip
+    assert reloaded.duration > clip.duration
+    assert clip_cache.nbytes == reloaded.nbytes
+
+
+async def test_clip_cache_lru(tmp_path, clip_cache, monkeypatch) -> None:
+    paths = [str(tmp_path / f"{i}.wav") for i in range(3)]
+    for path in paths:
+        _write_wav(path, 0.5)
+
+    # room for two of the clips
+    clip_nbytes = (await _load_audio_clip(paths[0])).nbytes  # the decoded size
+    clip_cache = _ClipCache(max_bytes=int(clip_nbytes * 2.5))
+    monkeypatch.setattr(background_audio, "_clip_cache", clip_cache)
+
+    a = await _load_audio_clip(paths[0])
+    b = await _load_audio_clip(paths[1])
+    assert await _load_audio_clip(paths[0]) is a  # a is now the most recently used
+
+    await _load_audio_clip(paths[2])  # over the budget, b is evicted
+    assert clip_cache.nbytes == clip_nbytes * 2
+    assert await _load_audio_clip(paths[0]) is a
+    assert await _load_audio_clip(paths[1]) is not b
+
+    # a clip larger than the whole budget is played without being cached
+    big = str(tmp_path / "big.wav")
+    _write_wav(big, 2.0)
+    nbytes = clip_cache.nbytes
+    assert await _load_audio_clip(big) is not await _load_audio_clip(big)
+    assert clip_cache.nbytes == nbytes
+
+
+async def test_clip_loaded_off_loop(tmp_path, clip_cache, monkeypatch) -> None:
+    path = str(tmp_path / "a.wav")
+    _write_wav(path, 0.1)
+
+    threads = []
+    clip_stamp = background_audio._clip_stamp
+
+    def _recording_stamp(file_path: str) -> tuple[int, int]:
+        threads.append(threading.get_ident())
+        return clip_stamp(file_path)
+
+    monkeypatch.setattr(background_audio, "_clip_stamp", _recording_stamp)
+    await _load_audio_clip(path)
+    assert threads and threading.get_ident() not in threads
+
+
+async def test_clip_scaled_once(tmp_path, clip_cache: _ClipCache) -> None:
+    path = str(tmp_path / "a.wav")
+    _write_wav(path, 0.5)
+
+    # the scaled copy is cached next to the decoded clip
+    clip = await _load_audio_clip(path, volume=0.5)
+    assert np.all(clip._data == 500)
+    assert await _load_audio_clip(path, volume=0.5) is clip
+    raw = await _load_audio_clip(path)
+    assert np.all(raw._data == 1000)
+    assert clip_cache.nbytes == raw.nbytes + clip.nbytes
+
+    frames = [f async for f in background_audio._audio_clip_frames(path, volume=0.5)]
+    assert all(np.all(np.frombuffer(f.data, dtype=np.int16) == 500) for f in frames)
+
+
+async def test_clip_streamed_on_first_play(tmp_path, clip_cache, monkeypatch) -> None:
+    path = str(tmp_path / "a.wav")
+    _write_wav(path, 0.5)
+
+    decoded = asyncio.Event()
+    decode_audio_file = background_audio._decode_audio_file
+
+    async def _slow_decode(file_path: str):
+        async for frame in decode_audio_file(file_path):
+            yield frame
+            await decoded.wait()  # the rest of a long file is still being decoded
+
+    monkeypatch.setattr(background_audio, "_decode_audio_file", _slow_decode)
+
+    frames = background_audio._audio_clip_frames(path, volume=0.5)
+    first = await asyncio.wait_for(frames.__anext__(), 1.0)
+    assert np.all(np.frombuffer(first.data, dtype=np.int16) == 500)
+    assert clip_cache.nbytes == 0
+
+    decoded.set()
+    rest = [f async for f in frames]
+    clip = await _load_audio_clip(path, volume=0.5)  # cached once decoded
+    assert first.samples_per_channel + sum(f.samples_per_channel for f in rest) == len(clip._data)
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -16,7 +17,7 @@ class DummyConnection:
 def dummy_connect_factory():
     counter = 0
 
-    async def dummy_connect():
+    async def dummy_connect(timeout: float):
         nonlocal counter
         counter += 1
         return DummyConnection(counter)
@@ -81,3 +82,54 @@ async def test_get_expired():
 
     conn2 = await pool.get()
     assert conn2 is not conn, "Expected a new connection to be returned."
+
+
+async def _connect(timeout: float) -> DummyConnection:
+    return DummyConnection(time.monotonic_ns())
+
+
+@pytest.mark.asyncio
+async def test_min_idle_refill():
+    pool = ConnectionPool(connect_cb=_connect, min_idle=2, max_idle=2)
+    pool.prewarm()
+    await asyncio.sleep(0)
+    assert len(pool._available) == 2
+
+    conn = await pool.get()
+    await asyncio.sleep(0)
+    assert len(pool._available) == 2, "expected the pool to be refilled after the checkout"
+
+    pool.put(conn)  # above max_idle
+    assert conn not in pool._available
+
+    assert pool.stats.gets == 1 and pool.stats.hit_rate == 1.0
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idle_ping():
+    async def _ping(conn: DummyConnection) -> None:
+        if conn.id == "dead":
+            raise ConnectionError
+
+    pool = ConnectionPool(connect_cb=_connect, ping_cb=_ping, ping_idle_after=0.0)
+    dead = await pool.get()
+    dead.id = "dead"
+    pool.put(dead)
+
+    conn = await pool.get()
+    assert conn is not dead
+    assert pool.stats.ping_failures == 1 and pool.stats.hits == 0
+    await pool.aclose()
+
+
+def test_jittered_max_duration():
+    pool = ConnectionPool(connect_cb=_connect, max_session_duration=100, max_session_jitter=0.2)
+
+    async def _open_all() -> list[DummyConnection]:
+        return [await pool._connect(timeout=1.0) for _ in range(20)]
+
+    conns = asyncio.run(_open_all())
+    durations = {pool._max_durations[c] for c in conns}
+    assert len(durations) > 1
+    assert all(80 <= d <= 100 for d in durations)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+
+import aiohttp
+from aiohttp import web
+
+from livekit.agents import HTTPSessionOptions
+from livekit.agents.ipc import proto
+from livekit.agents.utils import http_context
+
+
+def test_initialize_request_http_options() -> None:
+    opts = HTTPSessionOptions(limit_per_host=8, warmup_urls=["wss://api.example.com/v1/ws"])
+    buf = io.BytesIO()
+    proto.InitializeRequest(http_options=opts).write(buf)
+
+    req = proto.InitializeRequest()
+    req.read(io.BytesIO(buf.getvalue()))
+    assert req.http_options == opts
+
+
+async def _start_server() -> tuple[web.AppRunner, int]:
+    async def _handler(_: web.Request) -> web.Response:
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", _handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, runner.addresses[0][1]
+
+
+async def test_warmup_reuses_connection(caplog) -> None:
+    runner, port = await _start_server()
+
+    url = f"ws://127.0.0.1:{port}/v1/listen"
+    http_context._new_session_ctx(HTTPSessionOptions(warmup_urls=[url]))
+    try:
+        with caplog.at_level(logging.INFO, logger="livekit.agents"):
+            await http_context._warmup([url])
+        assert any(r.getMessage() == "warmed up the http connection" for r in caplog.records)
+
+        session = http_context.http_session()
+        assert isinstance(session.connector, aiohttp.TCPConnector)
+        connections = []
+
+        async def _on_connection_create_end(*_) -> None:
+            connections.append(1)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(_on_connection_create_end)
+        trace_config.freeze()
+        session.trace_configs.append(trace_config)
+
+        async with session.get(f"http://127.0.0.1:{port}/v1/listen") as resp:
+            assert resp.status == 200
+        assert not connections, "expected the warmed up connection to be reused"
+    finally:
+        await http_context._close_http_ctx()
+        await runner.cleanup()
+
+
+async def test_warmup_uses_proxy() -> None:
+    proxied: list[str] = []
+
+    async def _proxy_handler(request: web.Request) -> web.Response:
+        proxied.append(f"{request.method} {request.url}")
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", _proxy_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    proxy = f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+    # the session is created by the warmup, before the job context is set
+    url = "ws://api.example.invalid/v1/listen"
+    http_context._new_session_ctx(HTTPSessionOptions(warmup_urls=[url]), http_proxy=proxy)
+    try:
+        await http_context._warmup([url])
+        assert proxied == ["HEAD http://api.example.invalid/"]
+
+        async with http_context.http_session().get("http://api.example.invalid/v1") as resp:
+            assert resp.status == 200
+        assert proxied[-1] == "GET http://api.example.invalid/v1"
+    finally:
+        await http_context._close_http_ctx()
+        await runner.cleanup()
+
+
+async def test_prewarm_connection() -> None:
+    runner, port = await _start_server()
+    session = aiohttp.ClientSession()  # e.g. a session given to the plugin
+    try:
+        http_context.prewarm_connection(f"ws://127.0.0.1:{port}/v1/listen", session=session)
+        await asyncio.gather(*http_context._prewarm_tasks)
+
+        assert isinstance(session.connector, aiohttp.TCPConnector)
+        assert sum(len(conns) for conns in session.connector._conns.values()) == 1
+    finally:
+        await session.close()
+        await runner.cleanup()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# importing livekit.agents (e.g. in every job process or for types only) must not pull in
+# the heavy dependencies, they're only loaded when the corresponding submodule is used
+HEAVY_MODULES = ["aiohttp", "av", "numpy", "livekit.rtc", "pydantic", "click"]
+
+
+def _importtime(stmt: str) -> dict[str, int]:
+    """run `stmt` with -X importtime and return the cumulative import time (us) per module"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times: dict[str, int] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_import_time():
+    times = _importtime("import livekit.agents")
+    loaded = [m for m in HEAVY_MODULES if m in times]
+    assert not loaded, (
+        f"importing livekit.agents ({times['livekit.agents'] / 1000:.1f}ms) eagerly loaded {loaded}"
+    )
+
+    times = _importtime("from livekit.agents import NOT_GIVEN, NotGivenOr, APIConnectOptions")
+    loaded = [m for m in HEAVY_MODULES if m in times]
+    assert not loaded, f"importing livekit.agents.types eagerly loaded {loaded}"
+
+
+def test_lazy_public_api():
+    import livekit.agents as agents
+
+    for name in agents.__all__:
+        assert getattr(agents, name) is not None, name
+
+    assert set(agents.__all__) <= set(dir(agents))
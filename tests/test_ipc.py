@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 import ctypes
 import io
+import logging
 import multiprocessing as mp
+import pickle
 import socket
 import time
 import uuid
@@ -391,3 +393,185 @@ async def test_job_graceful_shutdown():
     assert proc.exitcode == 0, "process should have exited cleanly"
     assert not proc.killed
     assert start_args.shutdown_counter.value == 1
+
+
+class _CollectHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _log_main(log_cch: socket.socket, num_lines: int, rate_limit: float) -> None:
+    log_handler = ipc.log_queue.LogQueueHandler(
+        utils.aio.duplex_unix._Duplex.open(log_cch), rate_limit=rate_limit
+    )
+    lger = logging.getLogger("lk_log_bench")
+    lger.propagate = False
+    lger.setLevel(logging.DEBUG)
+    lger.addHandler(log_handler)
+
+    for i in range(num_lines):
+        lger.debug("received event %d", i, extra={"event": {"type": "delta", "index": i}})
+
+    lger.warning("done", extra={"obj": object()})
+    log_handler.close()
+    log_handler._send_thread.join()
+
+
+def _run_log_proc(num_lines: int, rate_limit: float) -> _CollectHandler:
+    handler = _CollectHandler()
+    lger = logging.getLogger("lk_log_bench")
+    lger.setLevel(logging.DEBUG)
+    lger.propagate = False
+    lger.addHandler(handler)
+
+    mp_log_pch, mp_log_cch = socket.socketpair()
+    listener = ipc.log_queue.LogQueueListener(
+        utils.aio.duplex_unix._Duplex.open(mp_log_pch), lambda record: None
+    )
+
+    listener.start()
+    proc = mp.get_context("spawn").Process(
+        target=_log_main, args=(mp_log_cch, num_lines, rate_limit)
+    )
+    proc.start()
+    mp_log_cch.close()
+    proc.join()
+    listener.stop()
+    lger.removeHandler(handler)
+    return handler
+
+
+def test_log_queue():
+    handler = _run_log_proc(100, rate_limit=0)
+    assert len(handler.records) == 101
+
+    first = handler.records[0]
+    assert first.getMessage() == "received event 0"
+    assert first.levelno == logging.DEBUG
+    assert first.event == {"type": "delta", "index": 0}
+    assert first.funcName == "_log_main"
+
+    last = handler.records[-1]
+    assert last.getMessage() == "done"
+    assert isinstance(last.obj, str)  # non primitive extras are sent as str
+
+    # records below WARNING are rate limited per logger, the dropped count is reported
+    # when the handler is closed
+    handler = _run_log_proc(5000, rate_limit=100)
+    assert len(handler.records) < 5000
+    assert handler.records[-2].getMessage() == "done"
+    dropped = handler.records[-1]
+    assert dropped.levelno == logging.WARNING
+    assert dropped.name == "lk_log_bench"
+    received = sum(1 for r in handler.records if r.getMessage().startswith("received event"))
+    assert dropped.dropped == 5000 - received
+    assert dropped.getMessage() == f"dropped {dropped.dropped} log records (rate limited)"
+
+
+def test_log_queue_dropped_report():
+    handler = _CollectHandler()
+    lger = logging.getLogger("lk_log_dropped")
+    lger.setLevel(logging.DEBUG)
+    lger.propagate = False
+    lger.addHandler(handler)
+
+    log_pch, log_cch = socket.socketpair()
+    listener = ipc.log_queue.LogQueueListener(
+        utils.aio.duplex_unix._Duplex.open(log_pch), lambda record: None
+    )
+    listener.start()
+    log_handler = ipc.log_queue.LogQueueHandler(
+        utils.aio.duplex_unix._Duplex.open(log_cch), rate_limit=10
+    )
+    try:
+        for i in range(100):
+            log_handler.handle(
+                logging.makeLogRecord(
+                    {"name": "lk_log_dropped", "levelno": logging.DEBUG, "msg": f"line {i}"}
+                )
+            )
+
+        # reported without waiting for another record of the logger or for close()
+        deadline = time.monotonic() + 3.0
+        while not any(hasattr(r, "dropped") for r in handler.records):
+            assert time.monotonic() < deadline, "the dropped count wasn't reported"
+            time.sleep(0.05)
+
+        dropped = next(r for r in handler.records if hasattr(r, "dropped"))
+        assert dropped.dropped + len(handler.records) - 1 == 100
+    finally:
+        log_handler.close()
+        log_handler._send_thread.join()
+        listener.stop()
+        lger.removeHandler(handler)
+
+
+class _RecordingDuplex:
+    def __init__(self) -> None:
+        self.batches: list[list[tuple]] = []
+
+    def send_bytes(self, data: bytes) -> None:
+        self.batches.append(pickle.loads(data)[2])
+
+    def close(self) -> None:
+        pass
+
+
+def test_log_queue_batching():
+    duplex = _RecordingDuplex()
+    # records aren't flushed before the batch is full or the handler is closed
+    log_handler = ipc.log_queue.LogQueueHandler(
+        duplex,  # type: ignore[arg-type]
+        flush_interval=60.0,
+        max_batch_size=512,
+        rate_limit=0,
+    )
+    for i in range(2000):
+        log_handler.handle(
+            logging.makeLogRecord({"name": "lk_log_batch", "levelno": logging.DEBUG, "msg": i})
+        )
+    log_handler.close()
+    log_handler._send_thread.join()
+
+    assert [len(batch) for batch in duplex.batches] == [512, 512, 512, 464]
+    assert [encoded[2] for batch in duplex.batches for encoded in batch] == [
+        str(i) for i in range(2000)
+    ]
+
+
+def test_log_queue_rate_limit():
+    duplex = _RecordingDuplex()
+    log_handler = ipc.log_queue.LogQueueHandler(
+        duplex,  # type: ignore[arg-type]
+        flush_interval=60.0,
+        rate_limit=100,
+    )
+    for i in range(1000):
+        log_handler.handle(
+            logging.makeLogRecord({"name": "lk_log_limit", "levelno": logging.DEBUG, "msg": i})
+        )
+    # records from WARNING aren't rate limited
+    for i in range(10):
+        log_handler.handle(
+            logging.makeLogRecord({"name": "lk_log_limit", "levelno": logging.WARNING, "msg": i})
+        )
+    log_handler.close()
+    log_handler._send_thread.join()
+
+    records = [encoded for batch in duplex.batches for encoded in batch]
+    debug = [r for r in records if r[1] == logging.DEBUG]
+    warnings = [r for r in records if r[1] == logging.WARNING and r[8] is None]
+
+    # the bucket starts full (100 tokens) and refills at 100/s while logging
+    assert 100 <= len(debug) < 500
+    assert len(warnings) == 10
+
+    # the dropped records are reported in a single record once closed
+    (report,) = [r for r in records if r[8] is not None and "dropped" in r[8]]
+    assert report[0] == "lk_log_limit" and report[1] == logging.WARNING
+    assert report[8]["dropped"] == 1000 - len(debug)
+    assert report[2] == f"dropped {1000 - len(debug)} log records (rate limited)"
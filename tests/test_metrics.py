@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pickle
+import sys
+import threading
+
+from livekit.agents.metrics import LLMMetrics, MetricsRegistry, STTMetrics, TurnLatencyMetrics
+
+
+def _llm_metrics(ttft: float, duration: float) -> LLMMetrics:
+    return LLMMetrics(
+        label="openai.LLM",
+        request_id="req",
+        timestamp=0.0,
+        duration=duration,
+        ttft=ttft,
+        cancelled=False,
+        completion_tokens=10,
+        prompt_tokens=100,
+        prompt_cached_tokens=0,
+        total_tokens=110,
+        tokens_per_second=20.0,
+    )
+
+
+def test_metrics_registry_threads() -> None:
+    registry = MetricsRegistry()
+    num_threads, num_metrics = 8, 2000
+    snapshots: list[dict] = []
+    done = threading.Event()
+
+    def _collect() -> None:
+        for _ in range(num_metrics):
+            registry.collect(_llm_metrics(ttft=0.2, duration=0.8))
+            registry.inc("lk_agents_input_dropped_total", "stt")
+
+    def _snapshot() -> None:
+        # races with the collecting threads, like the job process metrics task
+        while not done.is_set():
+            snapshots.append(registry.take_snapshot())
+            registry.render()
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        collectors = [threading.Thread(target=_collect) for _ in range(num_threads)]
+        snapshotter = threading.Thread(target=_snapshot)
+        snapshotter.start()
+        for t in collectors:
+            t.start()
+        for t in collectors:
+            t.join()
+        done.set()
+        snapshotter.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    snapshots.append(registry.take_snapshot())
+    worker_registry = MetricsRegistry()
+    for snapshot in snapshots:
+        worker_registry.merge(snapshot)
+
+    # nothing is lost or counted twice
+    total = num_threads * num_metrics
+    text = worker_registry.render()
+    assert f'lk_agents_llm_ttft_seconds_count{{provider="openai.LLM"}} {total}' in text
+    assert f'lk_agents_llm_prompt_tokens_total{{provider="openai.LLM"}} {total * 100.0}' in text
+    assert f'lk_agents_input_dropped_total{{provider="stt"}} {float(total)}' in text
+
+
+def test_metrics_registry_merge() -> None:
+    job_registry = MetricsRegistry()
+    job_registry.collect(_llm_metrics(ttft=0.2, duration=0.8))
+    job_registry.collect(_llm_metrics(ttft=4.0, duration=6.0))
+    job_registry.collect(
+        STTMetrics(
+            label="deepgram.STT",
+            request_id="req",
+            timestamp=0.0,
+            duration=0.0,
+            audio_duration=1.5,
+            streamed=True,
+        )
+    )
+
+    # the snapshot is sent over IPC and resets the job registry
+    snapshot = pickle.loads(pickle.dumps(job_registry.take_snapshot()))
+    assert job_registry.take_snapshot() == {"histograms": [], "counters": []}
+
+    worker_registry = MetricsRegistry()
+    worker_registry.merge(snapshot)
+    worker_registry.merge(snapshot)
+
+    text = worker_registry.render({"lk_agents_active_jobs": ("Number of running jobs", 2)})
+    lines = text.splitlines()
+
+    assert "# TYPE lk_agents_llm_ttft_seconds histogram" in lines
+    assert 'lk_agents_llm_ttft_seconds_bucket{provider="openai.LLM",le="0.25"} 2' in lines
+    assert 'lk_agents_llm_ttft_seconds_bucket{provider="openai.LLM",le="+Inf"} 4' in lines
+    assert 'lk_agents_llm_ttft_seconds_count{provider="openai.LLM"} 4' in lines
+    assert 'lk_agents_llm_prompt_tokens_total{provider="openai.LLM"} 400.0' in lines
+    assert 'lk_agents_stt_audio_seconds_total{provider="deepgram.STT"} 3.0' in lines
+    assert "lk_agents_stt_duration_seconds_count" not in text  # streamed STT has no duration
+    assert "# TYPE lk_agents_active_jobs gauge" in lines
+    assert "lk_agents_active_jobs 2" in lines
+
+
+def test_turn_latency_spans() -> None:
+    latency = TurnLatencyMetrics(
+        speech_id="speech_1",
+        end_of_speech_at=100.0,
+        final_transcript_at=100.2,
+        eou_inference_started_at=100.25,
+        eou_inference_ended_at=100.3,
+        end_of_turn_at=100.5,
+        llm_started_at=100.55,
+        llm_first_token_at=100.9,
+        tts_started_at=101.0,
+        tts_first_byte_at=101.2,
+        first_frame_captured_at=101.25,
+        e2e_latency=1.25,
+    )
+
+    spans = latency.spans()
+    assert [name for name, _, _ in spans] == [
+        "transcription",
+        "end_of_turn_detection",
+        "eou_inference",
+        "llm_ttft",
+        "tts_ttfb",
+    ]  # playout_delay is missing since the playout start wasn't reported
+
+    registry = MetricsRegistry()
+    registry.collect(latency)
+    assert 'lk_agents_e2e_latency_seconds_bucket{provider="",le="1.5"} 1' in registry.render()
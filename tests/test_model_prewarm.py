@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+
+import psutil
+import pytest
+
+from livekit.agents import Plugin, ipc
+from livekit.agents.debug.tracing import _memory_info
+
+MB = 1024 * 1024
+MODEL_SIZE = 64 * MB
+
+
+class _ModelPlugin(Plugin):
+    def __init__(self, path: str) -> None:
+        super().__init__("model", "0.0.0", "lk_test_model")
+        self._path = path
+
+    def model_files(self) -> list[str]:
+        return [self._path]
+
+
+def _child_memory(path: str, conn) -> None:
+    model = ipc.prewarm.get_model_file(path)
+    assert model is not None and len(model) == MODEL_SIZE
+    (info,) = _memory_info([("child", os.getpid())])
+    conn.send(info)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="the forkserver needs fork")
+def test_model_files_shared(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = str(tmp_path / "model.onnx")
+    with open(path, "wb") as f:
+        f.write(os.urandom(MODEL_SIZE))
+
+    monkeypatch.setattr(Plugin, "registered_plugins", [_ModelPlugin(path)])
+    monkeypatch.setattr(ipc.prewarm, "_model_files", {})
+
+    # what the forkserver does once the plugins are imported
+    ipc.prewarm.load_model_files()
+    assert ipc.prewarm.get_model_file(path) is not None
+
+    pch, cch = mp.Pipe()
+    proc = mp.get_context("fork").Process(target=_child_memory, args=(path, cch))
+    proc.start()
+    try:
+        assert pch.poll(10.0), "the child didn't report its memory"
+        info = pch.recv()
+    finally:
+        proc.join()
+
+    # the model is mapped by the child but not copied
+    assert info["rss_mb"] * MB > MODEL_SIZE
+    assert info["uss_mb"] * MB < MODEL_SIZE / 2, info
+
+
+def test_memory_info() -> None:
+    (info,) = _memory_info([("worker", os.getpid()), ("gone", 2**22 + 1)])
+    assert info["id"] == "worker" and info["pid"] == os.getpid()
+    rss = psutil.Process().memory_info().rss / MB
+    assert info["rss_mb"] == pytest.approx(rss, rel=0.2)
+    assert 0 < info["uss_mb"] <= info["rss_mb"]
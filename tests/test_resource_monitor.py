@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+from livekit.agents.utils.hw import ResourceMonitor, resources
+
+MB = 1024 * 1024
+
+
+def _write_cgroup(root, *, memory_max: str, current: int, inactive_file: int) -> None:
+    (root / "cpu.stat").write_text("usage_usec 1000\nuser_usec 800\nsystem_usec 200\n")
+    (root / "memory.max").write_text(f"{memory_max}\n")
+    (root / "memory.current").write_text(f"{current}\n")
+    (root / "memory.stat").write_text(
+        f"anon {current - inactive_file}\nfile {inactive_file}\n"
+        f"active_file 0\ninactive_file {inactive_file}\n"
+    )
+
+
+def test_cgroup_working_set(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(resources, "_CGROUP_ROOT", str(tmp_path))
+    # 600MB charged to the cgroup, 200MB of it is reclaimable page cache
+    _write_cgroup(tmp_path, memory_max=str(1000 * MB), current=600 * MB, inactive_file=200 * MB)
+
+    monitor = ResourceMonitor()
+    assert monitor.sample().memory == pytest.approx(0.4)
+
+    (tmp_path / "memory.stat").write_text("anon 0\ninactive_file 0\n")
+    monitor._last_time -= 1.0
+    assert monitor.sample().memory == pytest.approx(0.6)
+
+
+def test_process_tree_memory(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # a cgroup without a memory limit measures the worker process tree
+    monkeypatch.setattr(resources, "_CGROUP_ROOT", str(tmp_path))
+    _write_cgroup(tmp_path, memory_max="max", current=600 * MB, inactive_file=0)
+
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import sys; data = bytearray(100 * 1024 * 1024); sys.stdin.read()"],
+        stdin=subprocess.PIPE,
+    )
+    try:
+        child_proc = psutil.Process(child.pid)
+        deadline = time.monotonic() + 5.0
+        while child_proc.memory_info().rss < 100 * MB:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        monitor = ResourceMonitor()
+        usage = monitor.sample().memory * psutil.virtual_memory().total
+        expected = psutil.Process().memory_info().rss + child_proc.memory_info().rss
+        assert usage == pytest.approx(expected, rel=0.1)
+    finally:
+        child.communicate(b"")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from livekit import rtc
+from livekit.agents.voice.room_io._output import _ParticipantAudioOutput
+
+SAMPLE_RATE = 24000
+
+
+class FakeAudioSource:
+    """Plays the queued audio in real time, like the native rtc.AudioSource"""
+
+    def __init__(self, queue_size: float) -> None:
+        self.queue_size = queue_size
+        self.captured: list[rtc.AudioFrame] = []
+        self.max_queued = 0.0
+        self.cancelled_captures = 0
+        self.cleared = 0
+        self._queued = 0.0
+        self._updated_at = time.monotonic()
+        self._cleared_ev = asyncio.Event()
+
+    @property
+    def queued_duration(self) -> float:
+        now = time.monotonic()
+        self._queued = max(self._queued - (now - self._updated_at), 0.0)
+        self._updated_at = now
+        return self._queued
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        try:
+            while self.queued_duration + frame.duration > self.queue_size + 1e-6:
+                await asyncio.sleep(self.queued_duration + frame.duration - self.queue_size)
+        except asyncio.CancelledError:
+            self.cancelled_captures += 1
+            raise
+
+        self._queued += frame.duration
+        self.max_queued = max(self.max_queued, self._queued)
+        self.captured.append(frame)
+
+    async def wait_for_playout(self) -> None:
+        self._cleared_ev.clear()
+        sleep = asyncio.ensure_future(asyncio.sleep(self.queued_duration))
+        cleared = asyncio.ensure_future(self._cleared_ev.wait())
+        await asyncio.wait([sleep, cleared], return_when=asyncio.FIRST_COMPLETED)
+        sleep.cancel()
+        cleared.cancel()
+
+    def clear_queue(self) -> None:
+        self.cleared += 1
+        self._queued = 0.0
+        self._cleared_ev.set()
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakeRoom:
+    def on(self, *_) -> None:
+        pass
+
+    def off(self, *_) -> None:
+        pass
+
+
+def _create_output() -> tuple[_ParticipantAudioOutput, FakeAudioSource]:
+    output = _ParticipantAudioOutput(
+        FakeRoom(),  # type: ignore[arg-type]
+        sample_rate=SAMPLE_RATE,
+        num_channels=1,
+        track_publish_options=rtc.TrackPublishOptions(),
+    )
+    source = FakeAudioSource(queue_size=0.2)
+    output._audio_source = source  # type: ignore[assignment]
+    output._forward_atask = asyncio.create_task(output._forward_audio())
+    output._started_fut.set_result(None)
+    return output, source
+
+
+def _speech(duration: float) -> list[rtc.AudioFrame]:
+    samples_per_channel = SAMPLE_RATE // 10
+    return [
+        rtc.AudioFrame.create(SAMPLE_RATE, 1, samples_per_channel)
+        for _ in range(round(duration * 10))
+    ]
+
+
+async def test_room_output_playout() -> None:
+    output, source = _create_output()
+    started = []
+    output.on("playback_started", started.append)
+    try:
+        await output.capture_frames(_speech(0.6))
+        output.flush()
+        ev = await asyncio.wait_for(output.wait_for_playout(), 2.0)
+
+        assert not ev.interrupted
+        assert abs(ev.playback_position - 0.6) < 1e-6
+        assert len(started) == 1
+        # paced in 20ms chunks, the native queue never holds more than queue_size_ms
+        assert all(abs(f.duration - 0.02) < 1e-6 for f in source.captured)
+        assert abs(sum(f.duration for f in source.captured) - 0.6) < 1e-6
+        assert source.max_queued <= 0.2 + 1e-6
+    finally:
+        await output.aclose()
+
+
+async def test_room_output_interrupt() -> None:
+    output, source = _create_output()
+    started = []
+    output.on("playback_started", started.append)
+    try:
+        await output.capture_frames(_speech(3.0))
+        output.flush()
+        await asyncio.sleep(0.5)
+
+        started_at = time.monotonic()
+        output.clear_buffer()
+        ev = await asyncio.wait_for(output.wait_for_playout(), 1.0)
+        assert time.monotonic() - started_at < 0.1  # the python buffer isn't played out
+
+        assert ev.interrupted
+        assert abs(ev.playback_position - 0.5) < 0.06
+        assert source.cleared == 1
+        assert source.cancelled_captures == 0  # the in-flight capture isn't cancelled
+        assert sum(f.duration for f in source.captured) < 0.8
+        assert len(started) == 1
+
+        # the forwarding keeps working for the next segment
+        assert output._forward_atask is not None and not output._forward_atask.done()
+        captured = len(source.captured)
+        await output.capture_frames(_speech(0.3))
+        output.flush()
+        ev = await asyncio.wait_for(output.wait_for_playout(), 2.0)
+        assert not ev.interrupted
+        assert abs(ev.playback_position - 0.3) < 1e-6
+        assert abs(sum(f.duration for f in source.captured[captured:]) - 0.3) < 1e-6
+        assert len(started) == 2  # the playback of the next segment is reported
+
+        # and for the segments after it
+        await output.capture_frames(_speech(0.2))
+        output.flush()
+        await asyncio.wait_for(output.wait_for_playout(), 2.0)
+        assert len(started) == 3
+    finally:
+        await output.aclose()
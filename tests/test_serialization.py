@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import base64
+import json
+
+import numpy as np
+import pytest
+
+from livekit.agents.utils import serialization
+
+
+@pytest.fixture(params=serialization.available_json_backends())
+def backend(request):
+    default_backend = serialization.json_backend()
+    serialization.set_json_backend(request.param)
+    yield request.param
+    serialization.set_json_backend(default_backend)
+
+
+def test_json_roundtrip(backend) -> None:
+    obj = {"type": "transcript", "text": 'héllo "world"\n', "values": [1, 2.5, None, True]}
+    assert json.loads(serialization.json_dumps(obj)) == obj
+    assert serialization.json_loads(json.dumps(obj)) == obj
+    assert serialization.json_loads(json.dumps(obj).encode()) == obj
+
+    # not supported by orjson, serialized by the standard library
+    assert json.loads(serialization.json_dumps({1: 2**70})) == {"1": 2**70}
+
+    with pytest.raises(json.JSONDecodeError):
+        serialization.json_loads("{")
+
+
+def test_base64() -> None:
+    samples = np.arange(-480, 480, dtype=np.int16)
+    data = memoryview(samples)  # like rtc.AudioFrame.data
+
+    encoded = serialization.b64encode(data)
+    assert encoded == base64.b64encode(samples.tobytes()).decode()
+    assert serialization.b64decode(encoded) == samples.tobytes()
+
+
+def test_base64_template() -> None:
+    template = serialization.Base64JSONTemplate({"type": "audio_chunk", "data": {"chunk": ...}})
+    audio = bytes(range(256))
+
+    msg = json.loads(template.render(audio))
+    assert msg == {"type": "audio_chunk", "data": {"chunk": base64.b64encode(audio).decode()}}
+    assert template.render(base64.b64encode(audio).decode()) == template.render(audio)
+
+    with pytest.raises(ValueError):
+        serialization.Base64JSONTemplate({"type": "audio_chunk"})
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+
+from livekit import rtc
+from livekit.agents.stt import AudioGateOptions
+from livekit.agents.stt.audio_gate import AudioGate
+
+
+def _frame(amplitude: int, duration: float = 0.1, sample_rate: int = 16000) -> rtc.AudioFrame:
+    samples = int(sample_rate * duration)
+    data = np.full(samples, amplitude, dtype=np.int16)
+    return rtc.AudioFrame(
+        data.tobytes(), sample_rate=sample_rate, num_channels=1, samples_per_channel=samples
+    )
+
+
+def test_audio_gate_energy() -> None:
+    gate = AudioGate(AudioGateOptions(pre_roll=0.3, hangover=0.2, keepalive_interval=0.5))
+
+    for _ in range(9):
+        assert gate.push(_frame(0)) == []
+    assert gate.keepalive_due()
+    assert not gate.keepalive_due()
+
+    # the speech is forwarded with the pre-roll
+    frames = gate.push(_frame(10000))
+    assert len(frames) == 4
+    assert gate.is_open
+
+    assert len(gate.push(_frame(0))) == 1
+    assert len(gate.push(_frame(0))) == 1  # hangover
+    assert not gate.is_open
+    assert gate.push(_frame(0)) == []
+
+
+def test_audio_gate_vad() -> None:
+    gate = AudioGate(AudioGateOptions(pre_roll=0.2, hangover=0.0))
+
+    # driven by the VAD, the energy is ignored
+    for _ in range(5):
+        assert gate.update_speaking(False) == []
+        assert gate.push(_frame(10000)) == []
+
+    assert len(gate.update_speaking(True)) == 2
+    assert len(gate.push(_frame(0))) == 1
+    assert gate.is_open
+
+    gate.update_speaking(False)
+    gate.push(_frame(0))
+    assert not gate.is_open
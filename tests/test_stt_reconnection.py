@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+
+from livekit import rtc
+from livekit.agents import APIConnectionError, APIConnectOptions, utils
+from livekit.agents.metrics import STTReconnectionMetrics
+from livekit.agents.stt import (
+    STT,
+    RecognizeStream,
+    SpeechData,
+    SpeechEvent,
+    SpeechEventType,
+    STTCapabilities,
+)
+from livekit.agents.stt.stt import _HandoffDedup
+
+
+def _frame(duration: float = 0.1) -> rtc.AudioFrame:
+    samples = int(16000 * duration)
+    return rtc.AudioFrame(
+        b"\x00\x00" * samples, sample_rate=16000, num_channels=1, samples_per_channel=samples
+    )
+
+
+class _ConnSTT(STT):
+    def __init__(self) -> None:
+        super().__init__(capabilities=STTCapabilities(streaming=True, interim_results=False))
+
+    async def _recognize_impl(self, buffer, *, language, conn_options):  # type: ignore
+        raise NotImplementedError
+
+    def stream(self, *, language=None, conn_options=None) -> _ConnStream:  # type: ignore
+        return _ConnStream(stt=self, conn_options=conn_options or APIConnectOptions())
+
+
+class _ConnStream(RecognizeStream):
+    """Each `_run` is a connection recording the frames it received, the final transcripts
+    sent to its `transcripts` channel are emitted until the channel is closed"""
+
+    def __init__(self, *, stt: STT, conn_options: APIConnectOptions) -> None:
+        super().__init__(stt=stt, conn_options=conn_options, max_replay_duration=1.0)
+        self.connections: list[list[rtc.AudioFrame]] = []
+        self.transcripts: list[utils.aio.Chan[str]] = []
+        self.fail_after: int | None = None
+
+    async def _run(self) -> None:
+        frames: list[rtc.AudioFrame] = []
+        transcripts = utils.aio.Chan[str]()
+        self.connections.append(frames)
+        self.transcripts.append(transcripts)
+
+        async def _send_transcripts() -> None:
+            async for text in transcripts:
+                self._event_ch.send_nowait(_final(text))
+
+        send_task = asyncio.create_task(_send_transcripts())
+        try:
+            await asyncio.sleep(0.05)  # connecting
+            async for data in self._input_ch:
+                if isinstance(data, rtc.AudioFrame):
+                    frames.append(data)
+                    if self.fail_after is not None and len(frames) >= self.fail_after:
+                        self.fail_after = None
+                        raise APIConnectionError("connection lost")
+
+            # the last results are flushed after the end of the input
+            await send_task
+        finally:
+            transcripts.close()
+            await utils.aio.cancel_and_wait(send_task)
+
+
+def _final(text: str) -> SpeechEvent:
+    return SpeechEvent(
+        type=SpeechEventType.FINAL_TRANSCRIPT, alternatives=[SpeechData(language="", text=text)]
+    )
+
+
+def test_handoff_dedup() -> None:
+    # the common prefix of the two connections is removed, whichever emits first
+    dedup = _HandoffDedup(1, 2)
+    assert dedup.strip(2, "Can you check my account?") == "Can you check my account?"
+    assert dedup.strip(1, "can you check") == ""
+    assert dedup.strip(1, "my account. Thanks") == "Thanks"
+    assert dedup.strip(2, "thanks,") == ""
+    assert dedup.strip(2, "bye") == "bye"
+
+    # words emitted at another position aren't duplicates
+    dedup = _HandoffDedup(1, 2)
+    assert dedup.strip(1, "can you check my account") == "can you check my account"
+    assert dedup.strip(2, "my account") == "my account"
+
+    dedup = _HandoffDedup(1, 2)
+    assert dedup.strip(1, "hello there") == "hello there"
+    assert dedup.strip(2, "what time is it") == "what time is it"
+    assert dedup.strip(2, "- hello there") == "- hello there"
+
+
+async def test_stt_handoff() -> None:
+    stt = _ConnSTT()
+    reconnections: list[STTReconnectionMetrics] = []
+    stt.on(
+        "metrics_collected",
+        lambda m: reconnections.append(m) if isinstance(m, STTReconnectionMetrics) else None,
+    )
+
+    stream = stt.stream()
+    for _ in range(5):
+        stream.push_frame(_frame())
+    await asyncio.sleep(0.1)
+
+    stream._handoff()
+    await asyncio.sleep(0)
+    stream.push_frame(_frame())  # sent to both connections until the new one is ready
+    await asyncio.sleep(0.1)
+    stream.push_frame(_frame())
+    await asyncio.sleep(0.05)
+
+    old, new = stream.connections
+    assert len(old) == 6  # the old input ended once the new connection was ready
+    assert len(new) == 7  # replayed audio + the new frames
+
+    assert len(reconnections) == 1
+    assert reconnections[0].make_before_break
+    assert reconnections[0].gap_duration == 0.0
+    assert abs(reconnections[0].replayed_audio_duration - 0.6) < 1e-6
+
+    # both connections transcribed the replayed audio
+    old_transcripts, new_transcripts = stream.transcripts
+    old_transcripts.send_nowait("can you check")
+    assert (await stream.__anext__()).alternatives[0].text == "can you check"
+    new_transcripts.send_nowait("can you check my account")
+    assert (await stream.__anext__()).alternatives[0].text == "my account"
+    old_transcripts.close()
+
+    # the following transcripts of the new connection are untouched
+    new_transcripts.send_nowait("can you check")
+    assert (await stream.__anext__()).alternatives[0].text == "can you check"
+
+    new_transcripts.close()
+    stream.end_input()
+    async for _ in stream:
+        pass
+
+
+async def test_stt_reconnect_bounded_replay() -> None:
+    stt = _ConnSTT()
+    stream = _ConnStream(
+        stt=stt, conn_options=APIConnectOptions(max_retry=1, retry_interval=0.2, timeout=1.0)
+    )
+    stream.fail_after = 3
+
+    for _ in range(3):
+        stream.push_frame(_frame())
+    await asyncio.sleep(0.1)
+
+    # audio piling up while reconnecting is bounded by max_replay_duration
+    for _ in range(20):
+        stream.push_frame(_frame())
+    await asyncio.sleep(0.4)
+
+    assert len(stream.connections) == 2
+    assert len(stream.connections[1]) == 10
+
+    stream.transcripts[1].close()
+    stream.end_input()
+    async for _ in stream:
+        pass
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import numpy as np
+
+from livekit import rtc
+from livekit.agents import APIConnectionError, APIConnectOptions, stt, utils, vad
+from livekit.agents.stt.stream_adapter import _MAX_OVERLAP_WORDS, _stitch_transcripts
+
+SAMPLE_RATE = 16000
+FRAME_SIZE = SAMPLE_RATE // 100  # 10ms
+
+
+def test_stitch_transcripts() -> None:
+    # the words of the audio overlap are removed
+    assert _stitch_transcripts(["hello there how", "how are you"]) == "hello there how are you"
+    assert _stitch_transcripts(["I think that", "think, that we"]) == "I think that we"
+    # no overlap
+    assert _stitch_transcripts(["hello there", "how are you"]) == "hello there how are you"
+    assert _stitch_transcripts(["", "hello", ""]) == "hello"
+
+    # the overlap search is bounded
+    words = [f"w{i}" for i in range(_MAX_OVERLAP_WORDS + 2)]
+    long_text = " ".join(words)
+    assert _stitch_transcripts([long_text, long_text]) == f"{long_text} {long_text}"
+    tail = " ".join(words[-_MAX_OVERLAP_WORDS:])
+    assert _stitch_transcripts([long_text, f"{tail} next"]) == f"{long_text} next"
+
+
+class _EnergyVAD(vad.VAD):
+    """Frames with non-zero samples are speech, the speech ends after 0.5s of silence"""
+
+    def __init__(self) -> None:
+        super().__init__(capabilities=vad.VADCapabilities(update_interval=0.01))
+
+    def stream(self) -> vad.VADStream:
+        return _EnergyVADStream(self)
+
+
+class _EnergyVADStream(vad.VADStream):
+    async def _main_task(self) -> None:
+        speaking = False
+        silence = 0.0
+        speech: list[rtc.AudioFrame] = []
+        async for frame in self._input_ch:
+            if not isinstance(frame, rtc.AudioFrame):
+                continue
+
+            voiced = bool(np.any(np.frombuffer(frame.data, dtype=np.int16)))
+            silence = 0.0 if voiced else silence + frame.duration
+            if voiced and not speaking:
+                speaking = True
+                speech = [frame]
+                self._event_ch.send_nowait(_vad_event(vad.VADEventType.START_OF_SPEECH, [frame]))
+                continue
+
+            if not speaking:
+                continue
+
+            speech.append(frame)
+            if silence >= 0.5:
+                speaking = False
+                self._event_ch.send_nowait(_vad_event(vad.VADEventType.END_OF_SPEECH, speech))
+                continue
+
+            ev = _vad_event(vad.VADEventType.INFERENCE_DONE, [frame])
+            ev.speaking = True
+            ev.raw_accumulated_silence = silence
+            self._event_ch.send_nowait(ev)
+
+
+def _vad_event(type: vad.VADEventType, frames: list[rtc.AudioFrame]) -> vad.VADEvent:
+    return vad.VADEvent(
+        type=type, samples_index=0, timestamp=0.0, speech_duration=0.0, silence_duration=0.0,
+        frames=frames,
+    )  # fmt: skip
+
+
+class _WordsSTT(stt.STT):
+    """Transcribes the sample values of the buffer, each non-zero value is a word"""
+
+    def __init__(self, *, fail_first: bool = False) -> None:
+        super().__init__(capabilities=stt.STTCapabilities(streaming=False, interim_results=False))
+        self._fail_first = fail_first
+        self.buffers: list[float] = []
+
+    async def _recognize_impl(self, buffer, *, language, conn_options) -> stt.SpeechEvent:
+        frame = utils.merge_frames(buffer)
+        self.buffers.append(frame.duration)
+        if self._fail_first:
+            self._fail_first = False
+            raise APIConnectionError("chunk failed")
+
+        samples = np.frombuffer(frame.data, dtype=np.int16)
+        words = [f"w{v}" for i, v in enumerate(samples) if v and (i == 0 or samples[i - 1] != v)]
+        return stt.SpeechEvent(
+            type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+            alternatives=[stt.SpeechData(language="en", text=" ".join(words))],
+        )
+
+
+def _frames(value: int, duration: float) -> list[rtc.AudioFrame]:
+    data = np.full(FRAME_SIZE, value, dtype=np.int16).tobytes()
+    return [rtc.AudioFrame(data, SAMPLE_RATE, 1, FRAME_SIZE) for _ in range(round(duration * 100))]
+
+
+async def _run_utterance(recognizer: stt.STT) -> list[stt.SpeechEvent]:
+    stream = recognizer.stream(conn_options=APIConnectOptions(max_retry=0))
+    # a chunk is cut at each pause, the overlap (0.1s) is the silence before the cut
+    for frame in (
+        _frames(1, 0.2) + _frames(2, 0.2) + _frames(3, 0.2) + _frames(0, 0.35)
+        + _frames(4, 0.2) + _frames(5, 0.2) + _frames(0, 0.6)
+    ):  # fmt: skip
+        stream.push_frame(frame)
+    stream.end_input()
+
+    events = [ev async for ev in stream]
+    await stream.aclose()
+    return events
+
+
+async def test_stream_adapter_chunked() -> None:
+    words_stt = _WordsSTT()
+    adapter = stt.StreamAdapter(
+        stt=words_stt,
+        vad=_EnergyVAD(),
+        chunked_recognition=True,
+        min_pause_duration=0.3,
+        chunk_overlap=0.1,
+    )
+    events = await _run_utterance(adapter)
+
+    # cut at both pauses, the last chunk only contains the trailing silence
+    assert len(words_stt.buffers) == 3
+    types = [ev.type for ev in events]
+    assert types[0] == stt.SpeechEventType.START_OF_SPEECH
+    assert types[-2:] == [stt.SpeechEventType.END_OF_SPEECH, stt.SpeechEventType.FINAL_TRANSCRIPT]
+    interims = [ev for ev in events if ev.type == stt.SpeechEventType.INTERIM_TRANSCRIPT]
+    assert [ev.alternatives[0].text for ev in interims][0] == "w1 w2 w3"
+    assert events[-1].alternatives[0].text == "w1 w2 w3 w4 w5"
+
+
+async def test_stream_adapter_chunk_failure() -> None:
+    words_stt = _WordsSTT(fail_first=True)
+    adapter = stt.StreamAdapter(
+        stt=words_stt,
+        vad=_EnergyVAD(),
+        chunked_recognition=True,
+        min_pause_duration=0.3,
+        chunk_overlap=0.1,
+    )
+    events = await _run_utterance(adapter)
+
+    # the whole utterance is recognized again instead of dropping the failed chunk
+    assert len(words_stt.buffers) == 4
+    assert words_stt.buffers[-1] == max(words_stt.buffers)  # the whole utterance
+    assert events[-1].type == stt.SpeechEventType.FINAL_TRANSCRIPT
+    assert events[-1].alternatives[0].text == "w1 w2 w3 w4 w5"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+
+from livekit.agents.debug.tracing import TracingHandle, _iter_json
+
+
+def test_tracing_handle_bounded() -> None:
+    handle = TracingHandle(max_events=100)
+    for i in range(250):
+        handle.log_event("event", {"i": i})
+
+    graph = handle.add_graph(title="load", x_label="time", y_label="load", max_data_points=1000)
+    for i in range(1000):
+        graph.plot(i, 1.0 if i == 500 else 0.0)
+
+    exported = handle._export(max_points=100)
+    assert len(exported["events"]) == 100
+    assert exported["events"][0]["data"] == {"i": 150}
+    assert exported["cursor"] == 250
+
+    data = exported["graph"][0]["data"]
+    assert len(data) == 100
+    assert max(y for _, y in data) == 1.0  # the spike survives the downsampling
+
+    # only the events logged after the cursor are exported
+    handle.log_event("new", None)
+    exported = handle._export(cursor=exported["cursor"])
+    assert [e["name"] for e in exported["events"]] == ["new"]
+
+    # the streamed encoding is equivalent to json.dumps
+    full = handle._export()
+    assert json.loads("".join(_iter_json(full, chunk_size=16))) == json.loads(json.dumps(full))
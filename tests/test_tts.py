@@ -16,7 +16,14 @@ import pytest
 from dotenv import load_dotenv
 
 from livekit import rtc
-from livekit.agents import APIConnectOptions, APIError, APITimeoutError, tokenize, tts
+from livekit.agents import (
+    APIConnectOptions,
+    APIError,
+    APITimeoutError,
+    InputQueueOptions,
+    tokenize,
+    tts,
+)
 from livekit.agents.utils import AudioBuffer, aio
 from livekit.plugins import (
     aws,
@@ -945,3 +952,39 @@ async def test_tts_audio_emitter_wav(monkeypatch):
     silence = msgs3[1].frame.data.tobytes()
     assert msgs3[1].is_final is True
     assert silence == b"\x00\x00" * 10
+
+
+async def test_tts_audio_emitter_coalesce(monkeypatch):
+    monkeypatch.setattr(tts.tts, "lk_dump_tts", False)
+
+    # the encoded audio can't be dropped
+    with pytest.raises(ValueError):
+        tts.AudioEmitter(
+            label="test",
+            dst_ch=aio.Chan[tts.SynthesizedAudio](),
+            queue_options=InputQueueOptions(max_size=2, policy="drop_oldest"),
+        )
+
+    rx = aio.Chan[tts.SynthesizedAudio]()
+    emitter = tts.AudioEmitter(
+        label="test",
+        dst_ch=rx,
+        queue_options=InputQueueOptions(max_size=2, policy="coalesce"),
+    )
+    emitter.initialize(
+        request_id="req",
+        sample_rate=1000,
+        num_channels=1,
+        mime_type="audio/pcm",
+        frame_size_ms=100,
+    )
+
+    # pushed before the main task runs, the chunks past the bound are merged
+    for i in range(10):
+        emitter.push(bytes([i, i]) * 50)
+    emitter.flush()
+    await emitter.join()
+    rx.close()
+
+    data = b"".join([msg.frame.data.tobytes() async for msg in rx])
+    assert data[:1000] == b"".join(bytes([i, i]) * 50 for i in range(10))
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from livekit import rtc
+from livekit.agents.cli import _bench
+from livekit.agents.metrics import TurnLatencyMetrics, export_turn_latency
+from livekit.agents.metrics.registry import get_process_registry
+from livekit.agents.voice import Agent, AgentSession, MetricsCollectedEvent, io
+
+LLM_TTFT = 0.3
+TTS_TTFB = 0.2
+PLAYOUT_DELAY = 0.15
+
+
+class DelayedPlayoutOutput(_bench._BenchAudioOutput):
+    """Starts playing PLAYOUT_DELAY after the first frame is captured, like a jitter buffer"""
+
+    def __init__(self, stats: _bench._SessionStats, *, report_playout: bool = True) -> None:
+        super().__init__(stats)
+        self.started = asyncio.Event()
+        self.captured = asyncio.Event()
+        self._report_playout = report_playout
+
+    def on_playback_started(self, *, created_at: float) -> None:
+        super().on_playback_started(created_at=created_at)
+        self.started.set()
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await io.AudioOutput.capture_frame(self, frame)
+        if not self._pushed_duration:
+            self._capture_start = time.perf_counter()
+            self.captured.set()
+            if self._report_playout:
+                started_at = time.time() + PLAYOUT_DELAY
+                asyncio.get_running_loop().call_later(
+                    PLAYOUT_DELAY, lambda: self.on_playback_started(created_at=started_at)
+                )
+
+        self._pushed_duration += frame.duration
+
+
+async def _run_turn(*, report_playout: bool = True) -> TurnLatencyMetrics:
+    session = AgentSession(
+        turn_detection="stt",
+        stt=_bench._BenchSTT(latency=0.2),
+        llm=_bench._BenchLLM(ttft=LLM_TTFT, tokens_per_second=80),
+        tts=_bench._BenchTTS(ttfb=TTS_TTFB, chars_per_second=15),
+    )
+    stats = _bench._SessionStats([])
+    session.input.audio = _bench._BenchAudioInput(
+        _bench._load_utterance(None), turn_interval=30.0, stats=stats
+    )
+    audio_output = DelayedPlayoutOutput(stats, report_playout=report_playout)
+    session.output.audio = audio_output
+
+    turn = asyncio.Future[TurnLatencyMetrics]()
+
+    @session.on("metrics_collected")
+    def _on_metrics_collected(ev: MetricsCollectedEvent) -> None:
+        if isinstance(ev.metrics, TurnLatencyMetrics) and not turn.done():
+            turn.set_result(ev.metrics)
+
+    await session.start(Agent(instructions="You are a helpful assistant."))
+    try:
+        # the metrics are emitted once the speech is done, don't wait for the whole playout
+        started = audio_output.started if report_playout else audio_output.captured
+        await asyncio.wait_for(started.wait(), 10.0)
+        session.interrupt()
+        return await asyncio.wait_for(turn, 5.0)
+    finally:
+        await session.aclose()
+
+
+async def test_turn_latency_breakdown() -> None:
+    m = await _run_turn()
+
+    assert m.end_of_speech_at is not None and m.final_transcript_at is not None
+    assert m.end_of_turn_at is not None and m.llm_started_at is not None
+    assert m.llm_first_token_at is not None
+    assert m.tts_started_at is not None and m.tts_first_byte_at is not None
+    assert m.first_frame_captured_at is not None and m.playout_started_at is not None
+
+    assert m.end_of_speech_at <= m.end_of_turn_at <= m.llm_started_at
+    assert m.llm_first_token_at - m.llm_started_at == pytest.approx(LLM_TTFT, abs=0.1)
+    assert m.tts_first_byte_at - m.tts_started_at == pytest.approx(TTS_TTFB, abs=0.1)
+    # the playout start reported by the audio output is used, not the first captured frame
+    assert m.playout_started_at - m.first_frame_captured_at == pytest.approx(
+        PLAYOUT_DELAY, abs=0.05
+    )
+    assert m.e2e_latency == pytest.approx(m.playout_started_at - m.end_of_speech_at)
+    assert not m.e2e_latency_from_first_frame
+
+    names = [name for name, _, _ in m.spans()]
+    assert {"end_of_turn_detection", "llm_ttft", "tts_ttfb", "playout_delay"} <= set(names)
+    assert names.index("llm_ttft") < names.index("tts_ttfb") < names.index("playout_delay")
+
+    assert "lk_agents_e2e_latency_seconds_count" in get_process_registry().render()
+
+
+async def test_turn_latency_without_playout() -> None:
+    m = await _run_turn(report_playout=False)
+
+    # falls back to the first captured frame, and says so
+    assert m.playout_started_at is None
+    assert m.end_of_speech_at is not None and m.first_frame_captured_at is not None
+    assert m.e2e_latency == pytest.approx(m.first_frame_captured_at - m.end_of_speech_at)
+    assert m.e2e_latency_from_first_frame
+
+
+class _FakeSpan:
+    def __init__(self, name: str, start_time: int, attributes: dict[str, Any], context: Any):
+        self.name = name
+        self.start_time = start_time
+        self.end_time: int | None = None
+        self.attributes = attributes
+        self.context = context
+
+    def end(self, end_time: int) -> None:
+        self.end_time = end_time
+
+
+class _FakeTracer:
+    def __init__(self) -> None:
+        self.spans: list[_FakeSpan] = []
+
+    def start_span(self, name, context=None, start_time=0, attributes=None) -> _FakeSpan:
+        span = _FakeSpan(name, start_time, attributes or {}, context)
+        self.spans.append(span)
+        return span
+
+
+def test_export_turn_latency() -> None:
+    pytest.importorskip("opentelemetry")
+
+    m = TurnLatencyMetrics(
+        speech_id="speech",
+        end_of_speech_at=100.0,
+        end_of_turn_at=100.5,
+        eou_inference_started_at=100.1,
+        eou_inference_ended_at=100.2,
+        eou_inference_duration=0.08,
+        eou_ipc_delay=0.02,
+        llm_started_at=100.5,
+        llm_first_token_at=100.8,
+        first_frame_captured_at=101.0,
+        playout_started_at=101.1,
+        e2e_latency=1.1,
+    )
+    tracer = _FakeTracer()
+    export_turn_latency(m, tracer=tracer)
+
+    root, *children = tracer.spans
+    assert root.name == "agent_turn"
+    assert root.attributes == {
+        "lk.speech_id": "speech",
+        "lk.interrupted": False,
+        "lk.e2e_latency": 1.1,
+        "lk.e2e_latency_from_first_frame": False,
+    }
+    assert (root.start_time, root.end_time) == (100_000_000_000, 101_100_000_000)
+
+    assert [s.name for s in children] == [
+        "end_of_turn_detection", "eou_inference", "llm_ttft", "playout_delay",
+    ]  # fmt: skip
+    # the stages are children of the turn span
+    assert root.context is None
+    assert all(root in s.context.values() for s in children)
+    eou = children[1]
+    assert eou.attributes == {"lk.inference_duration": 0.08, "lk.ipc_delay": 0.02}
+    assert (eou.start_time, eou.end_time) == (100_100_000_000, 100_200_000_000)
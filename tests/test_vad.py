@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from livekit.agents import vad
@@ -83,3 +85,27 @@ async def test_file_vad(sample_rate):
 
     assert start_of_speech_i > 0, "no start of speech detected"
     assert start_of_speech_i == end_of_speech_i, "start and end of speech mismatch"
+
+
+async def test_vad_catch_up() -> None:
+    frames, _ = await utils.make_test_speech(chunk_duration_ms=10, sample_rate=16000)
+    slow_vad = silero.VAD.load(catch_up_threshold=0.1)
+    stream = slow_vad.stream()
+
+    session = stream._model._sess
+    model_calls = 0
+
+    class _SlowSession:
+        def run(self, *args):
+            nonlocal model_calls
+            model_calls += 1
+            time.sleep(0.05)  # slower than the 32ms windows
+            return session.run(*args)
+
+    stream._model._sess = _SlowSession()
+    for frame in frames[:200]:
+        stream.push_frame(frame)
+    stream.end_input()
+
+    inference_count = sum([ev.type == vad.VADEventType.INFERENCE_DONE async for ev in stream])
+    assert 0 < model_calls < inference_count
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from livekit.agents import JobRequest, Worker, WorkerOptions
+from livekit.agents.utils.hw import get_cpu_monitor
+from livekit.agents.worker import _DefaultLoadCalc, _WorkerEnvOption
+from livekit.protocol import agent, models
+
+
+async def _entrypoint(ctx) -> None:
+    pass
+
+
+def _create_worker(**kwargs) -> Worker:
+    opts = WorkerOptions(
+        entrypoint_fnc=lambda ctx: None, api_key="key", api_secret="secret", ws_url="ws://x",
+        **kwargs,
+    )  # fmt: skip
+    return Worker(opts, devmode=False, loop=asyncio.get_running_loop())
+
+
+async def test_composite_load() -> None:
+    worker = _create_worker()
+    worker._cpu_avg.add_sample(0.2)
+    worker._memory_avg.add_sample(0.4)
+    assert _DefaultLoadCalc.get_load(worker) == pytest.approx(0.4)
+
+    # the most loaded resource determines the load
+    worker._inference_executor = SimpleNamespace(latency_p95=0.3, pending_requests=0)  # type: ignore[assignment]
+    assert _DefaultLoadCalc.get_load(worker) == pytest.approx(0.6)
+    worker._inference_executor = SimpleNamespace(latency_p95=0.0, pending_requests=64)  # type: ignore[assignment]
+    assert _DefaultLoadCalc.get_load(worker) == 1.0
+
+
+async def test_job_cost_from_idle_baseline(monkeypatch: pytest.MonkeyPatch) -> None:
+    worker = _create_worker()
+
+    # not learned before the idle load is known
+    worker._worker_load = 0.5
+    worker._learn_job_cost(active_jobs=2)
+    assert worker._estimated_job_cost() == 0.0
+
+    worker._worker_load = 0.3
+    worker._learn_job_cost(active_jobs=0)
+
+    # each job adds 0.1 above the 0.3 idle baseline
+    worker._worker_load = 0.5
+    worker._learn_job_cost(active_jobs=2)
+    assert worker._estimated_job_cost() == pytest.approx(0.1)
+
+    # the pending assignments are projected with the learned cost
+    worker._pending_assignments["a"] = asyncio.Future()
+    assert worker._projected_load() == pytest.approx(0.6)
+    worker._pending_assignments.clear()
+
+    # nothing is learned while processes are warming up
+    monkeypatch.setattr(type(worker._proc_pool), "num_warming_processes", property(lambda _: 1))
+    worker._worker_load = 0.9
+    worker._learn_job_cost(active_jobs=2)
+    assert worker._estimated_job_cost() == pytest.approx(0.1)
+
+
+async def _request_job(
+    worker: Worker, monkeypatch: pytest.MonkeyPatch
+) -> list[agent.WorkerMessage]:
+    sent: list[agent.WorkerMessage] = []
+
+    async def _queue_msg(msg: agent.WorkerMessage) -> None:
+        sent.append(msg)
+
+    monkeypatch.setattr(worker, "_queue_msg", _queue_msg)
+    job = agent.Job(id="job", room=models.Room(name="room"))
+    await worker._answer_availability(agent.AvailabilityRequest(job=job))
+    await asyncio.gather(*worker._tasks)
+    return sent
+
+
+async def test_job_rejected_over_capacity(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the default request_fnc accepts every job, they're rejected before it's called
+    worker = _create_worker(load_threshold=0.7)
+    worker._idle_load.apply(1.0, 0.3)
+    worker._job_cost.apply(1.0, 0.15)
+
+    # 0.6 + 0.15 >= 0.7, rejected without asking the user
+    worker._worker_load = 0.6
+    sent = await _request_job(worker, monkeypatch)
+    assert len(sent) == 1 and not sent[0].availability.available
+    assert sent[0].availability.job_id == "job"
+    assert not worker._pending_assignments
+
+
+async def test_request_fnc_over_capacity(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[JobRequest] = []
+
+    async def _request_fnc(req: JobRequest) -> None:
+        requests.append(req)
+        await req.reject()
+
+    worker = _create_worker(request_fnc=_request_fnc, load_threshold=0.7)
+    worker._idle_load.apply(1.0, 0.3)
+    worker._job_cost.apply(1.0, 0.15)
+
+    # 0.5 + 0.15 < 0.7
+    worker._worker_load = 0.5
+    sent = await _request_job(worker, monkeypatch)
+    assert len(requests) == 1
+    assert len(sent) == 1 and not sent[0].availability.available
+
+    # over capacity, a custom request_fnc still decides
+    worker._worker_load = 0.6
+    sent = await _request_job(worker, monkeypatch)
+    assert len(requests) == 2
+    assert len(sent) == 1 and not sent[0].availability.available
+
+
+def test_num_idle_processes_default() -> None:
+    # resolved when read, not when the worker module is imported
+    opts = pickle.loads(pickle.dumps(WorkerOptions(entrypoint_fnc=_entrypoint)))
+    assert isinstance(opts.num_idle_processes, _WorkerEnvOption)
+    assert callable(opts.num_idle_processes.prod_default)
+    assert _WorkerEnvOption.getvalue(opts.num_idle_processes, False) == math.ceil(
+        get_cpu_monitor().cpu_count()
+    )
+    assert _WorkerEnvOption.getvalue(opts.num_idle_processes, True) == 0
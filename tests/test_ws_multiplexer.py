@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from livekit.agents import APIConnectionError
+from livekit.agents.utils import WebSocketMultiplexer, ping_websocket, ws_multiplexer
+
+
+async def _start_server() -> tuple[web.AppRunner, int, dict]:
+    state: dict = {"connections": 0, "cancelled": [], "pong": True}
+
+    async def _handler(request: web.Request) -> web.WebSocketResponse:
+        # without autoping, the PINGs are ignored instead of being answered
+        ws = web.WebSocketResponse(autoping=state["pong"])
+        await ws.prepare(request)
+        state["connections"] += 1
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                continue
+
+            data = msg.json()
+            if data.get("cancel"):
+                state["cancelled"].append(data["context_id"])
+            elif data.get("end"):
+                await ws.send_json({"context_id": data["context_id"], "done": True})
+            else:
+                await ws.send_json({"context_id": data["context_id"], "echo": data["text"]})
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/ws", _handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, runner.addresses[0][1], state
+
+
+async def test_contexts_share_connection() -> None:
+    runner, port, state = await _start_server()
+    session = aiohttp.ClientSession()
+
+    async def _connect(timeout: float) -> aiohttp.ClientWebSocketResponse:
+        return await asyncio.wait_for(session.ws_connect(f"http://127.0.0.1:{port}/ws"), timeout)
+
+    mux = WebSocketMultiplexer(
+        connect_cb=_connect,
+        context_id_fnc=lambda data: data.get("context_id"),
+        cancel_packet_fnc=lambda context_id: {"context_id": context_id, "cancel": True},
+    )
+
+    async def _synthesize(context_id: str) -> list[str]:
+        async with mux.context(context_id) as ctx:
+            received = []
+            for i in range(3):
+                await ctx.send({"context_id": context_id, "text": f"{context_id}-{i}"})
+            await ctx.send({"context_id": context_id, "end": True})
+            while not (data := await ctx.recv()).get("done"):
+                received.append(data["echo"])
+
+            ctx.mark_done()
+            return received
+
+    try:
+        a, b = await asyncio.gather(_synthesize("a"), _synthesize("b"))
+        assert a == ["a-0", "a-1", "a-2"]
+        assert b == ["b-0", "b-1", "b-2"]
+        assert state["connections"] == 1
+        assert mux.num_connections == 1
+
+        # released before being completed (e.g interrupted), the provider must stop generating it
+        async with mux.context("c") as ctx:
+            await ctx.send({"context_id": "c", "text": "hello"})
+            assert (await ctx.recv())["echo"] == "hello"
+
+        await asyncio.sleep(0.1)
+        assert state["cancelled"] == ["c"]
+        assert state["connections"] == 1
+    finally:
+        await mux.aclose()
+        await session.close()
+        await runner.cleanup()
+
+
+async def test_idle_connection_pinged() -> None:
+    runner, port, state = await _start_server()
+    session = aiohttp.ClientSession()
+
+    async def _connect(timeout: float) -> aiohttp.ClientWebSocketResponse:
+        return await asyncio.wait_for(session.ws_connect(f"http://127.0.0.1:{port}/ws"), timeout)
+
+    mux = WebSocketMultiplexer(
+        connect_cb=_connect,
+        context_id_fnc=lambda data: data.get("context_id"),
+        connect_timeout=0.5,
+        ping_idle_after=0.0,
+    )
+    try:
+        state["pong"] = False
+        async with mux.context("a") as ctx:
+            unresponsive = ctx._conn.ws
+
+        # the idle connection didn't answer the PING in time, it's replaced
+        state["pong"] = True
+        async with mux.context("b") as ctx:
+            assert ctx._conn.ws is not unresponsive
+            assert unresponsive.closed
+
+        # the PONG is received, the connection is reused and still routes the messages
+        async with mux.context("c") as ctx:
+            await ctx.send({"context_id": "c", "text": "hello"})
+            assert (await ctx.recv())["echo"] == "hello"
+
+        assert state["connections"] == 2
+        assert mux.num_connections == 1
+        assert (mux.stats.gets, mux.stats.hits) == (3, 1)
+        assert (mux.stats.connects, mux.stats.ping_failures) == (2, 1)
+    finally:
+        await mux.aclose()
+        await session.close()
+        await runner.cleanup()
+
+
+async def test_ping_websocket() -> None:
+    runner, port, state = await _start_server()
+    session = aiohttp.ClientSession()
+    try:
+        ws = await session.ws_connect(f"http://127.0.0.1:{port}/ws")
+        await ping_websocket(ws)
+
+        # autoping is restored once the PONG is received
+        await ws.send_json({"context_id": "a", "text": "hello"})
+        assert (await ws.receive_json())["echo"] == "hello"
+        await ws.close()
+
+        state["pong"] = False
+        ws = await session.ws_connect(f"http://127.0.0.1:{port}/ws")
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(ping_websocket(ws), 0.2)
+
+        await ws.close()
+        with pytest.raises(APIConnectionError):
+            await ping_websocket(ws)
+    finally:
+        await session.close()
+        await runner.cleanup()
+
+
+async def test_shared_released() -> None:
+    runner, port, state = await _start_server()
+    session = aiohttp.ClientSession()
+
+    async def _connect(timeout: float) -> aiohttp.ClientWebSocketResponse:
+        return await asyncio.wait_for(session.ws_connect(f"http://127.0.0.1:{port}/ws"), timeout)
+
+    def _factory() -> WebSocketMultiplexer:
+        return WebSocketMultiplexer(
+            connect_cb=_connect, context_id_fnc=lambda data: data.get("context_id")
+        )
+
+    class _Owner:
+        pass
+
+    a, b = _Owner(), _Owner()
+    loop = asyncio.get_running_loop()
+    try:
+        mux = WebSocketMultiplexer.shared("key", _factory, owner=a)
+        assert WebSocketMultiplexer.shared("key", _factory, owner=b) is mux
+        async with mux.context("a"):
+            pass
+
+        # still used by the other owner
+        await mux.release(a)
+        assert ws_multiplexer._shared[loop]["key"] is mux
+        assert mux.num_connections == 1
+
+        await mux.release(b)
+        assert loop not in ws_multiplexer._shared
+        assert mux.num_connections == 0
+
+        # the multiplexers left when the job ends are closed
+        mux = WebSocketMultiplexer.shared("key", _factory, owner=a)
+        async with mux.context("a"):
+            pass
+        await ws_multiplexer._close_shared()
+        assert loop not in ws_multiplexer._shared
+        assert mux.num_connections == 0
+    finally:
+        await session.close()
+        await runner.cleanup()